@@ -1,4 +1,7 @@
 from mesa import Agent
+from Utils.logger import get_logger
+
+logger = get_logger("agent.base")
 
 class BaseAgentLogic(Agent):
     def __init__(self, unique_id, model):
@@ -22,15 +25,15 @@ class BaseAgentLogic(Agent):
         Args:
             next_position (tuple): La posición (x, y) a la que se moverá el agente.
         
-        Prints:
-            Muestra la posición actual del agente tras el movimiento, o un mensaje de error si
+        Logs:
+            Registra la posición actual del agente tras el movimiento, o una advertencia si
             `next_position` es inválida.
         """
         if next_position:
             self.model.grid.move_agent(self, next_position)
-            print(f"Moviéndose a la posición: {self.pos}")
+            logger.debug("Moviéndose a la posición: %s", self.pos)
         else:
-            print("Error: la siguiente posición es inválida.")
+            logger.warning("La siguiente posición es inválida.")
 
     def is_adjacent(self, pos1, pos2):
         """
@@ -1,7 +1,13 @@
 from mesa import Agent
-from random import random
+from Utils.terrain import BOMB
+from Utils.blast import blast_rays
+from Utils.logger import get_logger
+
+logger = get_logger("agent.bomb")
 
 class BombAgent(Agent):
+    cell_kind = BOMB  # Código del agente en el layer de ocupación de la cuadrícula
+
     def __init__(self, unique_id, model, position, destruction_power):
         """
         Inicializa el agente de bomba con su posición, poder de destrucción y temporizador de explosión.
@@ -39,83 +45,69 @@ class BombAgent(Agent):
         from AgentArquitecture.rock import RockAgent
         from AgentArquitecture.powerup import PowerupAgent
         from AgentArquitecture.explosion import ExplosionAgent
-        from AgentArquitecture.metal import MetalAgent
         from AgentArquitecture.bomberman import BombermanAgent
         from AgentArquitecture.globe import GlobeAgent
         from AgentArquitecture.goal import GoalAgent
         from AgentArquitecture.road import RoadAgent
 
-        print(f"Explosión de bomba en: {self.position} con poder de destrucción: {self.destruction_power}")
-
-        # Direcciones de expansión de la explosión (arriba, abajo, izquierda, derecha)
-        directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-
-        # Explora cada dirección en el radio de explosión
-        for direction in directions:
-            for step in range(1, self.destruction_power + 1):
-                # Calcula la posición objetivo en esta dirección y paso
-                target_position = (self.position[0] + direction[0] * step, self.position[1] + direction[1] * step)
-                
-                if self.model.grid.out_of_bounds(target_position):
-                    break  # Termina la expansión si sale de los límites de la cuadrícula
+        logger.info(
+            "Explosión de bomba en: %s con poder de destrucción: %s", self.position, self.destruction_power,
+            extra={"event": "bomb_exploded", "position": self.position, "power": self.destruction_power},
+        )
 
+        # Las celdas alcanzadas por el terreno se calculan igual que en la simulación de la búsqueda;
+        # aquí solo falta detener cada rayo en Bomberman o en un globo
+        for ray in blast_rays(self.model.grid, self.position, self.destruction_power):
+            for target_position in ray:
                 # Obtiene agentes en la posición afectada
                 agents_in_cell = self.model.grid.get_cell_list_contents([target_position])
                 stop_explosion = False  # Controla la detención de la explosión en la dirección actual
 
                 for agent in agents_in_cell:
-                    # Si encuentra un MetalAgent, detiene la expansión en esta dirección
-                    if isinstance(agent, MetalAgent):
-                        stop_explosion = True
-                        break
-                    elif isinstance(agent, RockAgent):
+                    if isinstance(agent, RockAgent):
                         # Guarda el número de orden de visita de la roca para transferirlo al PowerupAgent o RoadAgent
                         visit_order = getattr(agent, 'visit_order', None)
 
                         # Verificar si esta roca oculta la meta
                         if getattr(agent, 'has_exit', False):  # Se asume que 'RockAgent' tiene esta propiedad
-                            # Elimina la roca y genera la meta
+                            # Elimina la roca y genera la meta (terreno: solo en la cuadrícula, fuera del scheduler)
                             self.model.grid.remove_agent(agent)
-                            self.model.schedule.remove(agent)
 
                             exit_agent = GoalAgent(self.model.next_id(), self.model)
                             self.model.grid.place_agent(exit_agent, target_position)
-                            self.model.schedule.add(exit_agent)
-                            print(f"Meta descubierta en la posición: {target_position}")
+                            logger.info("Meta descubierta en la posición: %s", target_position, extra={"event": "goal_revealed", "position": target_position})
                         else:
-                            # Elimina la roca de la cuadrícula y el modelo
+                            # Elimina la roca de la cuadrícula; el terreno no está en el scheduler
                             self.model.grid.remove_agent(agent)
-                            self.model.schedule.remove(agent)
 
-                            if random() < 0.3:  # 30% de probabilidad de generar un Powerup en lugar de un camino
+                            if self.random.random() < 0.3:  # 30% de probabilidad de generar un Powerup en lugar de un camino
                                 # Crea un PowerupAgent en la posición de la roca destruida con el número de orden de visita
                                 powerup = PowerupAgent(self.model.next_id(), self.model, original_visit_order=visit_order)
                                 self.model.grid.place_agent(powerup, target_position)
                                 self.model.schedule.add(powerup)
-                                print(f"Comodín generado en la posición: {target_position} con orden de visita {visit_order}")
+                                logger.debug("Comodín generado en la posición: %s con orden de visita %s", target_position, visit_order)
                             else:
                                 # Crea un camino (RoadAgent) en la posición de la roca destruida
                                 road = RoadAgent(self.model.next_id(), self.model)
                                 road.visit_order = visit_order  # Asigna el número de orden de visita
                                 self.model.grid.place_agent(road, target_position)
-                                self.model.schedule.add(road)
-                                print(f"Camino creado en la posición: {target_position} con número de orden {visit_order}")
+                                logger.debug("Camino creado en la posición: %s con número de orden %s", target_position, visit_order)
 
                         stop_explosion = True  # Detiene la explosión después de eliminar una roca
 
                     elif isinstance(agent, BombermanAgent):
                         # Si Bomberman es alcanzado, lo elimina y termina la simulación
-                        self.model.grid.remove_agent(agent)
-                        self.model.schedule.remove(agent)
-                        self.model.running = False
-                        print(f"Bomberman ha sido alcanzado por la explosión en {target_position} y ha muerto. Simulación finalizada.")
+                        self.model.on_bomberman_killed("explosion")
+                        logger.info(
+                            "Bomberman ha sido alcanzado por la explosión en %s y ha muerto. Simulación finalizada.", target_position,
+                            extra={"event": "bomberman_killed", "position": target_position, "cause": "explosion"},
+                        )
                         stop_explosion = True
 
                     elif isinstance(agent, GlobeAgent):
                         # Si un globo es alcanzado, lo elimina de la cuadrícula y el modelo
-                        self.model.grid.remove_agent(agent)
-                        self.model.schedule.remove(agent)
-                        print(f"GlobeAgent destruido por la explosión en la posición {target_position}.")
+                        self.model.on_globe_killed(agent)
+                        logger.info("GlobeAgent destruido por la explosión en la posición %s.", target_position, extra={"event": "globe_destroyed", "position": target_position})
                         stop_explosion = True
 
                 if stop_explosion:
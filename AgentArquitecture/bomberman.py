@@ -1,9 +1,15 @@
 from mesa import Agent
+from Utils.terrain import BOMBERMAN, ROCK, METAL, BOMB
 from Utils.state import GameState
-from SearchesArquitecture.InformedSearches.alphabeta import AlphaBetaSearch
+from SearchesArquitecture.InformedSearches.dstarlite import DStarLite, REPLAN_BLOCKING
+from Utils.logger import get_logger
+
+logger = get_logger("agent.bomberman")
 
 
 class BombermanAgent(Agent):
+    cell_kind = BOMBERMAN  # Código del agente en el layer de ocupación de la cuadrícula
+
     def __init__(self, unique_id, model, search_strategy):
         """
         Inicializa al agente Bomberman con parámetros iniciales de estado y atributos específicos,
@@ -25,9 +31,10 @@ class BombermanAgent(Agent):
         self.bomb_position = None
         self.steps_to_explosion = 0
         self.original_path = []  # Almacena una copia del camino óptimo
+        self.path_index = -1  # Índice de la posición actual en `original_path` (-1 antes de su primera celda)
         self.retreat_steps = 0  # Controla los pasos de retroceso en el camino óptimo
         self.direction = (0, 0)  # Dirección inicial de movimiento
-        self.alpha_beta = AlphaBetaSearch(max_depth=3)  # Configurar profundidad de búsqueda
+        self.replanner = None  # Planificador incremental, creado en la primera replanificación
 
         if model is not None:
             model.register_agent(self)  # Solo registra si hay modelo
@@ -68,7 +75,10 @@ class BombermanAgent(Agent):
         self.bomb_position = self.pos
         self.steps_to_explosion = self.destruction_power + 2
         self.retreat_steps = self.destruction_power + 1
-        print(f"Bomba colocada en la posición: {self.bomb_position} con poder de destrucción: {self.destruction_power}")
+        logger.info(
+            "Bomba colocada en la posición: %s con poder de destrucción: %s", self.bomb_position, self.destruction_power,
+            extra={"event": "bomb_placed", "position": self.bomb_position, "power": self.destruction_power},
+        )
 
     def collect_powerup(self):
         """
@@ -83,7 +93,10 @@ class BombermanAgent(Agent):
             if isinstance(agent, PowerupAgent):
                 # Incrementa el poder de destrucción de Bomberman
                 self.destruction_power += 1
-                print(f"Comodín recogido en la posición: {self.pos}. Poder de destrucción aumentado a {self.destruction_power}.")
+                logger.info(
+                    "Comodín recogido en la posición: %s. Poder de destrucción aumentado a %s.", self.pos, self.destruction_power,
+                    extra={"event": "powerup_collected", "position": self.pos, "power": self.destruction_power},
+                )
 
                 # Captura el número de orden de visita antes de eliminar el PowerupAgent
                 visit_order = agent.original_visit_order
@@ -91,17 +104,16 @@ class BombermanAgent(Agent):
                 # Elimina el PowerupAgent de la grilla y el modelo
                 self.model.grid.remove_agent(agent)
                 self.model.schedule.remove(agent)
-                print(f"[Debug] PowerupAgent eliminado de la posición {self.pos}")
+                logger.debug("PowerupAgent eliminado de la posición %s", self.pos)
 
                 # Crea un RoadAgent con el número de orden de visita original
                 road = RoadAgent(self.model.next_id(), self.model)
                 road.visit_order = visit_order  # Asigna el número de orden original
-                print(f"[Debug] Creando RoadAgent en la posición {self.pos} con número de orden {road.visit_order}")
+                logger.debug("Creando RoadAgent en la posición %s con número de orden %s", self.pos, road.visit_order)
 
-                # Coloca el RoadAgent en la posición y en el scheduler
+                # Coloca el RoadAgent en la posición; el terreno no se agrega al scheduler
                 self.model.grid.place_agent(road, self.pos)
-                self.model.schedule.add(road)
-                print(f"[Debug] RoadAgent con número de orden {road.visit_order} colocado en la posición {self.pos} exitosamente")
+                logger.debug("RoadAgent con número de orden %s colocado en la posición %s exitosamente", road.visit_order, self.pos)
 
     def move_to_position(self, next_position):
         """
@@ -114,7 +126,7 @@ class BombermanAgent(Agent):
         from AgentArquitecture.road import RoadAgent
 
         if self.pos is None or next_position is None:
-            print("Movimiento abortado: Bomberman ha sido eliminado o la siguiente posición no es válida.")
+            logger.warning("Movimiento abortado: Bomberman ha sido eliminado o la siguiente posición no es válida.")
             return
 
         # Marca la posición actual como visitada si contiene un RoadAgent en el camino óptimo
@@ -126,7 +138,7 @@ class BombermanAgent(Agent):
         # Mueve a Bomberman a la siguiente posición y recolecta cualquier comodín
         self.model.grid.move_agent(self, next_position)
         self.is_moving = True
-        print(f"Moviéndose a la posición: {self.pos}")
+        logger.debug("Moviéndose a la posición: %s", self.pos)
         self.collect_powerup()
 
     def retreat_on_optimal_path(self):
@@ -135,16 +147,15 @@ class BombermanAgent(Agent):
         colocó una bomba y está esperando su detonación.
         """
         if self.retreat_steps > 0 and self.original_path:
-            current_index = self.original_path.index(self.pos)
-            retreat_index = max(current_index - self.retreat_steps, 0)
-            retreat_path = self.original_path[retreat_index:current_index][::-1]
-            
-            if retreat_path:
-                next_position = retreat_path.pop(0)
+            # El camino puede pasar dos veces por la misma celda tras una replanificación, por lo que
+            # la posición en el camino se sigue con `path_index` en lugar de buscar la celda
+            if self.path_index > 0:
+                next_position = self.original_path[self.path_index - 1]
                 if self.is_adjacent(self.pos, next_position):
                     self.move_to_position(next_position)
+                    self.path_index -= 1
                 else:
-                    print(f"Error: Movimiento diagonal detectado en el retroceso, entre {self.pos} y {next_position}.")
+                    logger.warning("Movimiento diagonal detectado en el retroceso, entre %s y %s.", self.pos, next_position)
             self.retreat_steps -= 1
 
     def resume_optimal_path(self):
@@ -152,9 +163,8 @@ class BombermanAgent(Agent):
         Reanuda el camino óptimo después de que Bomberman ha retrocedido 
         debido a una explosión, asegurando que siga su trayectoria planificada.
         """
-        if self.pos in self.original_path:
-            current_index = self.original_path.index(self.pos)
-            self.path_to_exit = self.original_path[current_index + 1:]
+        if self.original_path:
+            self.path_to_exit = self.original_path[self.path_index + 1:]
 
     def is_adjacent(self, pos1, pos2):
         """
@@ -169,14 +179,44 @@ class BombermanAgent(Agent):
         """
         return abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1]) == 1
 
+    def replan(self):
+        """
+        Recalcula el camino hacia la salida desde la posición actual con `DStarLite`, que reutiliza
+        el árbol de la planificación anterior y solo corrige las celdas que cambiaron. El nuevo
+        tramo reemplaza al resto del camino óptimo a partir de la posición actual.
+
+        Returns:
+            bool: True si se encontró un camino, False si la salida no es alcanzable por ahora;
+            en ese caso el camino actual no se modifica.
+        """
+        if self.replanner is None or self.replanner.grid is not self.model.grid:
+            self.replanner = DStarLite(self.model.grid, self.pos, self.model.goal_position)
+        path = self.replanner.plan(self.pos)
+        if not path:
+            logger.debug("Sin camino alternativo hacia la salida desde %s; se mantiene el camino actual.", self.pos)
+            return False
+
+        # El tramo recorrido se conserva para que el retroceso siga disponiendo de él. El desvío se
+        # empalma en `path_index` y no en la primera aparición de la posición, que puede repetirse
+        if self.path_index < 0:
+            self.original_path = [self.pos] + path
+            self.path_index = 0
+        else:
+            self.original_path = self.original_path[:self.path_index + 1] + path
+        self.path_to_exit = path[:]
+        logger.info(
+            "Camino replanificado desde %s: %s pasos", self.pos, len(path),
+            extra={"event": "path_replanned", "position": self.pos, "path_length": len(path)},
+        )
+        return True
+
     def move_to_exit_or_safety(self):
         """
         Mueve a Bomberman hacia la salida o a un lugar seguro dependiendo de las condiciones
         en el camino, colocando una bomba si se encuentra un obstáculo y retrocediendo si
-        está en espera de explosión.
+        está en espera de explosión. Si la siguiente celda del camino está bloqueada (metal,
+        una bomba o un globo), primero intenta replanificar un desvío.
         """
-        from AgentArquitecture.rock import RockAgent
-        from AgentArquitecture.metal import MetalAgent
         from AgentArquitecture.bomb import BombAgent
 
         if self.waiting_for_explosion:
@@ -189,17 +229,21 @@ class BombermanAgent(Agent):
                 if not any(isinstance(agent, BombAgent) for agent in agents_in_bomb_cell):
                     self.waiting_for_explosion = False
                     self.bomb_position = None
-                    print("Explosión completada, retomando el camino óptimo.")
+                    logger.debug("Explosión completada, retomando el camino óptimo.")
                     self.resume_optimal_path()
             return
 
         if self.path_to_exit:
+            if self.model.grid.has_kind(self.path_to_exit[0], REPLAN_BLOCKING):
+                self.replan()
             next_position = self.path_to_exit.pop(0)
-            agents_in_cell = self.model.grid.get_cell_list_contents([next_position])
+            cell_kind = self.model.grid.cell_kind(next_position)
 
-            if all(not isinstance(agent, (RockAgent, MetalAgent, BombAgent)) for agent in agents_in_cell):
+            if not cell_kind & (ROCK | METAL | BOMB):
                 self.move_to_position(next_position)
-            elif any(isinstance(agent, RockAgent) for agent in agents_in_cell):
+                # `path_to_exit` es siempre el final de `original_path`
+                self.path_index = len(self.original_path) - len(self.path_to_exit) - 1
+            elif cell_kind & ROCK:
                 self.place_bomb()
 
     def step(self):
@@ -214,12 +258,17 @@ class BombermanAgent(Agent):
         if not self.is_search_initialized:
             start_position = (self.pos[0], self.pos[1])
 
-            if isinstance(self.search_strategy, AlphaBetaSearch):
-                # Ejecuta la búsqueda para alfa-beta
+            if self.model.strategy_spec.adversarial:
+                # Libera la espera de explosión cuando la bomba real ya detonó
+                if self.waiting_for_explosion and not self.model.grid.has_kind(self.bomb_position, BOMB):
+                    self.waiting_for_explosion = False
+                    self.bomb_position = None
+
+                # Ejecuta la búsqueda para alfa-beta sobre un estado simulado, sin efectos en el modelo
                 game_state = GameState(self.model, is_bomberman_turn=True)
                 best_action = self.search_strategy.run(
                     game_state=game_state,
-                    depth=3,
+                    depth=self.search_strategy.max_depth,
                     is_bomberman_turn=True
                 )
 
@@ -239,17 +288,21 @@ class BombermanAgent(Agent):
         self.direction = self.calculate_direction()
 
         # Explorar el laberinto según la estrategia (para BFS, DFS, A*, etc.)
-        if not isinstance(self.search_strategy, AlphaBetaSearch):  # Evita llamar a explore_step en alfa-beta
+        if not self.model.strategy_spec.adversarial:  # Evita llamar a explore_step en alfa-beta
             if not self.has_explored:
                 self.search_strategy.explore_step(self)
                 if self.has_explored:
-                    print("Camino óptimo calculado:", self.path_to_exit)
+                    logger.info(
+                        "Camino óptimo calculado: %s", self.path_to_exit,
+                        extra={"event": "path_found", "path_length": len(self.path_to_exit)},
+                    )
                     self.original_path = self.path_to_exit[:]
+                    self.path_index = -1
                 return
 
         # Moverse hacia la salida o ejecutar una estrategia defensiva
         self.move_to_exit_or_safety()
-        print(f"Posición actual de Bomberman en este paso: {self.pos}")
+        logger.debug("Posición actual de Bomberman en este paso: %s", self.pos)
 
 
 
@@ -1,6 +1,9 @@
 from mesa import Agent
+from Utils.terrain import EXPLOSION
 
 class ExplosionAgent(Agent):
+    cell_kind = EXPLOSION  # Código del agente en el layer de ocupación de la cuadrícula
+
     def __init__(self, unique_id, model, position, duration=1):
         super().__init__(unique_id, model)
         self.position = position
@@ -1,9 +1,14 @@
 
 from AgentArquitecture.road import RoadAgent
 from mesa import Agent
-import random
+from Utils.terrain import GLOBE
+from Utils.logger import get_logger
+
+logger = get_logger("agent.globe")
 
 class GlobeAgent(Agent):
+    cell_kind = GLOBE  # Código del agente en el layer de ocupación de la cuadrícula
+
     def __init__(self, unique_id, model):
         """
         Inicializa el agente GlobeAgent, que representa un globo enemigo en el juego.
@@ -20,10 +25,9 @@ class GlobeAgent(Agent):
 
     def step(self):
         """
-        Ejecuta un paso en simulación para el globo, usando diferentes estrategias según el nivel.
+        Ejecuta un paso en simulación para el globo: en Alpha-Beta ejecuta su parte del plan conjunto
+        de los globos y en las demás estrategias se mueve aleatoriamente.
         """
-        from Utils.state import GameState
-        from SearchesArquitecture.InformedSearches.alphabeta import AlphaBetaSearch
         if self.pos is None:
             return
 
@@ -31,21 +35,15 @@ class GlobeAgent(Agent):
         if bomberman is None or bomberman.pos is None:
             return
 
-        if isinstance(self.model.search_strategy, AlphaBetaSearch):
-            level = self.model.level  # Nivel de dificultad del globo
-            depth = 1 if level == 0 else (3 if level == 1 else 6)  # Fácil, Medio, Difícil
-
-            game_state = GameState(self.model, is_bomberman_turn=False)
-            best_action = self.model.search_strategy.run(
-                game_state=game_state,
-                depth=depth,
-                is_bomberman_turn=False
-            )
+        if self.model.strategy_spec.adversarial:
+            # El movimiento lo decide el planificador conjunto de los globos en `MazeModel.plan_globe_moves`
+            best_action = self.model.globe_plan.get(self.unique_id)
 
             if isinstance(best_action, tuple):
-                self.model.grid.move_agent(self, best_action)
+                if best_action != self.pos:
+                    self.model.grid.move_agent(self, best_action)
             else:
-                print(f"Globo en {self.pos} no pudo encontrar un movimiento.")
+                logger.debug("Globo en %s no pudo encontrar un movimiento.", self.pos)
         else:
             self.random_move()  # Nivel fácil usa movimiento aleatorio
 
@@ -71,7 +69,7 @@ class GlobeAgent(Agent):
         if bomberman.is_moving:
             # Define las direcciones posibles y las mezcla para elegir una aleatoria
             possible_directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
-            random.shuffle(possible_directions)
+            self.random.shuffle(possible_directions)  # Usa el generador del modelo para ser reproducible
 
             moved = False  # Controla si el globo logra moverse
             for direction in possible_directions:
@@ -98,7 +96,7 @@ class GlobeAgent(Agent):
                     break
 
             if not moved:
-                print("No se pudo mover el globo a ninguna nueva posición")
+                logger.debug("No se pudo mover el globo a ninguna nueva posición")
 
 
     def handle_collision(self, bomberman):
@@ -109,23 +107,21 @@ class GlobeAgent(Agent):
             bomberman: La instancia de BombermanAgent con la que el globo ha colisionado.
         """
         collision_position = bomberman.pos
-        self.model.grid.remove_agent(bomberman)  # Elimina Bomberman de la grilla
-        self.model.schedule.remove(bomberman)  # Elimina Bomberman del scheduler
-        self.model.running = False  # Detiene la simulación
-        print(f"Colisión detectada entre GlobeAgent y BombermanAgent en la posición {collision_position}. Bomberman eliminado y simulación finalizada.")
+        self.model.on_bomberman_killed("globe")  # Elimina a Bomberman y detiene la simulación
+        logger.info(
+            "Colisión detectada entre GlobeAgent y BombermanAgent en la posición %s. Bomberman eliminado y simulación finalizada.",
+            collision_position, extra={"event": "bomberman_killed", "position": collision_position, "cause": "globe"},
+        )
 
     def get_bomberman_agent(self):
         """
-        Busca y retorna la instancia de BombermanAgent en la simulación.
+        Retorna la instancia de BombermanAgent de la simulación.
 
         Returns:
-            bomberman: El agente Bomberman si está en el scheduler; de lo contrario, None.
+            bomberman: El agente Bomberman del modelo, o None si el mapa no lo tiene. Si Bomberman
+                fue eliminado, su posición es None.
         """
-        from AgentArquitecture.bomberman import BombermanAgent
-        for agent in self.model.schedule.agents:
-            if isinstance(agent, BombermanAgent):
-                return agent
-        return None
+        return self.model.bomberman
 
     def check_collision(self, bomberman_position):
         """
@@ -1,6 +1,12 @@
 from mesa import Agent
+from Utils.terrain import GOAL
+from Utils.logger import get_logger
+
+logger = get_logger("agent.goal")
 
 class GoalAgent(Agent):
+    cell_kind = GOAL  # Código del agente en el layer de ocupación de la cuadrícula
+
     def __init__(self, unique_id, model):
         super().__init__(unique_id, model)
         self.visit_order = None  # Indica el orden de visita si es relevante para la lógica del juego
@@ -12,5 +18,5 @@ class GoalAgent(Agent):
         como marcar si la meta fue alcanzada.
         """
         if self.is_visited:
-            print(f"Meta alcanzada en la posición {self.pos} por Bomberman.")
+            logger.info("Meta alcanzada en la posición %s por Bomberman.", self.pos, extra={"event": "goal_reached", "position": self.pos})
             self.model.running = False  # Detener el modelo si la meta es alcanzada
@@ -1,5 +1,8 @@
 from mesa import Agent
+from Utils.terrain import METAL
 
 class MetalAgent(Agent):
+    cell_kind = METAL  # Código del agente en el layer de ocupación de la cuadrícula
+
     def __init__(self, unique_id, model):
         super().__init__(unique_id, model)
\ No newline at end of file
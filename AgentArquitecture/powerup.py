@@ -1,17 +1,23 @@
 from mesa import Agent
+from Utils.terrain import POWERUP
 from AgentArquitecture.bomberman import BombermanAgent
 from AgentArquitecture.road import RoadAgent
+from Utils.logger import get_logger
+
+logger = get_logger("agent.powerup")
 
 class PowerupAgent(Agent):
+    cell_kind = POWERUP  # Código del agente en el layer de ocupación de la cuadrícula
+
     def __init__(self, unique_id, model, original_visit_order=None):
         super().__init__(unique_id, model)
         self.original_visit_order = original_visit_order
-        print(f"[Debug] PowerupAgent creado en la posición {self.pos} con orden de visita original {self.original_visit_order}")
+        logger.debug("PowerupAgent creado en la posición %s con orden de visita original %s", self.pos, self.original_visit_order)
 
     def step(self):
         # Verifica si el PowerupAgent sigue en la grilla antes de interactuar
         if self.pos is None:
-            print("[Debug] PowerupAgent ya no está en la grilla.")
+            logger.debug("PowerupAgent ya no está en la grilla.")
             return
 
         # Almacena la posición y el número de orden de visita antes de intentar cualquier operación de eliminación
@@ -25,22 +31,24 @@ class PowerupAgent(Agent):
                 # Incrementa el poder de destrucción de Bomberman
                 agent.destruction_power += 1
                 
-                print(f"Comodín78 recogido en la posición: {powerup_position}. Poder de destrucción aumentado a {agent.destruction_power}.")
+                logger.info(
+                    "Comodín recogido en la posición: %s. Poder de destrucción aumentado a %s.", powerup_position, agent.destruction_power,
+                    extra={"event": "powerup_collected", "position": powerup_position, "power": agent.destruction_power},
+                )
 
                 # Elimina el PowerupAgent del modelo y de la grilla
                 self.model.grid.remove_agent(self)
                 self.model.schedule.remove(self)
                 
-                print(f"[Debug] PowerupAgent eliminado de la posición {powerup_position}")
+                logger.debug("PowerupAgent eliminado de la posición %s", powerup_position)
 
                 # Crea el RoadAgent en la posición del Powerup con el número de orden original
                 road = RoadAgent(self.model.next_id(), self.model)
                 road.visit_order = visit_order if visit_order is not None else ""  # Asigna el número de orden si existe
-                print(f"[Debug] Creando RoadAgent en la posición {powerup_position} con número de orden {road.visit_order}")
+                logger.debug("Creando RoadAgent en la posición %s con número de orden %s", powerup_position, road.visit_order)
 
-                # Coloca el RoadAgent en la posición y en el scheduler
+                # Coloca el RoadAgent en la posición; el terreno no se agrega al scheduler
                 self.model.grid.place_agent(road, powerup_position)
-                self.model.schedule.add(road)
-                print(f"[Debug] RoadAgent con número de orden {road.visit_order} colocado en la posición {powerup_position} exitosamente")
+                logger.debug("RoadAgent con número de orden %s colocado en la posición %s exitosamente", road.visit_order, powerup_position)
 
                 break  # Termina después de procesar el Powerup
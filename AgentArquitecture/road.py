@@ -1,6 +1,9 @@
 from mesa import Agent
+from Utils.terrain import ROAD
 
 class RoadAgent(Agent):
+    cell_kind = ROAD  # Código del agente en el layer de ocupación de la cuadrícula
+
     def __init__(self, unique_id, model):
         super().__init__(unique_id, model)
         self.visit_order = None
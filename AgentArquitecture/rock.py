@@ -1,6 +1,9 @@
 from mesa import Agent
+from Utils.terrain import ROCK
 
 class RockAgent(Agent):
+    cell_kind = ROCK  # Código del agente en el layer de ocupación de la cuadrícula
+
     def __init__(self, unique_id, model, has_exit=False):
         """
         Inicializa la roca con un indicador opcional de que contiene la salida.
@@ -0,0 +1,276 @@
+import argparse
+import contextlib
+import csv
+import itertools
+import os
+import time
+
+from Utils.compiledMap import load_compiled_map, load_map_cached
+from Utils.logger import silenced
+from SearchesArquitecture.registry import get_strategy, strategy_names
+
+# Directorio con los mapas incluidos en el proyecto
+MAPS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Data", "Maps")
+
+STRATEGIES = strategy_names()  # Estrategias del registro, en el orden de la interfaz
+
+# Columnas de cada fila de resultados, en el orden en que se escriben
+RESULT_FIELDS = [
+    "map", "strategy", "heuristic", "beam_width", "level", "seed", "max_steps",
+    "outcome", "killed_by", "all_globes_dead", "steps", "expanded_nodes", "path_length", "wall_time",
+]
+
+
+def load_map_data(path):
+    """
+    Carga un mapa para la simulación sin analizar el texto en ejecuciones repetidas: los mapas
+    `.bmap` se leen directamente y los de texto pasan por la caché de mapas compilados.
+
+    Args:
+        path (str): Ruta de un mapa de texto o compilado.
+
+    Returns:
+        np.ndarray: Arreglo de códigos de celda de `Utils.compiledMap`.
+    """
+    if path.endswith(".bmap"):
+        return load_compiled_map(path)
+    return load_map_cached(path)
+
+
+def resolve_map_path(map_name):
+    """
+    Resuelve el nombre de un mapa a su ruta: acepta rutas existentes o nombres de `Data/Maps`
+    con o sin la extensión `.txt`.
+
+    Args:
+        map_name (str): Nombre o ruta del mapa.
+
+    Returns:
+        str: Ruta del archivo del mapa.
+
+    Raises:
+        FileNotFoundError: Si el mapa no existe.
+    """
+    if os.path.isfile(map_name):
+        return map_name
+    file_name = map_name if map_name.endswith(".txt") else f"{map_name}.txt"
+    path = os.path.join(MAPS_DIR, file_name)
+    if not os.path.isfile(path):
+        raise FileNotFoundError(f"No se encontró el mapa: {map_name}")
+    return path
+
+
+def available_maps():
+    """Devuelve los nombres de los mapas incluidos en `Data/Maps`, ordenados."""
+    return sorted(name[:-4] for name in os.listdir(MAPS_DIR) if name.endswith(".txt"))
+
+
+def loop_erased(path):
+    """
+    Elimina los bucles de un camino: cuando una celda se repite, se descarta el tramo entre sus
+    dos apariciones. Tras una replanificación, `BombermanAgent.original_path` conserva el tramo
+    recorrido seguido del desvío, que puede volver sobre celdas ya recorridas.
+
+    Args:
+        path (list): Camino, posiblemente con celdas repetidas.
+
+    Returns:
+        list: Camino simple con los mismos extremos.
+    """
+    erased, positions = [], {}
+    for pos in path:
+        if pos in positions:
+            cut = positions[pos] + 1
+            for removed in erased[cut:]:
+                del positions[removed]
+            del erased[cut:]
+        else:
+            positions[pos] = len(erased)
+            erased.append(pos)
+    return erased
+
+
+def build_runs(maps, strategies, heuristics=("Manhattan",), beam_widths=(2,), levels=(0,), seeds=(0,), max_steps=1000):
+    """
+    Genera la lista de ejecuciones como producto de los parámetros. Los parámetros que una
+    estrategia no usa (heurística, ancho de haz, nivel de los globos) se fijan a None para
+    no repetir ejecuciones equivalentes.
+
+    Args:
+        maps (list): Nombres o rutas de mapas.
+        strategies (list): Nombres de estrategias de `STRATEGIES`.
+        heuristics (list): Heurísticas de distancia; cada estrategia informada usa solo las que admite.
+        beam_widths (list): Anchos de haz para Beam Search.
+        levels (list): Niveles de dificultad de los globos para Alpha-Beta.
+        seeds (list): Semillas del generador aleatorio del modelo.
+        max_steps (int): Límite de pasos de simulación por ejecución.
+
+    Returns:
+        list of dict: Parámetros de cada ejecución.
+    """
+    runs = []
+    seen = set()
+    for map_name, strategy, heuristic, beam_width, level, seed in itertools.product(
+        maps, strategies, heuristics, beam_widths, levels, seeds
+    ):
+        spec = get_strategy(strategy)
+        if spec.supports_heuristic and heuristic not in spec.heuristics:
+            continue  # Heurística que esta estrategia no admite (por ejemplo, 'Landmark' fuera de A*)
+        run = {
+            "map": map_name,
+            "strategy": strategy,
+            "heuristic": heuristic if spec.supports_heuristic else None,
+            "beam_width": beam_width if spec.supports_beam_width else None,
+            "level": level if spec.adversarial else None,
+            "seed": seed,
+            "max_steps": max_steps,
+        }
+        key = tuple(run.values())
+        if key not in seen:
+            seen.add(key)
+            runs.append(run)
+    return runs
+
+
+def run_simulation(map, strategy, heuristic=None, beam_width=None, level=None, seed=None, max_steps=1000, quiet=True,
+                   cost_model=None):
+    """
+    Ejecuta un `MazeModel` sin interfaz gráfica hasta que termina o alcanza el límite de pasos.
+
+    Args:
+        map (str): Nombre o ruta del mapa.
+        strategy (str): Estrategia de búsqueda de Bomberman.
+        heuristic (str, optional): Heurística de distancia.
+        beam_width (int, optional): Ancho de haz de Beam Search.
+        level (int, optional): Nivel de dificultad de los globos.
+        seed (int, optional): Semilla del generador aleatorio del modelo.
+        max_steps (int): Límite de pasos de simulación.
+        quiet (bool): Desactiva los eventos de la simulación (`Utils.logger`) durante la ejecución.
+        cost_model (str, optional): Modelo de costo de UCS y A* (`SearchesArquitecture.costModel`).
+
+    Returns:
+        dict: Parámetros de la ejecución y sus métricas (`RESULT_FIELDS`).
+    """
+    from ModelArquitecture.model import MazeModel
+
+    map_data = load_map_data(resolve_map_path(map))
+    start = time.perf_counter()
+    error = None
+    with silenced() if quiet else contextlib.nullcontext():
+        model = MazeModel(
+            len(map_data[0]), len(map_data), map_data, strategy,
+            distance_metric=heuristic or "Manhattan", beta=beam_width or 2, level=level or 0, seed=seed,
+            cost_model=cost_model,
+        )
+        bomberman = model.bomberman
+        start_position = bomberman.pos
+        steps = 0
+        try:
+            while model.running and steps < max_steps:
+                model.step()
+                steps += 1
+        except Exception as e:
+            # Un fallo de la simulación se registra como resultado en lugar de detener el lote
+            error = e
+    wall_time = time.perf_counter() - start
+
+    # El modelo registra el resultado al terminar la partida (meta alcanzada o Bomberman eliminado)
+    if error is not None:
+        outcome = f"error:{type(error).__name__}"
+    elif model.outcome is not None:
+        outcome = model.outcome
+    elif model.running:
+        outcome = "step_cap"
+    else:
+        outcome = "stopped"
+
+    path = loop_erased(bomberman.original_path or bomberman.path_to_exit)
+    # Los caminos de las búsquedas empiezan en la celda inicial: se cuentan los movimientos
+    if path and path[0] == start_position:
+        path = path[1:]
+    return {
+        "map": map,
+        "strategy": strategy,
+        "heuristic": heuristic,
+        "beam_width": beam_width,
+        "level": level,
+        "seed": seed,
+        "max_steps": max_steps,
+        "outcome": outcome,
+        "killed_by": model.killed_by,
+        "all_globes_dead": model.all_globes_dead,
+        "steps": steps,
+        "expanded_nodes": getattr(model.search_strategy, "step_count", None),
+        "path_length": len(path) if path else None,  # Movimientos del camino planificado
+        "wall_time": round(wall_time, 6),
+    }
+
+
+def write_results(rows, output):
+    """
+    Escribe las filas de resultados en CSV o, si la extensión es `.parquet`, en Parquet.
+
+    Args:
+        rows (list of dict): Resultados de las ejecuciones.
+        output (str): Ruta del archivo de salida.
+
+    Raises:
+        ImportError: Si se pide Parquet y no está disponible `pandas` con un motor de Parquet.
+    """
+    if output.endswith(".parquet"):
+        import pandas as pd
+        pd.DataFrame(rows, columns=RESULT_FIELDS).to_parquet(output, index=False)
+        return
+    with open(output, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=RESULT_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def run_batch(runs, output=None):
+    """
+    Ejecuta secuencialmente una lista de ejecuciones y, opcionalmente, guarda los resultados.
+
+    Args:
+        runs (list of dict): Parámetros de cada ejecución, como los que genera `build_runs`.
+        output (str, optional): Ruta del archivo CSV o Parquet de resultados.
+
+    Returns:
+        list of dict: Resultados de todas las ejecuciones.
+    """
+    rows = [run_simulation(**run) for run in runs]
+    if output:
+        write_results(rows, output)
+    return rows
+
+
+def parse_args(argv=None):
+    """Define y analiza los argumentos de la línea de comandos del ejecutor por lotes."""
+    parser = argparse.ArgumentParser(description="Ejecuta simulaciones de Bomberman sin interfaz gráfica.")
+    parser.add_argument("--maps", nargs="+", default=None, help="Mapas de Data/Maps o rutas (por defecto, todos).")
+    parser.add_argument("--strategies", nargs="+", default=STRATEGIES, help="Estrategias de búsqueda.")
+    parser.add_argument("--heuristics", nargs="+", default=["Manhattan"], help="Heurísticas de distancia.")
+    parser.add_argument("--beam-widths", nargs="+", type=int, default=[2], help="Anchos de haz de Beam Search.")
+    parser.add_argument("--levels", nargs="+", type=int, default=[0], help="Niveles de los globos (Alpha-Beta).")
+    parser.add_argument("--seeds", nargs="+", type=int, default=[0], help="Semillas del modelo.")
+    parser.add_argument("--max-steps", type=int, default=1000, help="Límite de pasos por ejecución.")
+    parser.add_argument("--output", default="results.csv", help="Archivo de resultados (.csv o .parquet).")
+    parser.add_argument("--workers", type=int, default=None, help="Procesos en paralelo (por defecto, todos los núcleos).")
+    parser.add_argument("--no-resume", action="store_true", help="Sobrescribe los resultados parciales en lugar de reanudar.")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    from BatchArquitecture.sweep import run_sweep
+
+    args = parse_args(argv)
+    runs = build_runs(
+        args.maps or available_maps(), args.strategies, args.heuristics,
+        args.beam_widths, args.levels, args.seeds, args.max_steps,
+    )
+
+    def show(row, finished, total):
+        print(f"[{finished}/{total}] {row['map']} {row['strategy']} seed={row['seed']}: {row['outcome']}")
+
+    done = run_sweep(runs, args.output, workers=args.workers, resume=not args.no_resume, progress=show)
+    print(f"{done} ejecuciones nuevas guardadas en {args.output} ({len(runs)} en total)")
@@ -0,0 +1,132 @@
+import csv
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from BatchArquitecture.runner import RESULT_FIELDS, run_simulation
+
+# Columnas que identifican una ejecución; dos filas con los mismos valores son la misma ejecución
+RUN_FIELDS = RESULT_FIELDS[:RESULT_FIELDS.index("outcome")]
+
+
+def run_key(run):
+    """
+    Clave de una ejecución a partir de sus parámetros, comparable con las filas leídas de un CSV
+    (donde todos los valores son texto y None se escribe como cadena vacía).
+
+    Args:
+        run (dict): Parámetros de la ejecución o fila de resultados.
+
+    Returns:
+        tuple: Valores de `RUN_FIELDS` como texto.
+    """
+    return tuple("" if run.get(field) is None else str(run[field]) for field in RUN_FIELDS)
+
+
+def load_completed(path):
+    """
+    Lee un CSV de resultados parcial y lo reescribe sin filas incompletas, como la última línea
+    truncada que deja una interrupción a mitad de escritura.
+
+    Args:
+        path (str): Ruta del CSV de resultados.
+
+    Returns:
+        set: Claves (`run_key`) de las ejecuciones ya registradas.
+    """
+    if not os.path.isfile(path):
+        return set()
+    with open(path, newline="") as f:
+        reader = csv.DictReader(f)
+        if reader.fieldnames != RESULT_FIELDS:
+            raise ValueError(f"El archivo {path} no tiene las columnas de resultados esperadas")
+        rows = [row for row in reader if all(row.get(field) is not None for field in RESULT_FIELDS) and row["wall_time"]]
+
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=RESULT_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+    return {run_key(row) for row in rows}
+
+
+def _run_one(run):
+    """Ejecuta una simulación en un proceso del pool; debe ser una función de módulo para poder serializarse."""
+    return run_simulation(**run)
+
+
+def iter_sweep(runs, workers=None):
+    """
+    Ejecuta las simulaciones repartidas en un pool de procesos y entrega cada resultado en
+    cuanto termina, en orden de finalización.
+
+    Cada ejecución lleva su propia semilla en los parámetros, por lo que el resultado no depende
+    del proceso que la ejecute ni del orden en que se completen.
+
+    Args:
+        runs (list of dict): Parámetros de cada ejecución, como los que genera `build_runs`.
+        workers (int, optional): Número de procesos; por defecto, el número de núcleos. Con 1 las
+            simulaciones se ejecutan en el proceso actual.
+
+    Yields:
+        dict: Resultado de cada ejecución (`RESULT_FIELDS`).
+    """
+    if workers == 1:
+        for run in runs:
+            yield run_simulation(**run)
+        return
+
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures = [executor.submit(_run_one, run) for run in runs]
+        for future in as_completed(futures):
+            yield future.result()
+    finally:
+        # Si se interrumpe el barrido, se descartan las ejecuciones pendientes
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def run_sweep(runs, output, workers=None, resume=True, progress=None):
+    """
+    Ejecuta un barrido de parámetros en paralelo guardando cada resultado en cuanto llega.
+
+    Los resultados se añaden a un CSV fila a fila, de modo que un barrido interrumpido conserva
+    las ejecuciones terminadas. Al reanudar con el mismo archivo, solo se ejecutan las que faltan.
+    Si la salida es `.parquet`, el CSV parcial se guarda junto a ella (`<salida>.partial.csv`) y
+    se convierte al terminar el barrido.
+
+    Args:
+        runs (list of dict): Parámetros de cada ejecución, como los que genera `build_runs`.
+        output (str): Ruta del archivo de resultados (.csv o .parquet).
+        workers (int, optional): Número de procesos; por defecto, el número de núcleos.
+        resume (bool): Omite las ejecuciones que ya están en el archivo parcial. Si es False,
+            el archivo se sobrescribe.
+        progress (callable, optional): Función llamada con cada resultado en cuanto se guarda, junto
+            con el número de ejecuciones terminadas (contando las reanudadas) y el total.
+
+    Returns:
+        int: Número de ejecuciones realizadas en esta llamada.
+    """
+    parquet = output.endswith(".parquet")
+    partial = f"{output}.partial.csv" if parquet else output
+
+    completed = load_completed(partial) if resume else set()
+    pending = [run for run in runs if run_key(run) not in completed]
+
+    new_file = not completed
+    done = 0
+    with open(partial, "w" if new_file else "a", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=RESULT_FIELDS)
+        if new_file:
+            writer.writeheader()
+            f.flush()
+        for row in iter_sweep(pending, workers):
+            writer.writerow(row)
+            f.flush()
+            done += 1
+            if progress is not None:
+                progress(row, len(completed) + done, len(completed) + len(pending))
+
+    if parquet:
+        import pandas as pd
+        pd.read_csv(partial).to_parquet(output, index=False)
+        os.remove(partial)
+    return done
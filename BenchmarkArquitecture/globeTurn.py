@@ -0,0 +1,91 @@
+"""
+Benchmark del turno de los globos con Alpha-Beta (`MazeModel.plan_globe_moves`) según el número
+de globos. Los movimientos de todos los globos se planifican en una sola búsqueda, por lo que el
+árbol crece con cada globo; el benchmark mide el tiempo medio y máximo de un turno de los globos,
+los nodos visitados y la profundidad completada, en mapas generados con 1, 2, ... globos. Uso:
+
+    python -m BenchmarkArquitecture.globeTurn --globes 1 2 3 4 6 --levels 0 1 2
+"""
+import argparse
+import time
+
+from Utils.logger import silenced
+from Utils.mapGenerator import generate_map
+
+
+def measure_globe_turns(map, level=0, turns=20, seed=0, time_budget_ms=None, max_episodes=20):
+    """
+    Mide el turno de los globos de `MazeModel.step()` con Alpha-Beta sobre un mapa. Si la partida
+    termina antes de completar `turns` turnos de los globos, se inicia otra con la semilla
+    siguiente hasta reunirlos o agotar `max_episodes` partidas.
+
+    Args:
+        map (list of list of str or np.ndarray): Mapa a simular.
+        level (int): Nivel de dificultad de los globos.
+        turns (int): Turnos de los globos a medir.
+        seed (int): Semilla de la primera partida.
+        time_budget_ms (float, optional): Presupuesto de tiempo de Alpha-Beta en milisegundos.
+        max_episodes (int): Número máximo de partidas.
+
+    Returns:
+        dict: Turnos medidos, tiempo medio y máximo por turno (ms), nodos medios por turno y
+        profundidad completada mínima.
+    """
+    from ModelArquitecture.model import MazeModel
+
+    times = []
+    nodes = 0
+    min_depth = None
+    with silenced():
+        for episode in range(max_episodes):
+            model = MazeModel(len(map[0]), len(map), map, "Alpha-Beta", level=level,
+                              time_budget_ms=time_budget_ms, seed=seed + episode)
+            search = model.search_strategy
+            try:
+                while model.running and len(times) < turns:
+                    is_globe_turn = model.turn == "Globes" and model.globe_count > 0
+                    visited = search.step_count
+                    start = time.perf_counter()
+                    model.step()
+                    if is_globe_turn:
+                        times.append(time.perf_counter() - start)
+                        nodes += search.step_count - visited
+                        depth = search.completed_depth
+                        min_depth = depth if min_depth is None else min(min_depth, depth)
+            except Exception:
+                # Un fallo de la simulación termina la partida
+                pass
+            if len(times) >= turns:
+                break
+
+    return {
+        "turns": len(times),
+        "mean_ms": round(sum(times) / len(times) * 1000, 3) if times else None,
+        "max_ms": round(max(times) * 1000, 3) if times else None,
+        "nodes": round(nodes / len(times)) if times else None,
+        "depth": min_depth,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mide el turno de los globos de Alpha-Beta según el número de globos.")
+    parser.add_argument("--globes", nargs="+", type=int, default=[1, 2, 3, 4, 6], help="Números de globos de los mapas generados.")
+    parser.add_argument("--levels", nargs="+", type=int, default=[0, 1, 2], help="Niveles de dificultad de los globos.")
+    parser.add_argument("--size", type=int, default=15, help="Lado de los mapas generados.")
+    parser.add_argument("--turns", type=int, default=20, help="Turnos de los globos medidos por combinación.")
+    parser.add_argument("--seed", type=int, default=0, help="Semilla de los mapas y de las partidas.")
+    parser.add_argument("--time-budget-ms", type=float, default=None,
+                        help="Presupuesto de Alpha-Beta por decisión (por defecto, el del modelo).")
+    args = parser.parse_args(argv)
+
+    print(f"{'globos':>6} {'nivel':>5} {'turnos':>6} {'medio (ms)':>10} {'máximo (ms)':>11} {'nodos':>8} {'prof.':>5}")
+    for globes in args.globes:
+        map = generate_map(args.size, args.size, seed=args.seed, globes=globes)
+        for level in args.levels:
+            result = measure_globe_turns(map, level, args.turns, args.seed, args.time_budget_ms)
+            print(f"{globes:>6} {level:>5} {result['turns']:>6} {result['mean_ms']!s:>10} "
+                  f"{result['max_ms']!s:>11} {result['nodes']!s:>8} {result['depth']!s:>5}")
+
+
+if __name__ == "__main__":
+    main()
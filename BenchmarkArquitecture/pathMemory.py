@@ -0,0 +1,70 @@
+"""
+Benchmark de memoria de las búsquedas de caminos. Uso:
+
+    python -m BenchmarkArquitecture.pathMemory --size 500 --strategies BFS UCS "A*"
+"""
+import argparse
+
+STRATEGIES = ["BFS", "DFS", "UCS", "A*", "Beam Search"]
+
+
+def open_map(size):
+    """
+    Genera un mapa abierto de `size` x `size` caminos, con Bomberman en una esquina y la meta
+    en la esquina opuesta.
+
+    Args:
+        size (int): Lado del mapa.
+
+    Returns:
+        list of list of str: Mapa en el formato de `load_map`.
+    """
+    map = [["C"] * size for _ in range(size)]
+    map[0][0] = "C_b"
+    map[size - 1][size - 1] = "R_s"
+    return map
+
+
+def measure_search(strategy, size, beam_width=2):
+    """
+    Ejecuta la búsqueda de una estrategia sobre un mapa abierto hasta encontrar la meta y mide
+    el pico de memoria asignada durante la búsqueda (sin contar la construcción del modelo).
+    El tiempo se mide con `tracemalloc` activo, por lo que solo es comparable entre ejecuciones
+    de este mismo benchmark.
+
+    Args:
+        strategy (str): Nombre de la estrategia de búsqueda.
+        size (int): Lado del mapa.
+        beam_width (int): Ancho de haz de Beam Search.
+
+    Returns:
+        dict: Estrategia, tamaño, nodos expandidos, longitud del camino, pico de memoria (MiB) y tiempo (s).
+    """
+    from BenchmarkArquitecture.searchSuite import run_search
+
+    result = run_search(open_map(size), strategy, beam_width=beam_width, trace_memory=True)
+    return {
+        "strategy": strategy,
+        "size": size,
+        "expanded_nodes": result["expanded_nodes"],
+        "path_length": result["path_length"],
+        "peak_mib": round(result["peak_mib"], 2),
+        "wall_time": round(result["wall_time"], 3),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mide la memoria de las búsquedas de caminos en un mapa abierto.")
+    parser.add_argument("--size", type=int, default=500, help="Lado del mapa abierto.")
+    parser.add_argument("--strategies", nargs="+", default=STRATEGIES, help="Estrategias a medir.")
+    args = parser.parse_args(argv)
+
+    print(f"{'estrategia':<12} {'tamaño':>7} {'expandidos':>10} {'camino':>7} {'pico (MiB)':>11} {'tiempo (s)':>10}")
+    for strategy in args.strategies:
+        result = measure_search(strategy, args.size)
+        print(f"{result['strategy']:<12} {result['size']:>7} {result['expanded_nodes']:>10} {result['path_length']:>7} "
+              f"{result['peak_mib']:>11} {result['wall_time']:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,294 @@
+"""
+Suite de benchmarks de las estrategias de búsqueda de caminos sobre los mapas incluidos y mapas
+generados de tamaño creciente. Uso:
+
+    python -m BenchmarkArquitecture.searchSuite --sizes 50 100 --output report.json
+    python -m BenchmarkArquitecture.searchSuite --output new.json --compare report.json
+
+Cada búsqueda se ejecuta con `start_search`/`explore_step` hasta que encuentra la meta, o de una
+vez con `SearchStrategy.solve` si se indica `--mode solve`. El informe
+JSON contiene el entorno de la ejecución y, por cada mapa y configuración, los nodos expandidos,
+la longitud del camino, el tiempo y el pico de memoria. Con `--compare` se señalan las diferencias
+respecto a un informe anterior y el proceso termina con código 1 si hay regresiones.
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from Utils.logger import silenced
+from Utils.mapGenerator import LAYOUTS, generate_map
+
+# Configuraciones medidas: (estrategia, heurística, ancho de haz)
+CONFIGS = [
+    ("BFS", None, None),
+    ("DFS", None, None),
+    ("UCS", None, None),
+    ("A*", "Manhattan", None),
+    ("A*", "Euclidean", None),
+    ("A*", "Landmark", None),
+    ("Beam Search", "Manhattan", 2),
+    ("Beam Search", "Manhattan", 4),
+    ("Beam Search", "Manhattan", 8),
+    ("Hill Climbing", "Manhattan", None),
+    ("Bidirectional BFS", None, None),
+    ("Bidirectional A*", "Manhattan", None),
+    ("JPS", "Manhattan", None),
+]
+
+# Campos que identifican un resultado y campos que deben coincidir exactamente entre versiones
+KEY_FIELDS = ("map", "strategy", "heuristic", "beam_width", "mode")
+MODES = ("step", "solve")
+EXACT_FIELDS = ("outcome", "expanded_nodes", "path_length")
+
+REPORT_VERSION = 1
+
+
+def build_cases(sizes, seed=0, layout="pillars", metal_ratio=0.15):
+    """
+    Reúne los mapas de la suite: los de `Data/Maps` y un mapa generado por cada tamaño.
+
+    Args:
+        sizes (list of int): Lados de los mapas generados.
+        seed (int): Semilla de los mapas generados.
+        layout (str): Disposición del metal de los mapas generados (ver `generate_map`).
+        metal_ratio (float): Proporción de metal en la disposición "scatter".
+
+    Returns:
+        list of tuple: Pares (nombre, mapa) con los mapas como arreglos de códigos de celda.
+    """
+    from BatchArquitecture.runner import available_maps, load_map_data, resolve_map_path
+
+    cases = [(name, load_map_data(resolve_map_path(name))) for name in available_maps()]
+    prefix = "generated" if layout == "pillars" else f"generated-{layout}"
+    cases += [
+        (f"{prefix}-{size}-s{seed}", generate_map(size, size, seed=seed, metal_ratio=metal_ratio, layout=layout))
+        for size in sizes
+    ]
+    return cases
+
+
+def run_search(map, strategy, heuristic=None, beam_width=None, trace_memory=False, mode="step"):
+    """
+    Ejecuta una búsqueda de caminos hasta encontrar la meta, sin simular la partida.
+
+    La búsqueda se detiene si supera cuatro expansiones por celda del mapa (la frontera se agotó
+    sin encontrar la meta) o si lanza una excepción. La construcción del modelo no se incluye en
+    el tiempo ni en la memoria.
+
+    Args:
+        map (list of list of str or np.ndarray): Mapa a explorar.
+        strategy (str): Nombre de la estrategia de búsqueda.
+        heuristic (str, optional): Heurística de distancia.
+        beam_width (int, optional): Ancho de haz de Beam Search.
+        trace_memory (bool): Mide el pico de memoria con `tracemalloc`, lo que ralentiza la búsqueda.
+        mode (str): "step" para avanzar con `explore_step` o "solve" para `SearchStrategy.solve`.
+
+    Returns:
+        dict: Resultado ("found", "step_cap", "not_found" o "error:<tipo>"), nodos expandidos, longitud del
+        camino en movimientos, tiempo (s) y pico de memoria (MiB, o None si no se midió).
+    """
+    from ModelArquitecture.model import MazeModel
+
+    height, width = len(map), len(map[0])
+    step_cap = 4 * width * height
+    with silenced():
+        model = MazeModel(width, height, map, strategy, distance_metric=heuristic or "Manhattan", beta=beam_width or 2, seed=0)
+        bomberman = model.bomberman
+        search = model.search_strategy
+        start_position = bomberman.pos
+
+        if trace_memory:
+            tracemalloc.start()
+            tracemalloc.reset_peak()
+        outcome = "step_cap"
+        calls = 0
+        start = time.perf_counter()
+        try:
+            if mode == "solve":
+                path, expanded_nodes = search.solve(bomberman.pos, model.goal_position, model.grid.is_walkable)
+                outcome = "found" if path else "not_found"
+            else:
+                search.start_search(bomberman.pos, model.goal_position)
+                while not bomberman.has_explored and calls < step_cap:
+                    search.explore_step(bomberman)
+                    calls += 1
+                if bomberman.has_explored:
+                    outcome = "found"
+                path, expanded_nodes = bomberman.path_to_exit, search.step_count
+        except Exception as e:
+            path, expanded_nodes = [], search.step_count
+            outcome = f"error:{type(e).__name__}"
+        wall_time = time.perf_counter() - start
+        # Como en `BatchArquitecture.runner`, se cuentan los movimientos y no la celda inicial
+        if path and path[0] == start_position:
+            path = path[1:]
+        peak = None
+        if trace_memory:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+    return {
+        "outcome": outcome,
+        "expanded_nodes": expanded_nodes,
+        "path_length": len(path),
+        "wall_time": wall_time,
+        "peak_mib": None if peak is None else round(peak / 2 ** 20, 3),
+    }
+
+
+def measure(map, strategy, heuristic=None, beam_width=None, repeat=3, mode="step"):
+    """
+    Mide una configuración sobre un mapa: el tiempo es el mínimo de `repeat` ejecuciones sin
+    `tracemalloc` y la memoria se mide en una ejecución aparte.
+
+    Args:
+        map (list of list of str or np.ndarray): Mapa a explorar.
+        strategy (str): Nombre de la estrategia de búsqueda.
+        heuristic (str, optional): Heurística de distancia.
+        beam_width (int, optional): Ancho de haz de Beam Search.
+        repeat (int): Número de ejecuciones cronometradas.
+        mode (str): Forma de ejecutar la búsqueda (ver `run_search`).
+
+    Returns:
+        dict: Resultado de `run_search` con el mejor tiempo y el pico de memoria.
+    """
+    runs = [run_search(map, strategy, heuristic, beam_width, mode=mode) for _ in range(max(1, repeat))]
+    result = runs[0]
+    result["wall_time"] = round(min(run["wall_time"] for run in runs), 6)
+    result["peak_mib"] = run_search(map, strategy, heuristic, beam_width, trace_memory=True, mode=mode)["peak_mib"]
+    return result
+
+
+def environment():
+    """Describe el entorno de la ejecución para poder interpretar las diferencias entre informes."""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def run_suite(cases, configs=CONFIGS, repeat=3, progress=None, mode="step"):
+    """
+    Ejecuta todas las configuraciones sobre todos los mapas.
+
+    Args:
+        cases (list of tuple): Pares (nombre, mapa) de `build_cases`.
+        configs (list of tuple): Configuraciones (estrategia, heurística, ancho de haz).
+        repeat (int): Ejecuciones cronometradas por medición.
+        progress (callable, optional): Función llamada con cada resultado en cuanto se obtiene.
+        mode (str): Forma de ejecutar las búsquedas (ver `run_search`).
+
+    Returns:
+        dict: Informe con la versión del formato, el entorno y la lista de resultados.
+    """
+    results = []
+    for name, map in cases:
+        for strategy, heuristic, beam_width in configs:
+            result = {
+                "map": name, "size": f"{len(map[0])}x{len(map)}",
+                "strategy": strategy, "heuristic": heuristic, "beam_width": beam_width, "mode": mode,
+            }
+            result.update(measure(map, strategy, heuristic, beam_width, repeat, mode))
+            results.append(result)
+            if progress is not None:
+                progress(result)
+    return {"version": REPORT_VERSION, "environment": environment(), "results": results}
+
+
+def compare_reports(baseline, current, time_tolerance=0.25, memory_tolerance=0.10, min_time=0.005):
+    """
+    Compara dos informes. Los nodos expandidos, la longitud del camino y el resultado deben
+    coincidir exactamente; el tiempo y la memoria se consideran una regresión si crecen más que
+    la tolerancia relativa. Las variaciones de tiempo menores que `min_time` se ignoran, porque
+    en los mapas pequeños son ruido de medición.
+
+    Args:
+        baseline (dict): Informe de referencia.
+        current (dict): Informe nuevo.
+        time_tolerance (float): Aumento relativo de tiempo permitido.
+        memory_tolerance (float): Aumento relativo del pico de memoria permitido.
+        min_time (float): Aumento absoluto de tiempo (s) por debajo del cual no hay regresión.
+
+    Returns:
+        list of str: Descripción de cada regresión o diferencia encontrada.
+    """
+    def key(result):
+        return tuple(result.get(field, "step") if field == "mode" else result[field] for field in KEY_FIELDS)
+
+    previous = {key(result): result for result in baseline["results"]}
+    problems = []
+    for result in current["results"]:
+        label = " / ".join(str(value) for value in key(result) if value is not None)
+        old = previous.pop(key(result), None)
+        if old is None:
+            continue  # Caso nuevo: no hay con qué compararlo
+        for field in EXACT_FIELDS:
+            if old[field] != result[field]:
+                problems.append(f"{label}: {field} {old[field]} -> {result[field]}")
+        for field, tolerance, floor in (("wall_time", time_tolerance, min_time), ("peak_mib", memory_tolerance, 0)):
+            if old[field] and result[field] is not None and result[field] > old[field] * (1 + tolerance) \
+                    and result[field] - old[field] > floor:
+                problems.append(f"{label}: {field} {old[field]} -> {result[field]} (+{result[field] / old[field] - 1:.0%})")
+    for missing in previous:
+        problems.append(f"{' / '.join(str(value) for value in missing if value is not None)}: ausente en el informe nuevo")
+    return problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks de las estrategias de búsqueda de caminos.")
+    # Hill Climbing crece de forma cuadrática con el tamaño del mapa (unos 25 s en 100x100)
+    parser.add_argument("--sizes", nargs="*", type=int, default=[50, 100], help="Lados de los mapas generados.")
+    parser.add_argument("--seed", type=int, default=0, help="Semilla de los mapas generados.")
+    parser.add_argument("--layout", choices=LAYOUTS, default="pillars", help="Disposición del metal de los mapas generados.")
+    parser.add_argument("--metal-ratio", type=float, default=0.15, help="Proporción de metal en la disposición scatter.")
+    parser.add_argument("--strategies", nargs="+", help="Medir solo estas estrategias (por defecto, todas).")
+    parser.add_argument("--repeat", type=int, default=3, help="Ejecuciones cronometradas por medición.")
+    parser.add_argument("--mode", choices=MODES, default="step", help="Búsqueda paso a paso (explore_step) o completa (solve).")
+    parser.add_argument("--output", help="Archivo JSON del informe.")
+    parser.add_argument("--compare", help="Informe de referencia con el que comparar.")
+    parser.add_argument("--time-tolerance", type=float, default=0.25, help="Aumento de tiempo permitido (proporción).")
+    parser.add_argument("--memory-tolerance", type=float, default=0.10, help="Aumento de memoria permitido (proporción).")
+    parser.add_argument("--min-time", type=float, default=0.005, help="Aumento de tiempo (s) que se ignora como ruido.")
+    args = parser.parse_args(argv)
+
+    def show(result):
+        print(f"{result['map']:<22} {result['strategy']:<17} {result['heuristic'] or '':<9} {result['beam_width'] or '':>4} "
+              f"{result['outcome']:<8} {result['expanded_nodes']:>10} {result['path_length']:>7} "
+              f"{result['wall_time']:>10.4f} {result['peak_mib']:>9}")
+
+    print(f"{'mapa':<22} {'estrategia':<17} {'heurística':<9} {'haz':>4} {'resultado':<8} {'expandidos':>10} "
+          f"{'camino':>7} {'tiempo (s)':>10} {'pico (MiB)':>9}")
+    configs = [config for config in CONFIGS if not args.strategies or config[0] in args.strategies]
+    cases = build_cases(args.sizes, args.seed, args.layout, args.metal_ratio)
+    report = run_suite(cases, configs, repeat=args.repeat, progress=show, mode=args.mode)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        problems = compare_reports(baseline, report, args.time_tolerance, args.memory_tolerance, args.min_time)
+        for problem in problems:
+            print(problem)
+        print(f"{len(problems)} diferencias respecto a {args.compare}")
+        if problems:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark del tiempo por paso (tick) de `MazeModel`. Uso:
+
+    python -m BenchmarkArquitecture.tickTime --sizes 50 100 200 --ticks 200
+"""
+import argparse
+import time
+
+from Utils.dinamicTools import load_map
+from Utils.logger import silenced
+from Utils.mapGenerator import generate_map
+
+
+def measure_ticks(map, strategy="BFS", ticks=200, seed=0, max_episodes=100):
+    """
+    Mide el tiempo medio de `MazeModel.step()` sobre un mapa. Si la partida termina (o falla)
+    antes de completar `ticks` pasos, se inicia otra con la semilla siguiente hasta reunirlos
+    o agotar `max_episodes` partidas.
+
+    Args:
+        map (list of list of str or np.ndarray): Mapa a simular.
+        strategy (str): Estrategia de búsqueda de Bomberman.
+        ticks (int): Número de pasos a medir.
+        seed (int): Semilla de la primera partida.
+        max_episodes (int): Número máximo de partidas.
+
+    Returns:
+        dict: Tamaño, agentes en el scheduler al inicio, pasos medidos, tiempo de construcción
+        del modelo (s) y tiempo medio por paso (ms).
+    """
+    from ModelArquitecture.model import MazeModel
+
+    measured = 0
+    elapsed = 0.0
+    build_time = scheduled_agents = None
+    with silenced():
+        for episode in range(max_episodes):
+            start = time.perf_counter()
+            model = MazeModel(len(map[0]), len(map), map, strategy, seed=seed + episode)
+            if build_time is None:
+                build_time = time.perf_counter() - start
+                scheduled_agents = model.schedule.get_agent_count()
+
+            start = time.perf_counter()
+            try:
+                while model.running and measured < ticks:
+                    model.step()
+                    measured += 1
+            except Exception:
+                # Un fallo de la simulación termina la partida; el paso fallido no se cuenta
+                pass
+            elapsed += time.perf_counter() - start
+            if measured >= ticks:
+                break
+
+    return {
+        "size": f"{len(map[0])}x{len(map)}",
+        "scheduled_agents": scheduled_agents,
+        "ticks": measured,
+        "build_s": round(build_time, 3),
+        "tick_ms": round(elapsed / measured * 1000, 4) if measured else None,
+    }
+
+
+def main(argv=None):
+    from BatchArquitecture.runner import available_maps, resolve_map_path
+
+    parser = argparse.ArgumentParser(description="Mide el tiempo por paso de la simulación.")
+    parser.add_argument("--sizes", nargs="+", type=int, default=[50, 100, 200], help="Lados de los mapas sintéticos.")
+    parser.add_argument("--ticks", type=int, default=200, help="Pasos medidos por mapa.")
+    parser.add_argument("--strategy", default="BFS", help="Estrategia de búsqueda de Bomberman.")
+    args = parser.parse_args(argv)
+
+    maps = [(name, load_map(resolve_map_path(name))) for name in available_maps()]
+    maps += [(f"sintético {size}", generate_map(size, size)) for size in args.sizes]
+
+    print(f"{'mapa':<14} {'tamaño':>9} {'scheduler':>9} {'pasos':>6} {'construcción (s)':>16} {'paso (ms)':>10}")
+    for name, map in maps:
+        result = measure_ticks(map, args.strategy, args.ticks)
+        print(f"{name:<14} {result['size']:>9} {result['scheduled_agents']:>9} {result['ticks']:>6} "
+              f"{result['build_s']:>16} {result['tick_ms']:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Benchmark de pasos de simulación hasta la meta según el modelo de costo de UCS y A*
+(`SearchesArquitecture.costModel`). Cada combinación de mapa, estrategia, nivel y semilla se
+simula con el costo unitario y con el costo en pasos, y se comparan el resultado y los pasos
+hasta terminar la partida. Uso:
+
+    python -m BenchmarkArquitecture.ticksToGoal --levels 0 1 --seeds 0 1 2
+"""
+import argparse
+
+from BatchArquitecture.runner import available_maps, run_simulation
+from SearchesArquitecture.costModel import COST_MODELS
+from SearchesArquitecture.registry import get_strategy, strategy_names
+
+# Estrategias que aceptan un modelo de costo, con su heurística
+STRATEGIES = tuple(
+    (name, "Manhattan" if get_strategy(name).supports_heuristic else None)
+    for name in strategy_names() if get_strategy(name).supports_cost_model
+)
+
+
+def compare_cost_models(maps, levels=(0,), seeds=(0,), cost_models=tuple(COST_MODELS), max_steps=1000):
+    """
+    Simula cada combinación con cada modelo de costo.
+
+    Args:
+        maps (list of str): Mapas a simular.
+        levels (iterable of int): Niveles de dificultad de los globos.
+        seeds (iterable of int): Semillas de las partidas.
+        cost_models (iterable of str): Modelos de costo a comparar.
+        max_steps (int): Límite de pasos de cada partida.
+
+    Returns:
+        list of dict: Una fila por combinación, con el resultado y los pasos de cada modelo
+        (`<modelo>_outcome`, `<modelo>_steps`).
+    """
+    rows = []
+    for map in maps:
+        for strategy, heuristic in STRATEGIES:
+            for level in levels:
+                for seed in seeds:
+                    row = {"map": map, "strategy": strategy, "level": level, "seed": seed}
+                    for cost_model in cost_models:
+                        result = run_simulation(
+                            map, strategy, heuristic=heuristic, level=level, seed=seed,
+                            max_steps=max_steps, cost_model=cost_model,
+                        )
+                        row[f"{cost_model}_outcome"] = result["outcome"]
+                        row[f"{cost_model}_steps"] = result["steps"]
+                    rows.append(row)
+    return rows
+
+
+def summarize(rows, cost_models=tuple(COST_MODELS)):
+    """
+    Resume cada modelo de costo: partidas que llegan a la meta y pasos hasta la meta en las
+    partidas en las que todos los modelos llegan, para que los promedios sean comparables.
+
+    Args:
+        rows (list of dict): Filas de `compare_cost_models`.
+        cost_models (iterable of str): Modelos de costo comparados.
+
+    Returns:
+        dict: Por modelo, `goals` (partidas que llegan a la meta), `common` (partidas en las que
+        llegan todos) y `mean_steps` (pasos medios en esas partidas, o None).
+    """
+    common = [row for row in rows if all(row[f"{model}_outcome"] == "goal" for model in cost_models)]
+    summary = {}
+    for model in cost_models:
+        steps = [row[f"{model}_steps"] for row in common]
+        summary[model] = {
+            "goals": sum(row[f"{model}_outcome"] == "goal" for row in rows),
+            "common": len(common),
+            "mean_steps": round(sum(steps) / len(steps), 2) if steps else None,
+        }
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compara los pasos hasta la meta con cada modelo de costo.")
+    parser.add_argument("--maps", nargs="+", default=None, help="Mapas a simular (por defecto, todos los incluidos).")
+    parser.add_argument("--levels", nargs="+", type=int, default=[0], help="Niveles de dificultad de los globos.")
+    parser.add_argument("--seeds", nargs="+", type=int, default=[0, 1, 2], help="Semillas de las partidas.")
+    parser.add_argument("--max-steps", type=int, default=1000, help="Límite de pasos de cada partida.")
+    args = parser.parse_args(argv)
+
+    cost_models = tuple(COST_MODELS)
+    rows = compare_cost_models(args.maps or available_maps(), args.levels, args.seeds, cost_models, args.max_steps)
+
+    header = f"{'mapa':<10} {'estrategia':<10} {'nivel':>5} {'semilla':>7}"
+    for model in cost_models:
+        header += f" {model:>10} {'pasos':>6}"
+    print(header)
+    for row in rows:
+        line = f"{row['map']:<10} {row['strategy']:<10} {row['level']:>5} {row['seed']:>7}"
+        for model in cost_models:
+            line += f" {row[f'{model}_outcome']:>10} {row[f'{model}_steps']:>6}"
+        print(line)
+
+    print()
+    for model, stats in summarize(rows, cost_models).items():
+        print(f"{model:<6} metas: {stats['goals']}/{len(rows)}  "
+              f"pasos medios hasta la meta ({stats['common']} partidas comunes): {stats['mean_steps']}")
+
+
+if __name__ == "__main__":
+    main()
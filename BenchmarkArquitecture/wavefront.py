@@ -0,0 +1,100 @@
+"""
+Benchmark de la BFS por frente de onda de NumPy (`bfs.solve_wavefront`, `Utils.floodFill`) frente
+a la BFS con cola de `bfs.explore_step`, sobre los mapas incluidos y mapas generados de tamaño
+creciente. Se miden la búsqueda hasta la meta con ambas versiones y el cálculo del campo de
+distancias completo desde Bomberman, y se comprueba que los caminos tengan la misma longitud. Uso:
+
+    python -m BenchmarkArquitecture.wavefront --sizes 50 100 200 --layout scatter
+"""
+import argparse
+import time
+
+from BenchmarkArquitecture.searchSuite import build_cases
+from Utils.floodFill import flood_fill, walkable_mask
+from Utils.logger import silenced
+from Utils.mapGenerator import LAYOUTS
+
+
+def best_time(function, repeat):
+    """Ejecuta `function` `repeat` veces y devuelve el último resultado y el menor tiempo (s)."""
+    best = float('inf')
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def compare_bfs(map, repeat=3):
+    """
+    Mide las dos versiones de BFS sobre un mapa. La construcción del modelo y de la máscara de
+    celdas transitables no se incluye en los tiempos de la búsqueda por frente de onda.
+
+    Args:
+        map (list of list of str or np.ndarray): Mapa a explorar.
+        repeat (int): Ejecuciones cronometradas de cada versión; se toma el menor tiempo.
+
+    Returns:
+        dict: Longitud del camino de cada versión (`queue_path`, `wavefront_path`), tiempos (s) de
+        la búsqueda con cola (`queue_time`), por frente de onda (`wavefront_time`) y del campo
+        completo (`field_time`), y celdas alcanzadas por el campo completo (`reached`).
+    """
+    from ModelArquitecture.model import MazeModel
+
+    height, width = len(map), len(map[0])
+    step_cap = 4 * width * height
+
+    def run_queue():
+        with silenced():
+            model = MazeModel(width, height, map, "BFS", seed=0)
+            bomberman, search = model.bomberman, model.search_strategy
+            start = time.perf_counter()
+            search.start_search(bomberman.pos, model.goal_position)
+            calls = 0
+            while not bomberman.has_explored and calls < step_cap:
+                search.explore_step(bomberman)
+                calls += 1
+            return len(bomberman.path_to_exit), time.perf_counter() - start
+
+    queue_runs = [run_queue() for _ in range(max(1, repeat))]
+    queue_path = queue_runs[0][0]
+
+    with silenced():
+        model = MazeModel(width, height, map, "BFS", seed=0)
+    start, goal = model.bomberman.pos, model.goal_position
+    walkable = walkable_mask(model.grid)
+    (path, _), wavefront_time = best_time(lambda: model.search_strategy.solve_wavefront(start, goal, walkable), repeat)
+    field, field_time = best_time(lambda: flood_fill(walkable, start), repeat)
+
+    return {
+        "queue_path": queue_path,
+        "wavefront_path": len(path),
+        "queue_time": min(run[1] for run in queue_runs),
+        "wavefront_time": wavefront_time,
+        "field_time": field_time,
+        "reached": int((field.distance >= 0).sum()),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compara la BFS con cola y la BFS por frente de onda de NumPy.")
+    parser.add_argument("--sizes", nargs="*", type=int, default=[50, 100, 200], help="Lados de los mapas generados.")
+    parser.add_argument("--seed", type=int, default=0, help="Semilla de los mapas generados.")
+    parser.add_argument("--layout", choices=LAYOUTS, default="pillars", help="Disposición del metal de los mapas generados.")
+    parser.add_argument("--metal-ratio", type=float, default=0.15, help="Proporción de metal en la disposición scatter.")
+    parser.add_argument("--repeat", type=int, default=3, help="Ejecuciones cronometradas por medición.")
+    args = parser.parse_args(argv)
+
+    print(f"{'mapa':<22} {'celdas':>7} {'camino':>7} {'cola (s)':>10} {'onda (s)':>10} {'campo (s)':>10} {'mejora':>7}")
+    for name, map in build_cases(args.sizes, args.seed, args.layout, args.metal_ratio):
+        result = compare_bfs(map, args.repeat)
+        path = result["queue_path"]
+        if result["wavefront_path"] != path:
+            path = f"{path}/{result['wavefront_path']}"  # No debería ocurrir: ambas versiones son BFS
+        speedup = result["queue_time"] / result["wavefront_time"] if result["wavefront_time"] else float('inf')
+        print(f"{name:<22} {result['reached']:>7} {path:>7} {result['queue_time']:>10.4f} "
+              f"{result['wavefront_time']:>10.4f} {result['field_time']:>10.4f} {speedup:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,24 +1,30 @@
 # Importaciones necesarias para el modelo y sus agentes
 from mesa import Model
-from mesa.time import RandomActivation
-from mesa.space import MultiGrid
+import numpy as np
 from IdentityArquitecture.agents import AgentIdentity
-from SearchesArquitecture.UninformedSearches.dfs import dfs
-from SearchesArquitecture.UninformedSearches.bfs import bfs
-from SearchesArquitecture.UninformedSearches.ucs import ucs
 from AgentArquitecture.bomberman import BombermanAgent
-from AgentArquitecture.goal import GoalAgent
 from AgentArquitecture.globe import GlobeAgent
 from AgentArquitecture.road import RoadAgent
 from AgentArquitecture.bomb import BombAgent
 from AgentArquitecture.explosion import ExplosionAgent
 from AgentArquitecture.powerup import PowerupAgent
-from SearchesArquitecture.InformedSearches.astar import AStarSearch
-from SearchesArquitecture.InformedSearches.beamsearch import BeamSearch
-from SearchesArquitecture.InformedSearches.hillclimbing import HillClimbing
 from Utils.dinamicTools import load_map, get_map_path
-from SearchesArquitecture.InformedSearches.astar import AStarSearch
-from SearchesArquitecture.InformedSearches.alphabeta import AlphaBetaSearch
+from Utils.compiledMap import encode_map, CELL_CODES
+from Utils.terrain import TerrainGrid, GOAL
+from Utils.scheduler import TypedActivation
+from SearchesArquitecture.registry import get_strategy
+from Utils.state import GameState
+from Utils.distanceField import DistanceFieldCache
+from Utils.logger import get_logger
+
+logger = get_logger("model")
+
+# Profundidad de la búsqueda de los globos por nivel (Fácil, Medio, Difícil), en jugadas individuales
+GLOBE_DEPTHS = (1, 3, 6)
+
+# Nodos que puede visitar la búsqueda conjunta de los globos en cada turno. El árbol crece con el
+# número de globos; al agotarse, se usa la línea de la última profundidad completada.
+GLOBE_NODE_BUDGET = 20_000
 
 class MazeModel(Model):
     """
@@ -29,79 +35,84 @@ class MazeModel(Model):
         __init__: Inicializa el modelo con el mapa, los agentes y la estrategia de búsqueda.
         step: Ejecuta un paso en la simulación.
         check_bomberman_and_goal: Verifica si Bomberman ha alcanzado el objetivo.
+        on_bomberman_killed: Registra la muerte de Bomberman y detiene la simulación.
+        on_globe_killed: Registra la destrucción de un globo.
         is_cell_empty: Comprueba si una celda contiene solo caminos o el objetivo.
         reset_game: Reinicia el juego en su configuración inicial.
     """
 
-    def __init__(self, width, height, map, search_strategy, distance_metric="Manhattan", beta: int = None, level: int = 0):
-        super().__init__()
-        self.grid = MultiGrid(width, height, True)  # Configura la cuadrícula del laberinto.
-        self.schedule = RandomActivation(self)      # Inicializa el programador de activación aleatoria.
+    def __init__(self, width, height, map, search_strategy, distance_metric="Manhattan", beta: int = None, level: int = 0,
+                 time_budget_ms: float = None, seed: int = None, cost_model: str = None):
+        super().__init__(seed=seed)  # La semilla fija el generador `self.random` compartido por los agentes
+        self.grid = TerrainGrid(width, height, True)  # Configura la cuadrícula del laberinto y su layer de ocupación.
+        self.schedule = TypedActivation(self)       # Programador de activación aleatoria con registro de agentes por tipo.
         self.globe_active = True                    # Indica si los globos están activos.
         self.goal_position = None                   # Almacena la posición del objetivo.
         self.search_strategy = None                 # Estrategia de búsqueda seleccionada.
+        self.strategy_spec = None                   # Descripción de la estrategia en el registro (`SearchesArquitecture.registry`).
         self.turn = "Bomberman"  # Inicializa el turno para Bomberman
         self.level = level  # Nivel de dificultad de los globos
+        self.globe_plan = {}  # Movimientos planificados para cada globo en el turno actual (Alpha-Beta)
+        self.bomberman = None  # Referencia directa a Bomberman, para detectar el final de la partida sin recorrer la cuadrícula
+        self.outcome = None  # Resultado de la partida: None mientras sigue, "goal" o "killed"
+        self.killed_by = None  # Causa de la muerte de Bomberman: "globe" o "explosion"
+        self.all_globes_dead = False  # Se activa al destruir el último globo; la partida continúa
 
-        # Asigna la estrategia de búsqueda según la elección del usuario
-        if search_strategy == "DFS":
-            self.search_strategy = dfs()
-        elif search_strategy == "BFS":
-            self.search_strategy = bfs()
-        elif search_strategy == "UCS":
-            self.search_strategy = ucs()
-        elif search_strategy == "A*":
-            self.search_strategy = AStarSearch(heuristic=distance_metric)
-        elif search_strategy == "Beam Search":
-            self.search_strategy = BeamSearch(beta, heuristic=distance_metric)
-        elif search_strategy == "Hill Climbing":
-            self.search_strategy = HillClimbing(heuristic=distance_metric)
-        elif search_strategy == "Alpha-Beta":
-            self.search_strategy = AlphaBetaSearch(3)
-        else:
-            raise ValueError(f"Estrategia de búsqueda desconocida: {search_strategy}")
+        # Crea la estrategia elegida a partir del registro; solo se importa el módulo de esa estrategia.
+        # Un presupuesto de 0 ms o None desactiva la profundización iterativa de Alpha-Beta.
+        self.strategy_spec = get_strategy(search_strategy)
+        self.search_strategy = self.strategy_spec.create(
+            heuristic=distance_metric, beam_width=beta, cost_model=cost_model, time_budget_ms=time_budget_ms or None,
+        )
 
 
-        # Configuración de la cuadrícula y agentes
-        for y, row in enumerate(map):
-            for x, cell in enumerate(row):
+        # Configuración de la cuadrícula y agentes. El terreno (caminos, metal, rocas y meta) solo se
+        # coloca en la cuadrícula: no tiene comportamiento propio y no se agrega al scheduler, que
+        # contiene únicamente a Bomberman, los globos, las bombas, las explosiones y los comodines.
+        # El mapa puede llegar como lista de filas de strings (`load_map`) o como arreglo de códigos
+        # de celda (`Utils.compiledMap`); se recorre siempre como códigos enteros.
+        cells = map if isinstance(map, np.ndarray) else encode_map(map)
+        for y, row in enumerate(cells.tolist()):
+            for x, code in enumerate(row):
                 # Inicializa los agentes en la cuadrícula según el tipo de celda
-                if cell == "C":
+                if code == CELL_CODES["C"]:
                     road = AgentIdentity.create_agent("road", (x, y), self)
                     self.grid.place_agent(road, (x, y))
-                    self.schedule.add(road)
-                elif cell == "M":
+                elif code == CELL_CODES["M"]:
                     metal = AgentIdentity.create_agent("metal", (x, y), self)
                     self.grid.place_agent(metal, (x, y))
-                    self.schedule.add(metal)
-                elif cell == "R":
+                elif code == CELL_CODES["R"]:
                     rock = AgentIdentity.create_agent("rock", (x, y), self)
                     self.grid.place_agent(rock, (x, y))
-                    self.schedule.add(rock)
-                elif cell == "C_b":
+                elif code == CELL_CODES["C_b"]:
                     road = AgentIdentity.create_agent("road", (x, y), self)
                     self.grid.place_agent(road, (x, y))
-                    self.schedule.add(road)
                     road.is_visited = True
                     bomberman = AgentIdentity.create_agent("bomberman", (x, y), self, self.search_strategy)
                     self.grid.place_agent(bomberman, (x, y))
                     self.schedule.add(bomberman)
-                elif cell == "R_s":
+                    self.bomberman = bomberman
+                elif code == CELL_CODES["R_s"]:
                     # Coloca un GoalAgent debajo de una roca
                     goal = AgentIdentity.create_agent("goal", (x, y), self)
                     self.grid.place_agent(goal, (x, y))
-                    self.schedule.add(goal)
                     self.goal_position = (x, y)
 
                     # # Coloca una roca encima de la meta
                     # rock = AgentIdentity.create_agent("rock", (x, y), self)
                     # self.grid.place_agent(rock, (x, y))
-                    # self.schedule.add(rock)
-                elif cell == "C_g":
+                elif code == CELL_CODES["C_g"]:
                     globe = AgentIdentity.create_agent("globe", (x, y), self)
                     self.grid.place_agent(globe, (x, y))
                     self.schedule.add(globe)
 
+        # Campos de distancia del terreno compartidos por la evaluación de los estados de juego
+        self.distances = DistanceFieldCache(self.grid)
+
+        # Con el terreno colocado, la estrategia precalcula lo que depende solo del mapa estático
+        if not self.strategy_spec.adversarial:
+            self.search_strategy.prepare(self.grid)
+
         self.running = True
 
     def step(self):
@@ -109,24 +120,20 @@ class MazeModel(Model):
         Ejecuta un paso en la simulación, activando cada agente y luego
         verificando si Bomberman ha alcanzado el objetivo.
         """
-        if isinstance(self.search_strategy, AlphaBetaSearch):
+        if self.strategy_spec.adversarial:
             if self.turn == "Bomberman":
-                # Activar solo Bomberman
-                for agent in self.schedule.agents:
-                    if isinstance(agent, BombermanAgent):
-                        agent.step()
-                    if isinstance(agent, BombAgent):
-                        agent.step()
-                    if isinstance(agent, ExplosionAgent):
-                        agent.step()
-                    if isinstance(agent, PowerupAgent):
-                        agent.step()
+                # Activar Bomberman y los agentes que evolucionan con su turno. Las listas se toman antes
+                # de activar a nadie, de modo que los agentes creados en este paso esperan al siguiente.
+                dynamic_agents = self.schedule.of_type(BombermanAgent) + self.bombs + self.explosions + self.powerups
+                for agent in dynamic_agents:
+                    agent.step()
                 self.turn = "Globes"  # Cambiar el turno a los globos
             elif self.turn == "Globes":
-                # Activar solo los globos
-                for agent in self.schedule.agents:
-                    if isinstance(agent, GlobeAgent):
-                        agent.step()
+                # Planifica una sola vez el movimiento conjunto de todos los globos
+                self.globe_plan = self.plan_globe_moves()
+                # Activar solo los globos, que ejecutan su parte del plan
+                for globe in self.globes:
+                    globe.step()
                 self.turn = "Bomberman"  # Cambiar el turno a Bomberman
         else:
             # Activar todos los agentes
@@ -135,19 +142,93 @@ class MazeModel(Model):
         self.check_bomberman_and_goal()  # Verifica si el objetivo ha sido alcanzado
 
 
+    def plan_globe_moves(self):
+        """
+        Ejecuta una única búsqueda Alpha-Beta para el equipo de globos y devuelve el movimiento
+        asignado a cada uno. La profundidad depende del nivel de dificultad (`GLOBE_DEPTHS`) y la
+        búsqueda se limita siempre a `GLOBE_NODE_BUDGET` nodos, además del presupuesto de tiempo
+        del modelo si se configuró.
+
+        Returns:
+            dict: Posición destino de cada globo, indexada por `unique_id`.
+        """
+        game_state = GameState(self, is_bomberman_turn=False)
+        if game_state.bomberman_position is None or not game_state.globe_positions:
+            return {}
+        depth = GLOBE_DEPTHS[min(self.level, len(GLOBE_DEPTHS) - 1)]
+        plan = self.search_strategy.plan_globes(game_state, depth, max_nodes=GLOBE_NODE_BUDGET)
+        logger.debug("Plan de movimiento de los globos: %s", plan)
+        return plan
+
+    @property
+    def globes(self):
+        """list: Globos vivos, en orden de inserción."""
+        return self.schedule.of_type(GlobeAgent)
+
+    @property
+    def globe_count(self):
+        """int: Número de globos vivos."""
+        return self.schedule.count(GlobeAgent)
+
+    @property
+    def bombs(self):
+        """list: Bombas activas."""
+        return self.schedule.of_type(BombAgent)
+
+    @property
+    def explosions(self):
+        """list: Explosiones activas."""
+        return self.schedule.of_type(ExplosionAgent)
+
+    @property
+    def powerups(self):
+        """list: Comodines sin recoger."""
+        return self.schedule.of_type(PowerupAgent)
+
     def check_bomberman_and_goal(self):
         """
-        Recorre la cuadrícula para verificar si Bomberman ha alcanzado el objetivo.
-        Si es así, detiene la simulación.
+        Verifica si Bomberman ha alcanzado el objetivo consultando solo su celda en el layer de
+        ocupación. Si es así, registra el resultado y detiene la simulación.
+        """
+        if self.outcome is not None or self.bomberman is None:
+            return
+        position = self.bomberman.pos
+        if position is not None and self.grid.has_kind(position, GOAL):
+            self.outcome = "goal"
+            self.running = False  # Detiene la simulación si Bomberman ha alcanzado el objetivo
+            logger.info("Bomberman alcanzó la meta en %s. Simulación finalizada.", position, extra={"event": "goal_reached", "position": position})
+
+    def on_bomberman_killed(self, cause):
+        """
+        Elimina a Bomberman de la cuadrícula y del scheduler, registra la causa y detiene la simulación.
+        Lo invocan los agentes que lo matan (colisión con un globo o explosión).
+
+        Args:
+            cause (str): "globe" o "explosion".
         """
-        for cell in self.grid.coord_iter():
-            cell_content, (x, y) = cell  # Obtiene contenido y posición de cada celda
-            # Verifica si Bomberman y el objetivo están en la misma celda
-            bomberman_present = any(isinstance(agent, BombermanAgent) for agent in cell_content)
-            goal_present = any(isinstance(agent, GoalAgent) for agent in cell_content)
-            if bomberman_present and goal_present:
-                self.running = False  # Detiene la simulación si Bomberman ha alcanzado el objetivo
-                break
+        bomberman = self.bomberman
+        if bomberman.pos is not None:
+            self.grid.remove_agent(bomberman)
+            self.schedule.remove(bomberman)
+        if self.outcome is None:
+            self.outcome = "killed"
+            self.killed_by = cause
+        self.running = False
+
+    def on_globe_killed(self, globe):
+        """
+        Elimina un globo de la cuadrícula y del scheduler y actualiza el conteo de globos vivos.
+        Destruir todos los globos se registra en `all_globes_dead`, pero la partida continúa
+        hasta que Bomberman llegue a la meta.
+
+        Args:
+            globe (GlobeAgent): Globo destruido.
+        """
+        self.grid.remove_agent(globe)
+        self.schedule.remove(globe)
+        if self.globe_count == 0:
+            self.all_globes_dead = True
+            logger.info("Todos los globos han sido destruidos.", extra={"event": "all_globes_dead"})
 
     def is_cell_empty(self, position):
         """
@@ -160,22 +241,25 @@ class MazeModel(Model):
         Returns:
             bool: `True` si la celda está vacía de obstáculos, `False` en caso contrario.
         """
-        cell_content = self.grid.get_cell_list_contents([position])
-        # Verifica que la celda contenga solo agentes de camino o el objetivo
-        return all(isinstance(agent, (RoadAgent, GoalAgent)) for agent in cell_content)
+        # Verifica en el layer de ocupación que la celda contenga solo caminos o el objetivo
+        return not self.grid.cell_kind(position) & ~GOAL
 
     def reset_game(self):
         """
         Reinicia el juego, restaurando la cuadrícula y los agentes a su configuración inicial.
         """
-        # Reinicia el programador y la cuadrícula
-        self.schedule = RandomActivation(self)
-        self.grid = MultiGrid(self.grid.width, self.grid.height, True)
+        # Reinicia el programador, la cuadrícula y el estado de la partida
+        self.schedule = TypedActivation(self)
+        self.grid = TerrainGrid(self.grid.width, self.grid.height, True)
+        self.outcome = None
+        self.killed_by = None
+        self.all_globes_dead = False
         
         # Coloca a Bomberman en la posición inicial
         bomberman = BombermanAgent(self.next_id(), self, self.search_strategy)
         self.grid.place_agent(bomberman, (1, 1))
         self.schedule.add(bomberman)
+        self.bomberman = bomberman
 
         # Restablece los globos en sus posiciones iniciales
         for pos in self.initial_globe_positions:
@@ -189,4 +273,6 @@ class MazeModel(Model):
                 if self.grid.is_cell_empty((x, y)):
                     road = RoadAgent(self.next_id(), self)
                     self.grid.place_agent(road, (x, y))
-                    self.schedule.add(road)
\ No newline at end of file
+
+        # La cuadrícula es nueva: los campos de distancia anteriores ya no sirven
+        self.distances = DistanceFieldCache(self.grid)
\ No newline at end of file
@@ -1,12 +1,32 @@
+from SearchesArquitecture.InformedSearches.transposition import TranspositionTable, EXACT, LOWER_BOUND, UPPER_BOUND
+import time
+from Utils.logger import get_logger
+
+logger = get_logger("search.alphabeta")
+
+
+class SearchTimeout(Exception):
+    """Se lanza dentro del árbol cuando se agota el presupuesto de tiempo o de nodos de la decisión."""
+
+
 class AlphaBetaSearch:
-    def __init__(self, max_depth):
+    def __init__(self, max_depth, table_size=200_000, time_budget_ms=None):
         """
         Inicializa la clase para la poda alfa-beta.
 
         Args:
             max_depth (int): La profundidad máxima para analizar el árbol de búsqueda.
+            table_size (int): Número máximo de entradas de la tabla de transposición.
+            time_budget_ms (float, optional): Tiempo máximo por decisión en milisegundos. Si se indica,
+                `run` usa profundización iterativa hasta agotar el tiempo o alcanzar la profundidad pedida.
         """
         self.max_depth = max_depth
+        self.transposition_table = TranspositionTable(table_size)
+        self.time_budget_ms = time_budget_ms
+        self.completed_depth = 0  # Profundidad de la última iteración completada en `run`
+        self.step_count = 0  # Nodos visitados en todas las búsquedas
+        self._deadline = None
+        self._node_limit = None  # Valor de `step_count` a partir del cual se agota el presupuesto de nodos
 
     def evaluate_state(self, state, is_bomberman_turn):
         """
@@ -22,60 +42,255 @@ class AlphaBetaSearch:
         return state.evaluate(is_bomberman_turn)
 
     def alpha_beta(self, state, depth, alpha, beta, maximizing_player):
+        """
+        Poda alfa-beta desde un estado, con tabla de transposición.
+
+        La profundidad se cuenta en jugadas individuales: cada movimiento de Bomberman y cada
+        movimiento de un globo consume un nivel, de modo que el costo de una profundidad no crece
+        con el número de globos.
+
+        El valor de un subárbol no depende solo de la posición: `GameState.evaluate` penaliza las
+        repeticiones y la detección de bucles cuenta las apariciones de Bomberman, ambas sobre
+        `visited_positions`. Los hijos conservan las últimas cinco posiciones del historial, de
+        modo que la clave de la tabla es el hash de Zobrist junto con esas cinco posiciones: una
+        entrada solo se reutiliza para la misma posición alcanzada con el mismo historial reciente.
+
+        Args:
+            state (GameState): Estado desde el que se busca.
+            depth (int): Profundidad restante, en jugadas individuales.
+            alpha, beta (float): Ventana de la poda.
+            maximizing_player (bool): True si mueve Bomberman, False si mueven los globos.
+
+        Returns:
+            float: Valor del estado.
+        """
+        self.step_count += 1
+
         # Detectar bucles explícitos
         if state.visited_positions.count(state.bomberman_position) > 2:
             return float('-inf') if maximizing_player else float('inf')
 
-        if depth == 0 or state.is_terminal():
+        if depth <= 0 or state.is_terminal():
             return state.evaluate(maximizing_player)
 
+        if self._deadline is not None and time.perf_counter() > self._deadline:
+            raise SearchTimeout()
+        if self._node_limit is not None and self.step_count > self._node_limit:
+            raise SearchTimeout()
+
+        # Consulta la tabla de transposición: la misma posición alcanzada por otro orden de jugadas.
+        # El hash del estado ya incluye el jugador y el globo al que le toca mover; el historial
+        # reciente forma parte de la clave porque los valores de los hijos dependen de él.
+        key = (state.zobrist, state.visited_positions[-5:])
+        cached = self.transposition_table.probe(key, depth, alpha, beta)
+        if cached is not None:
+            return cached
+
+        alpha_original, beta_original = alpha, beta
+        best_action = None
+
+        # La mejor acción de una iteración anterior (variante principal) se explora primero
+        children = state.get_children()
+        pv_action = self.transposition_table.best_action(key)
+        if pv_action is not None:
+            children.sort(key=lambda child: child.last_action != pv_action)
+
         if maximizing_player:
             max_eval = float('-inf')
-            for child in state.get_children():
-                eval = self.alpha_beta(child, depth - 1, alpha, beta, False)
-                max_eval = max(max_eval, eval)
+            for child in children:
+                eval = self.alpha_beta(child, depth - 1, alpha, beta, child.is_bomberman_turn)
+                if eval > max_eval:
+                    max_eval, best_action = eval, child.last_action
                 alpha = max(alpha, eval)
                 if beta <= alpha:
                     break
-            return max_eval
+            value = max_eval
         else:
             min_eval = float('inf')
-            for child in state.get_children():
-                eval = self.alpha_beta(child, depth - 1, alpha, beta, True)
-                min_eval = min(min_eval, eval)
+            for child in children:
+                eval = self.alpha_beta(child, depth - 1, alpha, beta, child.is_bomberman_turn)
+                if eval < min_eval:
+                    min_eval, best_action = eval, child.last_action
                 beta = min(beta, eval)
                 if beta <= alpha:
                     break
-            return min_eval
+            value = min_eval
 
+        # Almacena el valor con el tipo de cota que representa respecto a la ventana original
+        if value <= alpha_original:
+            bound = UPPER_BOUND
+        elif value >= beta_original:
+            bound = LOWER_BOUND
+        else:
+            bound = EXACT
+        self.transposition_table.store(key, depth, value, bound, best_action)
+        return value
 
-    def run(self, game_state, depth, is_bomberman_turn):
-        best_action = None
-        best_value = float('-inf') if is_bomberman_turn else float('inf')
-
-        for child in game_state.get_children():
-            value = self.alpha_beta(
-                state=child,
-                depth=depth - 1,
-                alpha=float('-inf'),
-                beta=float('inf'),
-                maximizing_player=not is_bomberman_turn
-            )
+
+    def run(self, game_state, depth, is_bomberman_turn, time_budget_ms=None):
+        """
+        Elige la mejor acción para el jugador al que le toca mover.
+
+        Sin presupuesto de tiempo se busca directamente a la profundidad indicada. Con presupuesto
+        se aplica profundización iterativa: se completan búsquedas de profundidad 1, 2, ... hasta
+        `depth` o hasta agotar el tiempo, y se devuelve la acción de la iteración más profunda
+        completada. Cada iteración explora primero la variante principal de la anterior.
+
+        Args:
+            game_state (GameState): Estado desde el que se decide.
+            depth (int): Profundidad máxima de búsqueda, en jugadas individuales.
+            is_bomberman_turn (bool): True si decide Bomberman, False si deciden los globos. Debe
+                coincidir con el turno con el que se construyó `game_state`.
+            time_budget_ms (float, optional): Presupuesto de tiempo en milisegundos; por defecto
+                se usa el configurado en el constructor.
+
+        Returns:
+            La mejor acción encontrada (posición o "place_bomb"), o None si no hay acciones. En el
+            turno de los globos es la acción del primer globo; `plan_globes` devuelve la de todos.
+        """
+        line = self._best_line(game_state, depth, time_budget_ms)
+        return line[0] if line else None
+
+    def plan_globes(self, game_state, depth, time_budget_ms=None, max_nodes=None):
+        """
+        Planifica en una sola búsqueda los movimientos de todos los globos para el turno actual.
+
+        El turno de los globos es una única jugada minimizadora en la que cada globo mueve por
+        turnos, por lo que la mejor línea desde la raíz contiene el movimiento conjunto óptimo.
+        Si la profundidad se agota antes de que muevan todos, los globos restantes eligen su
+        movimiento sin búsqueda (ver `_greedy_line`).
+
+        Args:
+            game_state (GameState): Estado construido con el turno de los globos.
+            depth (int): Profundidad máxima de búsqueda, en jugadas individuales.
+            time_budget_ms (float, optional): Presupuesto de tiempo en milisegundos.
+            max_nodes (int, optional): Presupuesto de nodos visitados. A diferencia del tiempo, no
+                depende de la máquina, por lo que las partidas con semilla siguen siendo reproducibles.
+
+        Returns:
+            dict: Posición destino de cada globo, indexada por `unique_id`.
+        """
+        line = self._best_line(game_state, depth, time_budget_ms, max_nodes)
+        return {globe_id: move for globe_id, move in zip(game_state.globe_ids, line) if move is not None}
+
+    def _best_line(self, game_state, depth, time_budget_ms=None, max_nodes=None):
+        """
+        Busca la mejor secuencia de acciones del jugador que mueve en la raíz hasta que cede el turno:
+        una acción para Bomberman o una por globo. Aplica profundización iterativa si hay presupuesto
+        de tiempo o de nodos; la primera iteración no se interrumpe, así que siempre hay una línea.
+
+        Returns:
+            tuple: Acciones de la mejor línea encontrada.
+        """
+        if time_budget_ms is None:
+            time_budget_ms = self.time_budget_ms
+        # Los valores dependen del historial reciente de posiciones, por lo que la tabla se reinicia en cada decisión
+        self.transposition_table.clear()
+
+        if time_budget_ms is None and max_nodes is None:
+            best_value, best_line = self._search_root(game_state, game_state, depth, float('-inf'), float('inf'), ())
+            self.completed_depth = depth
+        else:
+            best_value, best_line = None, ()
+            self.completed_depth = 0
+            if time_budget_ms is not None:
+                self._deadline = time.perf_counter() + time_budget_ms / 1000
+            if max_nodes is not None:
+                self._node_limit = self.step_count + max_nodes
+            try:
+                for current_depth in range(1, depth + 1):
+                    try:
+                        # La línea de la iteración anterior se explora primero en la raíz
+                        best_value, best_line = self._search_root(
+                            game_state, game_state, current_depth, float('-inf'), float('inf'), best_line
+                        )
+                    except SearchTimeout:
+                        break
+                    self.completed_depth = current_depth
+            finally:
+                self._deadline = self._node_limit = None
+
+        logger.debug("Mejor acción seleccionada: %s con valor %s (profundidad %s)", best_line, best_value, self.completed_depth)
+        return best_line
+
+    def _search_root(self, game_state, state, depth, alpha, beta, pv):
+        """
+        Evalúa las acciones de la raíz. Mientras el hijo conserve el turno (globos sucesivos)
+        la búsqueda continúa en la raíz para construir la línea completa del jugador; si ya no
+        queda profundidad, el resto de la línea se completa con `_greedy_line`.
+
+        Args:
+            game_state (GameState): Estado raíz de la decisión.
+            state (GameState): Estado actual dentro del turno de la raíz.
+            depth (int): Profundidad restante.
+            alpha, beta (float): Ventana de la poda.
+            pv (tuple): Línea preferida de la iteración anterior, explorada primero.
+
+        Returns:
+            tuple: (valor de la mejor línea, acciones de la mejor línea).
+        """
+        maximizing = state.is_bomberman_turn
+        best_value = float('-inf') if maximizing else float('inf')
+        best_line = ()
+
+        children = state.get_children()
+        if pv:
+            children.sort(key=lambda child: child.last_action != pv[0])
+
+        for child in children:
+            if child.is_bomberman_turn == maximizing and depth > 1:
+                value, line = self._search_root(
+                    game_state, child, depth - 1, alpha, beta,
+                    pv[1:] if pv and child.last_action == pv[0] else ()
+                )
+            elif child.is_bomberman_turn == maximizing:
+                value, line = self._greedy_line(child)
+            else:
+                value, line = self.alpha_beta(
+                    state=child,
+                    depth=depth - 1,
+                    alpha=alpha,
+                    beta=beta,
+                    maximizing_player=child.is_bomberman_turn
+                ), ()
             # Penalizar movimientos repetidos en la decisión final
             if child.last_action in game_state.visited_positions:
-                value -= 50  # Penalización adicional
+                value += -50 if maximizing else 50  # Penalización adicional
 
-            print(f"Evaluando acción {child.last_action} con valor {value}")  # Depuración
-            if is_bomberman_turn:
+            if state is game_state:
+                logger.debug("Evaluando acción %s con valor %s", child.last_action, value)
+            if maximizing:
                 if value > best_value:
-                    best_value = value
-                    best_action = child.last_action
+                    best_value, best_line = value, (child.last_action,) + line
+                alpha = max(alpha, value)
             else:
                 if value < best_value:
-                    best_value = value
-                    best_action = child.last_action
+                    best_value, best_line = value, (child.last_action,) + line
+                beta = min(beta, value)
+            if beta <= alpha:
+                break
 
-        print(f"Mejor acción seleccionada: {best_action} con valor {best_value}")
-        return best_action
+        return best_value, best_line
 
+    def _greedy_line(self, state):
+        """
+        Completa sin búsqueda el turno del jugador que mueve en `state` cuando se agota la
+        profundidad: cada jugada restante es la del hijo con mejor evaluación estática. Así, con
+        profundidad 1, cada globo elige su mejor movimiento inmediato en lugar de recorrer todas
+        las combinaciones de movimientos del equipo.
 
+        Args:
+            state (GameState): Estado dentro del turno de la raíz.
+
+        Returns:
+            tuple: (evaluación del estado al ceder el turno, acciones restantes de la línea).
+        """
+        maximizing = state.is_bomberman_turn
+        line = ()
+        while state.is_bomberman_turn == maximizing and not state.is_terminal():
+            self.step_count += 1
+            children = [(child.evaluate(child.is_bomberman_turn), child) for child in state.get_children()]
+            choose = max if maximizing else min
+            _, state = choose(children, key=lambda item: item[0])
+            line += (state.last_action,)
+        return state.evaluate(state.is_bomberman_turn), line
@@ -1,113 +1,77 @@
-from SearchesArquitecture.searchStrategy import SearchStrategy
-from AgentArquitecture.goal import GoalAgent
-from AgentArquitecture.road import RoadAgent
-from AgentArquitecture.rock import RockAgent
-from AgentArquitecture.globe import GlobeAgent
+from SearchesArquitecture.searchStrategy import GeneratorSearch
+from SearchesArquitecture.costModel import get_cost_model
+from SearchesArquitecture.InformedSearches.landmarks import landmark_table
 import heapq
-import math
 
-class AStarSearch(SearchStrategy):
+class AStarSearch(GeneratorSearch):
     """
     Implementación del algoritmo A* para búsqueda de caminos en un entorno de agentes.
     Este algoritmo utiliza una heurística para calcular el costo total estimado (f_score) y
-    selecciona el nodo más prometedor en cada expansión hasta encontrar el objetivo.
+    selecciona el nodo más prometedor en cada expansión hasta encontrar el objetivo. La búsqueda
+    paso a paso avanza el generador de `expand` (ver `GeneratorSearch`).
     
     Atributos:
-        open_set (list): Cola de prioridad de nodos a expandir.
-        visited (set): Conjunto de nodos ya expandidos.
-        g_score (dict): Costos acumulados desde el inicio hasta cada nodo.
-        f_score (dict): Costos totales estimados (g_score + heurística) de cada nodo.
-        step_count (int): Contador de pasos de expansión para visualización.
-        index (int): Índice para el orden de expansión.
-        heuristic (str): Heurística seleccionada ('Manhattan' o 'Euclidean').
+        heuristic (str): Heurística seleccionada ('Manhattan', 'Euclidean' o 'Landmark').
         weight (float): Factor de ponderación para la heurística.
+        landmarks (LandmarkTable): Distancias de los puntos de referencia de la heurística 'Landmark',
+            calculadas en `prepare` (`SearchesArquitecture.InformedSearches.landmarks`).
+        cost_model (UnitCost): Modelo de costo de entrar en cada celda (`SearchesArquitecture.costModel`).
+            Todos los modelos cuestan al menos 1 por celda, por lo que las heurísticas siguen siendo admisibles.
     """
 
-    def __init__(self, heuristic='Manhattan'):
+    uses_predecessor_map = True
+
+    def __init__(self, heuristic='Manhattan', cost_model=None):
         """
         Inicializa el algoritmo A* con los atributos necesarios.
         
         Args:
-            heuristic (str): Tipo de heurística ('Manhattan' o 'Euclidean').
+            heuristic (str): Tipo de heurística ('Manhattan', 'Euclidean' o 'Landmark').
+            cost_model (str or UnitCost, opcional): Modelo de costo de las celdas; por defecto, costo unitario.
         """
-        self.open_set = []     # Cola de prioridad para nodos pendientes de expansión
-        self.visited = set()   # Conjunto de nodos ya visitados
-        self.g_score = {}      # Costos acumulados hasta cada nodo
-        self.f_score = {}      # Costos totales estimados (g_score + heurística)
-        self.step_count = 0    # Contador de pasos para orden de expansión
-        self.index = 0         # Índice para mantener el orden en la cola de prioridad
+        super().__init__()
         self.heuristic = heuristic
         self.weight = 1.0      # Peso de la heurística para ajustar la función de evaluación
+        self.cost_model = get_cost_model(cost_model)  # Costo de entrar en cada celda
+        self.landmarks = None  # Distancias de los puntos de referencia (heurística 'Landmark')
 
-    def manhattan_distance(self, pos1, pos2):
-        """
-        Calcula la distancia de Manhattan entre dos posiciones.
-        
-        Args:
-            pos1, pos2 (tuple): Coordenadas de las posiciones (x, y).
-        
-        Returns:
-            int: Distancia de Manhattan entre las dos posiciones.
-        """
-        return abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1])
-    
-    def euclidean_distance(self, pos1, pos2):
+    def prepare(self, grid):
         """
-        Calcula la distancia Euclidiana entre dos posiciones.
-        
-        Args:
-            pos1, pos2 (tuple): Coordenadas de las posiciones (x, y).
-        
-        Returns:
-            float: Distancia Euclidiana entre las dos posiciones.
-        """
-        return math.sqrt((pos1[0] - pos2[0]) ** 2 + (pos1[1] - pos2[1]) ** 2)
+        Con la heurística 'Landmark', obtiene las distancias de los puntos de referencia del metal
+        del mapa (calculadas una vez por disposición del metal y guardadas en caché).
 
-    def start_search(self, start, goal):
-        """
-        Inicializa la búsqueda A* estableciendo el nodo de inicio y el nodo objetivo,
-        así como los valores de los puntajes g y f para el nodo inicial.
-        
         Args:
-            start (tuple): Coordenadas del nodo de inicio.
-            goal (tuple): Coordenadas del nodo objetivo.
+            grid (TerrainGrid): Cuadrícula del modelo.
         """
-        self.goal = goal
-        self.open_set = []
-        self.visited.clear()
-        self.g_score.clear()
-        self.f_score.clear()
-        
-        # Configurar puntajes g y f para el nodo inicial
-        self.g_score[start] = 0
-        h_score = self.manhattan_distance(start, goal) if self.heuristic == 'Manhattan' else self.euclidean_distance(start, goal)
-        h_score *= self.weight  # Aplicar peso a la heurística
-        self.f_score[start] = h_score
-        
-        # Añadir el nodo inicial a la cola de prioridad
-        heapq.heappush(self.open_set, (h_score, 0, self.index, start, [start]))
-        self.step_count = 0  # Restablece el contador de pasos de expansión
+        if self.heuristic == 'Landmark':
+            self.landmarks = landmark_table(grid)
 
-    def is_valid_move(self, pos, agent):
+    def heuristic_function(self, goal):
         """
-        Determina si un movimiento a una posición específica es válido, verificando
-        los límites del mapa y la presencia de agentes permitidos en esa celda.
-        
+        Devuelve la heurística seleccionada hacia una meta, ya multiplicada por el peso.
+
         Args:
-            pos (tuple): Coordenadas de la posición a verificar.
-            agent (Agent): Agente que ejecuta la búsqueda en el entorno.
-        
+            goal (tuple): Meta de la búsqueda.
+
         Returns:
-            bool: `True` si el movimiento es válido, `False` en caso contrario.
+            callable: Función `pos -> heurística`.
+
+        Raises:
+            ValueError: Si la heurística es 'Landmark' y no se llamó a `prepare`.
         """
-        x, y = pos
-        # Verifica si la posición está dentro de los límites de la cuadrícula
-        if not (0 <= x < agent.model.grid.width and 0 <= y < agent.model.grid.height):
-            return False
-            
-        agents_in_cell = agent.model.grid[x][y]
-        # Solo permite movimiento sobre agentes válidos (camino, meta, roca, globo)
-        return all(isinstance(a, (RoadAgent, GoalAgent, RockAgent, GlobeAgent)) for a in agents_in_cell)
+        if self.heuristic == 'Landmark':
+            if self.landmarks is None:
+                raise ValueError("La heurística 'Landmark' necesita llamar antes a prepare(grid)")
+            distance = self.landmarks.heuristic_to(goal)
+            return lambda pos: distance(pos) * self.weight
+        distance = self.distance_function()
+        return lambda pos: distance(pos, goal) * self.weight
+
+    def expand_options(self, agent):
+        """La búsqueda paso a paso valora las celdas con el modelo de costo y el poder actual de Bomberman."""
+        options = super().expand_options(agent)
+        options["cost"] = self.cost_model.cost_function(agent.model.grid, agent.destruction_power)
+        return options
 
     def get_neighbors(self, pos):
         """
@@ -127,66 +91,43 @@ class AStarSearch(SearchStrategy):
             (x, y-1)   # Izquierda
         ]
 
-    def explore_step(self, agent, diagonal=False):
+    def expand(self, start, goal, walkable, cost=None, came_from=None):
         """
-        Expande el nodo con el puntaje f más bajo de la cola de prioridad. Marca el nodo como expandido
-        y, si se encuentra el objetivo, termina la búsqueda. De lo contrario, evalúa vecinos.
-        
+        Ejecuta A* completo entregando cada nodo expandido (ver `SearchStrategy.expand`). Los
+        empates en el puntaje f se resuelven por el puntaje g y después por orden de inserción.
+
         Args:
-            agent (Agent): Agente que ejecuta la búsqueda en el entorno de modelado.
-            diagonal (bool): Indicador para movimientos diagonales (no utilizado en esta implementación).
-        
+            start (tuple): Nodo inicial.
+            goal (tuple): Nodo objetivo.
+            walkable (callable): Indica si una posición es transitable.
+            cost (callable, opcional): Costo de entrar en cada posición (`UnitCost.cost_function`); por defecto, 1.
+            came_from (dict or PredecessorMap, opcional): Mapa de predecesores con `start` ya registrado
+                sin predecesor; por defecto, un diccionario.
+
         Returns:
-            tuple or None: La posición actual expandida o None si se ha alcanzado el objetivo.
+            list: Camino desde `start` hasta `goal`, ambos incluidos, o una lista vacía.
         """
-        if not self.open_set:
-            return None  # Termina si no hay nodos por expandir
-
-        # Extrae el nodo con el puntaje f más bajo
-        _, g_score, _, current, path = heapq.heappop(self.open_set)
-        
-        # Omite el nodo si ya fue visitado
-        if current in self.visited:
-            return current
-
-        # Incrementa el contador de pasos y marca el nodo en la interfaz
-        self.step_count += 1
-        print(f"Expandiendo nodo {self.step_count}: {current}, Camino acumulado hasta ahora: {path}")
-        
-        # Marcar el nodo como expandido para la visualización en la interfaz
-        agent.model.grid[current[0]][current[1]][0].visit_order = self.step_count
-        self.visited.add(current)
-
-        agents_in_cell = agent.model.grid[current[0]][current[1]]
-        
-        # Si el nodo actual es la meta, marca la meta como expandida y termina la búsqueda
-        if any(isinstance(a, GoalAgent) for a in agents_in_cell):
-            agent.model.grid[self.goal[0]][self.goal[1]][0].visit_order = self.step_count  # Marca la salida como expandida
-            agent.path_to_exit = path  # Guarda el camino óptimo encontrado
-            agent.has_explored = True  # Indica que la búsqueda ha terminado
-            print("Meta alcanzada y marcada como expandida. Camino óptimo calculado:", path)
-            return None
-
-        # Expande los vecinos en el orden especificado
-        for next_pos in self.get_neighbors(current):
-            if not self.is_valid_move(next_pos, agent) or next_pos in self.visited:
-                continue  # Omite movimientos no válidos o ya visitados
-
-            tentative_g_score = g_score + 1  # Calcula el puntaje g tentativo
-
-            # Solo actualiza los puntajes g y f si se mejora el puntaje g
-            if next_pos not in self.g_score or tentative_g_score < self.g_score[next_pos]:
-                self.g_score[next_pos] = tentative_g_score
-                h_score = (self.manhattan_distance(next_pos, self.goal) 
-                          if self.heuristic == 'Manhattan' 
-                          else self.euclidean_distance(next_pos, self.goal))
-                h_score *= self.weight  # Aplicar peso a la heurística
-                
-                f_score = tentative_g_score + h_score  # Calcula el puntaje f
-                self.f_score[next_pos] = f_score
-                
-                self.index += 1
-                # Añade el vecino a la cola de prioridad con el nuevo puntaje f
-                heapq.heappush(self.open_set, (f_score, tentative_g_score, self.index, next_pos, path + [next_pos]))
-
-        return current  # Devuelve la posición actual si no se alcanzó la meta
\ No newline at end of file
+        estimate = self.heuristic_function(goal)
+        came_from = {start: None} if came_from is None else came_from
+        g_score = {start: 0}
+        visited = set()
+        open_set = [(estimate(start), 0, 0, start)]
+        index = 0
+        while open_set:
+            _, current_g, _, current = heapq.heappop(open_set)
+            if current in visited:
+                continue
+            visited.add(current)
+            yield current
+            if current == goal:
+                return self.reconstruct_path(came_from, current)
+            for next_pos in self.get_neighbors(current):
+                if next_pos in visited or not walkable(next_pos):
+                    continue
+                tentative_g_score = current_g + (cost(next_pos) if cost else 1)
+                if next_pos not in g_score or tentative_g_score < g_score[next_pos]:
+                    g_score[next_pos] = tentative_g_score
+                    came_from[next_pos] = current
+                    index += 1
+                    heapq.heappush(open_set, (tentative_g_score + estimate(next_pos), tentative_g_score, index, next_pos))
+        return []
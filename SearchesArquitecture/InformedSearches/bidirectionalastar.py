@@ -0,0 +1,98 @@
+from SearchesArquitecture.searchStrategy import GeneratorSearch
+import heapq
+from Utils.logger import get_logger
+
+logger = get_logger("search.bidirectionalastar")
+
+INFINITY = float("inf")
+
+
+class BidirectionalAStar(GeneratorSearch):
+    """
+    A* bidireccional: una búsqueda A* avanza desde el nodo inicial hacia la meta y otra desde la
+    meta hacia el nodo inicial, cada una con la heurística hacia su propio objetivo.
+
+    En cada paso se expande el lado con menos nodos abiertos. Cada vez que un nodo alcanzado por
+    un lado ya fue alcanzado por el otro se registra el camino que pasa por él; la búsqueda termina
+    cuando el mejor camino registrado no supera el mayor de los puntajes f mínimos de ambas colas,
+    condición que garantiza un camino óptimo con heurísticas consistentes (Manhattan y Euclidiana
+    lo son con costo unitario).
+
+    Atributos:
+        heuristic (str): Heurística seleccionada ('Manhattan' o 'Euclidean').
+    """
+
+    def __init__(self, heuristic='Manhattan'):
+        """
+        Args:
+            heuristic (str): Tipo de heurística ('Manhattan' o 'Euclidean').
+        """
+        super().__init__()
+        self.heuristic = heuristic
+
+    def expand(self, start, goal, walkable):
+        """
+        Ejecuta A* bidireccional entregando cada nodo expandido (ver `SearchStrategy.expand`).
+
+        Args:
+            start (tuple): Nodo inicial.
+            goal (tuple): Nodo objetivo.
+            walkable (callable): Indica si una posición es transitable.
+
+        Returns:
+            list: Camino desde `start` hasta `goal`, ambos incluidos, o una lista vacía.
+        """
+        distance = self.distance_function()
+
+        def passable(pos):
+            # La celda de Bomberman no es transitable para la búsqueda, pero la búsqueda hacia atrás debe llegar a ella
+            return pos == start or walkable(pos)
+
+        targets = (goal, start)  # Objetivo de cada dirección
+        g_score = ({start: 0}, {goal: 0})
+        came_from = ({start: None}, {goal: None})
+        closed = (set(), set())
+        open_sets = ([(distance(start, goal), 0, 0, start)], [(distance(goal, start), 0, 0, goal)])
+        index = 0
+        best, meeting = INFINITY, None
+        if start == goal:
+            best, meeting = 0, start
+
+        while True:
+            # Descarta las entradas de nodos ya expandidos en el tope de cada cola
+            for side in (0, 1):
+                while open_sets[side] and open_sets[side][0][3] in closed[side]:
+                    heapq.heappop(open_sets[side])
+            if not open_sets[0] or not open_sets[1]:
+                break
+            if best <= max(open_sets[0][0][0], open_sets[1][0][0]):
+                break
+
+            side = 0 if len(open_sets[0]) <= len(open_sets[1]) else 1
+            other = 1 - side
+            _, current_g, _, current = heapq.heappop(open_sets[side])
+            closed[side].add(current)
+            yield current
+
+            for dx, dy in self.DIRECTIONS:
+                neighbor = (current[0] + dx, current[1] + dy)
+                if neighbor in closed[side] or not passable(neighbor):
+                    continue
+                tentative_g_score = current_g + 1
+                if tentative_g_score < g_score[side].get(neighbor, INFINITY):
+                    g_score[side][neighbor] = tentative_g_score
+                    came_from[side][neighbor] = current
+                    index += 1
+                    f_score = tentative_g_score + distance(neighbor, targets[side])
+                    heapq.heappush(open_sets[side], (f_score, tentative_g_score, index, neighbor))
+                if neighbor in g_score[other]:
+                    length = g_score[side][neighbor] + g_score[other][neighbor]
+                    if length < best:
+                        best, meeting = length, neighbor
+
+        if meeting is None:
+            return []
+        logger.debug("Búsquedas encontradas en %s, longitud %s", meeting, best)
+        forward = self.reconstruct_path(came_from[0], meeting)
+        backward = self.reconstruct_path(came_from[1], meeting)
+        return forward + backward[-2::-1]
@@ -0,0 +1,200 @@
+from Utils.terrain import METAL, BOMB, GLOBE
+import heapq
+import numpy as np
+from Utils.logger import get_logger
+
+logger = get_logger("search.dstarlite")
+
+INFINITY = float("inf")
+
+# Celdas que Bomberman no puede atravesar al replanificar. Las rocas siguen siendo transitables,
+# como en las demás búsquedas: al llegar a una, Bomberman coloca una bomba.
+REPLAN_BLOCKING = METAL | BOMB | GLOBE
+
+
+class DStarLite:
+    """
+    Planificador incremental D* Lite (Koenig y Likhachev, versión optimizada) sobre la cuadrícula
+    con movimientos en 4 direcciones y costo unitario.
+
+    La búsqueda se hace hacia atrás, desde la meta, por lo que el árbol de costos sigue siendo
+    válido aunque Bomberman avance: al replanificar solo se corrigen los nodos afectados por las
+    celdas del layer de ocupación que cambiaron (`TerrainGrid.changes_since`) en lugar de repetir
+    la búsqueda completa.
+
+    El planificador guarda su propia copia de qué celdas están bloqueadas y la actualiza con los
+    cambios de la cuadrícula, de modo que los costos que conoce son siempre coherentes con sus
+    valores g y rhs.
+
+    Atributos:
+        grid (TerrainGrid): Cuadrícula sobre la que se planifica.
+        goal (tuple): Meta de la planificación.
+        start (tuple): Posición desde la que se planificó por última vez.
+        g (dict): Costo hasta la meta de cada nodo consistente.
+        rhs (dict): Costo hasta la meta calculado a partir de los vecinos (lookahead).
+        km (int): Corrección acumulada de las claves por el avance de Bomberman.
+        expanded_nodes (int): Nodos expandidos en total, para medir el costo de replanificar.
+    """
+
+    # Orden de los vecinos al extraer el camino: izquierda, arriba, derecha, abajo
+    DIRECTIONS = ((-1, 0), (0, 1), (1, 0), (0, -1))
+
+    def __init__(self, grid, start, goal, blocking=REPLAN_BLOCKING):
+        """
+        Args:
+            grid (TerrainGrid): Cuadrícula sobre la que se planifica.
+            start (tuple): Posición inicial de Bomberman.
+            goal (tuple): Meta.
+            blocking (int): Máscara de códigos de celda intransitables.
+        """
+        self.grid = grid
+        self.width = grid.width
+        self.height = grid.height
+        self.goal = goal
+        self.start = start
+        self.blocking = blocking
+        self.blocked = bytearray(((grid.layer & blocking) != 0).astype(np.uint8).tobytes())
+        self.cursor = grid.register_reader(self)  # Cambios de la cuadrícula ya incorporados
+        self.g = {}
+        self.rhs = {goal: 0}
+        self.km = 0
+        self.queue = []  # Montículo de entradas (clave, nodo); las obsoletas se descartan al extraerlas
+        self.keys = {goal: self.calculate_key(goal)}  # Clave vigente de cada nodo en la cola
+        heapq.heappush(self.queue, (self.keys[goal], goal))
+        self.expanded_nodes = 0
+
+    def heuristic(self, a, b):
+        """Distancia Manhattan, admisible y consistente con costo unitario."""
+        return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+    def calculate_key(self, node):
+        """Clave de prioridad de un nodo en la cola."""
+        best = min(self.g.get(node, INFINITY), self.rhs.get(node, INFINITY))
+        return (best + self.heuristic(self.start, node) + self.km, best)
+
+    def neighbors(self, node):
+        """Vecinos de un nodo dentro de los límites de la cuadrícula."""
+        x, y = node
+        for dx, dy in self.DIRECTIONS:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < self.width and 0 <= ny < self.height:
+                yield (nx, ny)
+
+    def cost(self, target):
+        """Costo de entrar en una celda: 1 si es transitable, infinito si está bloqueada."""
+        return INFINITY if self.blocked[target[0] * self.height + target[1]] else 1
+
+    def update_vertex(self, node):
+        """Recalcula el lookahead de un nodo y lo coloca en la cola si queda inconsistente."""
+        if node != self.goal:
+            self.rhs[node] = min((self.cost(n) + self.g.get(n, INFINITY) for n in self.neighbors(node)), default=INFINITY)
+        self.keys.pop(node, None)
+        if self.g.get(node, INFINITY) != self.rhs.get(node, INFINITY):
+            key = self.calculate_key(node)
+            self.keys[node] = key
+            heapq.heappush(self.queue, (key, node))
+
+    def _top(self):
+        """Devuelve la entrada vigente de menor clave, descartando las obsoletas."""
+        while self.queue:
+            key, node = self.queue[0]
+            if self.keys.get(node) == key:
+                return key, node
+            heapq.heappop(self.queue)
+        return (INFINITY, INFINITY), None
+
+    def compute_shortest_path(self):
+        """Expande nodos hasta que el costo de `start` es consistente y ninguna clave menor queda pendiente."""
+        while True:
+            top_key, node = self._top()
+            start_rhs = self.rhs.get(self.start, INFINITY)
+            if not (top_key < self.calculate_key(self.start) or start_rhs != self.g.get(self.start, INFINITY)):
+                return
+            if node is None:
+                return
+            new_key = self.calculate_key(node)
+            if top_key < new_key:
+                self.keys[node] = new_key
+                heapq.heappush(self.queue, (new_key, node))
+                continue
+
+            heapq.heappop(self.queue)
+            del self.keys[node]
+            self.expanded_nodes += 1
+            if self.g.get(node, INFINITY) > self.rhs.get(node, INFINITY):
+                self.g[node] = self.rhs[node]
+                for neighbor in self.neighbors(node):
+                    self.update_vertex(neighbor)
+            else:
+                self.g[node] = INFINITY
+                self.update_vertex(node)
+                for neighbor in self.neighbors(node):
+                    self.update_vertex(neighbor)
+
+    def apply_changes(self):
+        """
+        Incorpora las celdas de la cuadrícula que cambiaron desde la última planificación. Solo
+        las que pasan de transitables a bloqueadas o al revés modifican costos: para ellas se
+        actualizan los vecinos, cuyas aristas de entrada a la celda cambiaron de costo.
+
+        Returns:
+            int: Número de celdas cuya transitabilidad cambió.
+        """
+        changed, self.cursor = self.grid.changes_since(self.cursor, self)
+        updated = 0
+        for pos in set(changed):
+            index = pos[0] * self.height + pos[1]
+            blocked = 1 if self.grid.cells[index] & self.blocking else 0
+            if blocked == self.blocked[index]:
+                continue
+            self.blocked[index] = blocked
+            updated += 1
+            for neighbor in self.neighbors(pos):
+                self.update_vertex(neighbor)
+        return updated
+
+    def plan(self, start):
+        """
+        Replanifica desde la posición actual de Bomberman reutilizando el árbol de la planificación anterior.
+
+        Args:
+            start (tuple): Posición actual de Bomberman.
+
+        Returns:
+            list: Camino desde `start` (excluido) hasta la meta (incluida), o una lista vacía si la
+            meta no es alcanzable con el terreno actual.
+        """
+        self.km += self.heuristic(self.start, start)
+        self.start = start
+        expanded_before = self.expanded_nodes
+        updated = self.apply_changes()
+        self.compute_shortest_path()
+        logger.debug(
+            "Replanificación desde %s: %s celdas modificadas, %s nodos expandidos",
+            start, updated, self.expanded_nodes - expanded_before,
+        )
+        return self.extract_path()
+
+    def extract_path(self):
+        """
+        Sigue desde `start` el vecino transitable de menor costo hasta la meta.
+
+        Returns:
+            list: Camino desde `start` (excluido) hasta la meta, o una lista vacía si no existe.
+        """
+        if self.g.get(self.start, INFINITY) == INFINITY and self.rhs.get(self.start, INFINITY) == INFINITY:
+            return []
+        path = []
+        current = self.start
+        limit = self.width * self.height
+        while current != self.goal and len(path) < limit:
+            best, best_cost = None, INFINITY
+            for neighbor in self.neighbors(current):
+                cost = self.cost(neighbor) + self.g.get(neighbor, INFINITY)
+                if cost < best_cost:
+                    best, best_cost = neighbor, cost
+            if best is None:
+                return []
+            path.append(best)
+            current = best
+        return path if current == self.goal else []
@@ -0,0 +1,160 @@
+from SearchesArquitecture.searchStrategy import GeneratorSearch
+import heapq
+from Utils.logger import get_logger
+
+logger = get_logger("search.jps")
+
+INFINITY = float("inf")
+
+
+class JumpPointSearch(GeneratorSearch):
+    """
+    Jump Point Search (Harabor y Grastien) adaptado a la cuadrícula de 4 direcciones con costo unitario.
+
+    En lugar de añadir a la cola cada vecino, desde cada nodo se "salta" en línea recta hasta el
+    siguiente punto de interés (un punto de salto) y solo esos puntos entran en la cola de A*.
+    En zonas abiertas un salto cruza muchas celdas sin expandirlas.
+
+    Reglas de salto en 4 direcciones:
+        - Un salto horizontal (eje x) se detiene en la meta o en una celda con un vecino forzado:
+          un vecino vertical transitable cuya celda anterior en el salto está bloqueada, es decir,
+          un giro que no se podía tomar antes.
+        - Un salto vertical (eje y) se detiene en la meta o en una celda desde la que un salto
+          horizontal, hacia cualquiera de los dos lados, encuentra un punto de salto.
+        - Desde un punto alcanzado en horizontal se sigue en la misma dirección y hacia los vecinos
+          forzados; desde uno alcanzado en vertical, en la misma dirección y hacia ambos lados.
+
+    Los caminos entre puntos de salto son rectos, por lo que el costo de un salto es su longitud y
+    el camino completo se obtiene rellenando las celdas entre puntos consecutivos.
+
+    Atributos:
+        heuristic (str): Heurística seleccionada ('Manhattan' o 'Euclidean').
+    """
+
+    def __init__(self, heuristic='Manhattan'):
+        """
+        Args:
+            heuristic (str): Tipo de heurística ('Manhattan' o 'Euclidean').
+        """
+        super().__init__()
+        self.heuristic = heuristic
+
+    def successor_directions(self, node, parent, passable):
+        """
+        Direcciones de salto desde un punto de salto según la dirección con la que se llegó a él.
+
+        Args:
+            node (tuple): Punto de salto.
+            parent (tuple or None): Punto de salto anterior; None en el nodo inicial.
+            passable (callable): Indica si una posición es transitable.
+
+        Returns:
+            list: Direcciones (dx, dy) en las que continuar la búsqueda.
+        """
+        if parent is None:
+            return list(self.DIRECTIONS)
+        x, y = node
+        dx = (x > parent[0]) - (x < parent[0])
+        dy = (y > parent[1]) - (y < parent[1])
+        if dx:
+            directions = [(dx, 0)]
+            for side in (1, -1):
+                if passable((x, y + side)) and not passable((x - dx, y + side)):
+                    directions.append((0, side))
+            return directions
+        return [(0, dy), (-1, 0), (1, 0)]
+
+    def jump(self, node, direction, goal, passable):
+        """
+        Avanza en línea recta desde `node` hasta el siguiente punto de salto.
+
+        Args:
+            node (tuple): Punto de partida.
+            direction (tuple): Dirección (dx, dy) del salto.
+            goal (tuple): Meta de la búsqueda.
+            passable (callable): Indica si una posición es transitable.
+
+        Returns:
+            tuple or None: Punto de salto encontrado, o None si el salto choca con un obstáculo.
+        """
+        x, y = node
+        dx, dy = direction
+        while True:
+            x, y = x + dx, y + dy
+            if not passable((x, y)):
+                return None
+            if (x, y) == goal:
+                return (x, y)
+            if dx:
+                for side in (1, -1):
+                    if passable((x, y + side)) and not passable((x - dx, y + side)):
+                        return (x, y)
+            else:
+                for side in (1, -1):
+                    if self.jump((x, y), (side, 0), goal, passable) is not None:
+                        return (x, y)
+
+    @staticmethod
+    def fill_path(jump_points):
+        """
+        Convierte la secuencia de puntos de salto en el camino celda a celda.
+
+        Args:
+            jump_points (list): Puntos de salto desde el nodo inicial hasta la meta.
+
+        Returns:
+            list: Camino con todas las celdas intermedias.
+        """
+        path = jump_points[:1]
+        for (x, y), (next_x, next_y) in zip(jump_points, jump_points[1:]):
+            dx = (next_x > x) - (next_x < x)
+            dy = (next_y > y) - (next_y < y)
+            while (x, y) != (next_x, next_y):
+                x, y = x + dx, y + dy
+                path.append((x, y))
+        return path
+
+    def expand(self, start, goal, walkable):
+        """
+        Ejecuta Jump Point Search entregando cada punto de salto expandido (ver `SearchStrategy.expand`).
+
+        Args:
+            start (tuple): Nodo inicial.
+            goal (tuple): Nodo objetivo.
+            walkable (callable): Indica si una posición es transitable.
+
+        Returns:
+            list: Camino desde `start` hasta `goal`, ambos incluidos, o una lista vacía.
+        """
+        distance = self.distance_function()
+
+        def passable(pos):
+            # La celda de Bomberman cuenta como transitable para evaluar los vecinos forzados a su alrededor
+            return pos == start or walkable(pos)
+
+        came_from = {start: None}
+        g_score = {start: 0}
+        closed = set()
+        open_set = [(distance(start, goal), 0, 0, start)]
+        index = 0
+        while open_set:
+            _, current_g, _, current = heapq.heappop(open_set)
+            if current in closed:
+                continue
+            closed.add(current)
+            yield current
+            if current == goal:
+                path = self.fill_path(self.reconstruct_path(came_from, current))
+                logger.debug("Meta alcanzada con %s puntos de salto expandidos", len(closed))
+                return path
+            for direction in self.successor_directions(current, came_from[current], passable):
+                jump_point = self.jump(current, direction, goal, passable)
+                if jump_point is None or jump_point in closed:
+                    continue
+                tentative_g_score = current_g + self.manhattan_distance(current, jump_point)
+                if tentative_g_score < g_score.get(jump_point, INFINITY):
+                    g_score[jump_point] = tentative_g_score
+                    came_from[jump_point] = current
+                    index += 1
+                    heapq.heappush(open_set, (tentative_g_score + distance(jump_point, goal), tentative_g_score, index, jump_point))
+        return []
@@ -0,0 +1,203 @@
+"""
+Heurística de puntos de referencia (ALT: A*, landmarks y desigualdad triangular).
+
+El metal es el único terreno que nunca cambia: las rocas se destruyen y los demás agentes se
+mueven, aparecen o desaparecen. Por eso se eligen K puntos de referencia sobre el mapa de metal
+y se precalcula, para cada uno, la distancia BFS a todas las celdas ignorando el resto de agentes.
+Para cualquier punto de referencia L, la desigualdad triangular acota la distancia real:
+
+    d(n, meta) >= |d(L, meta) - d(L, n)|
+
+Las distancias sobre el metal son una cota inferior de las distancias de la búsqueda (que además
+evita bombas, explosiones y comodines), de modo que la cota es admisible y consistente con costo
+unitario; se combina con la distancia Manhattan tomando el máximo de ambas.
+
+Las distancias dependen solo del metal del mapa, así que se guardan en una caché en disco con
+clave el hash de la disposición del metal (junto a la caché de mapas compilados) y en memoria.
+"""
+from array import array
+import hashlib
+import os
+
+import numpy as np
+
+from Utils.compiledMap import CACHE_DIR_ENV
+from Utils.floodFill import UNREACHED, flood_fill
+from Utils.terrain import METAL
+from Utils.logger import get_logger
+
+logger = get_logger("search.landmarks")
+
+# Terreno que bloquea las distancias precalculadas: solo el metal, que nunca cambia
+STATIC_BLOCKING = METAL
+
+# Número de puntos de referencia por mapa
+DEFAULT_LANDMARKS = 8
+
+# Distancia de las celdas no alcanzables desde un punto de referencia
+UNREACHABLE = UNREACHED
+
+# Directorio de la caché por defecto, el mismo de los mapas compilados
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "Data", "Maps", ".cache")
+
+_tables = {}  # Tablas ya cargadas en este proceso, por clave de caché
+
+
+def distance_field(blocked, width, height, source):
+    """
+    Calcula la distancia BFS en 4 direcciones desde una celda a todas las demás, con la BFS por
+    frente de onda de `Utils.floodFill`.
+
+    Args:
+        blocked (bytes): Indica por cada celda (índice `x * height + y`) si está bloqueada.
+        width (int): Ancho de la cuadrícula.
+        height (int): Alto de la cuadrícula.
+        source (int): Índice de la celda de origen.
+
+    Returns:
+        array: Distancia de cada celda, o `UNREACHABLE`.
+    """
+    walkable = np.frombuffer(bytes(blocked), dtype=np.uint8).reshape(width, height) == 0
+    distance = flood_fill(walkable, divmod(source, height)).distance
+    field = array("i")
+    field.frombytes(distance.tobytes())
+    return field
+
+
+def select_landmarks(blocked, width, height, count=DEFAULT_LANDMARKS):
+    """
+    Elige los puntos de referencia por el método del punto más lejano: cada nuevo punto es la
+    celda libre más alejada de los ya elegidos. Los puntos quedan en la periferia del mapa, donde
+    la cota triangular es más informativa. Solo se consideran las celdas conectadas con la primera
+    celda libre; en las demás componentes la heurística se reduce a la distancia Manhattan.
+
+    Args:
+        blocked (bytes): Indica por cada celda si está bloqueada.
+        width (int): Ancho de la cuadrícula.
+        height (int): Alto de la cuadrícula.
+        count (int): Número máximo de puntos de referencia.
+
+    Returns:
+        tuple: Índices de los puntos elegidos y arreglo `int32` de forma (K, width * height) con sus distancias.
+    """
+    free = np.frombuffer(bytes(blocked), dtype=np.uint8) == 0
+    if not free.any():
+        return [], np.empty((0, width * height), dtype=np.int32)
+
+    # El primer punto es el más lejano de la primera celda libre
+    seed = np.frombuffer(distance_field(blocked, width, height, int(np.argmax(free))), dtype=np.int32)
+    free &= seed != UNREACHABLE
+    candidate = int(np.argmax(seed))
+    nearest = np.full(width * height, np.iinfo(np.int32).max, dtype=np.int64)
+
+    landmarks, fields = [], []
+    while len(landmarks) < count:
+        field = np.frombuffer(distance_field(blocked, width, height, candidate), dtype=np.int32)
+        landmarks.append(candidate)
+        fields.append(field)
+        reached = field != UNREACHABLE
+        nearest[reached] = np.minimum(nearest[reached], field[reached])
+        spread = np.where(free, nearest, -1)
+        candidate = int(np.argmax(spread))
+        if spread[candidate] <= 0:
+            break  # Todas las celdas libres ya son puntos de referencia
+    return landmarks, np.stack(fields)
+
+
+class LandmarkTable:
+    """
+    Distancias precalculadas desde los puntos de referencia de un mapa.
+
+    Atributos:
+        height (int): Alto de la cuadrícula, para calcular el índice de cada celda.
+        landmarks (list): Posiciones (x, y) de los puntos de referencia.
+        fields (list of array): Distancia desde cada punto de referencia a cada celda.
+    """
+    __slots__ = ("height", "landmarks", "fields")
+
+    def __init__(self, landmarks, fields, height):
+        """
+        Args:
+            landmarks (list of int): Índices de los puntos de referencia.
+            fields (np.ndarray): Arreglo `int32` de forma (K, width * height) con sus distancias.
+            height (int): Alto de la cuadrícula.
+        """
+        self.height = height
+        self.landmarks = [divmod(int(index), height) for index in landmarks]
+        self.fields = []
+        for row in fields:
+            # Los arreglos de `array` se indexan más rápido que los de NumPy elemento a elemento
+            field = array("i")
+            field.frombytes(np.ascontiguousarray(row, dtype=np.int32).tobytes())
+            self.fields.append(field)
+
+    def heuristic_to(self, goal):
+        """
+        Devuelve la heurística hacia una meta: el máximo entre la distancia Manhattan y la cota
+        triangular de cada punto de referencia que alcanza a la meta.
+
+        Args:
+            goal (tuple): Meta de la búsqueda.
+
+        Returns:
+            callable: Función `pos -> cota inferior de la distancia hasta la meta`.
+        """
+        height = self.height
+        goal_x, goal_y = goal
+        goal_index = goal_x * height + goal_y
+        pairs = [(field, field[goal_index]) for field in self.fields if field[goal_index] != UNREACHABLE]
+
+        def estimate(pos):
+            best = abs(pos[0] - goal_x) + abs(pos[1] - goal_y)
+            index = pos[0] * height + pos[1]
+            for field, goal_distance in pairs:
+                distance = field[index]
+                if distance != UNREACHABLE:
+                    bound = goal_distance - distance if goal_distance > distance else distance - goal_distance
+                    if bound > best:
+                        best = bound
+            return best
+
+        return estimate
+
+
+def landmark_table(grid, count=DEFAULT_LANDMARKS, cache_dir=None):
+    """
+    Devuelve la tabla de puntos de referencia del metal de una cuadrícula, desde la caché en
+    memoria o en disco si ya se calculó para la misma disposición del metal.
+
+    Args:
+        grid (TerrainGrid): Cuadrícula con el layer de ocupación.
+        count (int): Número de puntos de referencia.
+        cache_dir (str, optional): Directorio de la caché; por defecto, `BOMBERMAN_MAP_CACHE` o `Data/Maps/.cache`.
+
+    Returns:
+        LandmarkTable: Distancias precalculadas.
+    """
+    width, height = grid.width, grid.height
+    blocked = ((grid.layer & STATIC_BLOCKING) != 0).astype(np.uint8).tobytes()
+    digest = hashlib.sha256(f"{width}x{height}:{count}:".encode() + blocked).hexdigest()[:16]
+    if digest in _tables:
+        return _tables[digest]
+
+    cache_dir = cache_dir or os.environ.get(CACHE_DIR_ENV) or DEFAULT_CACHE_DIR
+    path = os.path.join(cache_dir, f"landmarks-{digest}.npz")
+    try:
+        with np.load(path) as data:
+            landmarks, fields = data["landmarks"], data["fields"]
+    except (OSError, KeyError, ValueError):
+        landmarks, fields = select_landmarks(blocked, width, height, count)
+        logger.debug("Puntos de referencia calculados para %sx%s: %s", width, height, landmarks)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            temporary_path = f"{path}.{os.getpid()}.tmp"
+            with open(temporary_path, "wb") as f:
+                np.savez(f, landmarks=np.asarray(landmarks, dtype=np.int64), fields=fields)
+            os.replace(temporary_path, path)
+        except OSError as e:
+            # Sin caché en disco las distancias se recalculan en el siguiente proceso
+            logger.warning("No se pudo guardar la caché de puntos de referencia: %s", e)
+
+    table = LandmarkTable(landmarks, fields, height)
+    _tables[digest] = table
+    return table
@@ -0,0 +1,117 @@
+from typing import NamedTuple, Any
+
+# Tipos de cota almacenados en la tabla de transposición
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+
+class TranspositionEntry(NamedTuple):
+    """
+    Resultado almacenado para una posición ya evaluada por la poda alfa-beta.
+
+    Atributos:
+        value (float): Valor devuelto por la búsqueda.
+        depth (int): Profundidad restante con la que se calculó el valor.
+        bound (int): `EXACT`, `LOWER_BOUND` (fallo alto) o `UPPER_BOUND` (fallo bajo).
+        best_action (Any): Mejor acción encontrada desde la posición, usada para ordenar movimientos.
+    """
+    value: float
+    depth: int
+    bound: int
+    best_action: Any
+
+
+class TranspositionTable:
+    """
+    Tabla de transposición de tamaño acotado, indexada por hashes de Zobrist (o por claves que
+    los combinan con otra información de la que dependa el valor, como el historial reciente).
+
+    Política de reemplazo: una entrada existente solo se sobrescribe con un resultado de igual
+    o mayor profundidad; cuando la tabla está llena se descarta la entrada más antigua.
+
+    Atributos:
+        max_entries (int): Número máximo de entradas almacenadas.
+        hits (int): Consultas cuyo resultado permitió cortar el subárbol.
+        misses (int): Consultas sin entrada utilizable.
+        stores (int): Entradas escritas en la tabla.
+        evictions (int): Entradas descartadas por falta de espacio.
+    """
+
+    def __init__(self, max_entries=200_000):
+        self.max_entries = max_entries
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    def probe(self, key, depth, alpha, beta):
+        """
+        Consulta la tabla para una posición.
+
+        Args:
+            key (hashable): Hash de Zobrist de la posición, incluido el jugador al que le toca mover.
+            depth (int): Profundidad restante requerida.
+            alpha (float): Cota inferior de la ventana actual.
+            beta (float): Cota superior de la ventana actual.
+
+        Returns:
+            float or None: El valor almacenado si permite cortar la búsqueda, o None en caso contrario.
+        """
+        entry = self.entries.get(key)
+        if entry is not None and entry.depth >= depth:
+            if (
+                entry.bound == EXACT
+                or (entry.bound == LOWER_BOUND and entry.value >= beta)
+                or (entry.bound == UPPER_BOUND and entry.value <= alpha)
+            ):
+                self.hits += 1
+                return entry.value
+        self.misses += 1
+        return None
+
+    def best_action(self, key):
+        """Devuelve la mejor acción almacenada para la posición, o None si no hay entrada."""
+        entry = self.entries.get(key)
+        return entry.best_action if entry is not None else None
+
+    def store(self, key, depth, value, bound, best_action=None):
+        """
+        Almacena el resultado de la búsqueda de una posición aplicando la política de reemplazo.
+
+        Args:
+            key (hashable): Hash de Zobrist de la posición.
+            depth (int): Profundidad restante con la que se calculó el valor.
+            value (float): Valor calculado.
+            bound (int): Tipo de cota del valor.
+            best_action: Mejor acción encontrada desde la posición.
+        """
+        existing = self.entries.get(key)
+        if existing is not None:
+            if depth < existing.depth:
+                return
+        elif len(self.entries) >= self.max_entries:
+            del self.entries[next(iter(self.entries))]
+            self.evictions += 1
+        self.entries[key] = TranspositionEntry(value, depth, bound, best_action)
+        self.stores += 1
+
+    def clear(self):
+        """Vacía la tabla conservando los contadores acumulados."""
+        self.entries.clear()
+
+    def stats(self):
+        """
+        Returns:
+            dict: Contadores de aciertos, fallos, escrituras y desalojos, y la tasa de aciertos.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "entries": len(self.entries),
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,67 @@
+from SearchesArquitecture.searchStrategy import GeneratorSearch
+from Utils.logger import get_logger
+
+logger = get_logger("search.bidirectionalbfs")
+
+
+class BidirectionalBFS(GeneratorSearch):
+    """
+    Búsqueda en anchura bidireccional: una búsqueda avanza desde el nodo inicial y otra desde la
+    meta, por niveles completos, y termina cuando se encuentran. Cada búsqueda solo tiene que
+    llegar hasta la mitad del camino, por lo que en mapas abiertos expande muchos menos nodos que BFS.
+
+    En cada ronda se expande el nivel completo del lado con la frontera más pequeña. Al terminar
+    el nivel en el que las búsquedas se tocan por primera vez se elige el encuentro más corto de
+    ese nivel, con lo que el camino es tan corto como el de BFS.
+    """
+
+    def expand(self, start, goal, walkable):
+        """
+        Ejecuta la búsqueda bidireccional entregando cada nodo expandido (ver `SearchStrategy.expand`).
+
+        Args:
+            start (tuple): Nodo inicial.
+            goal (tuple): Nodo objetivo.
+            walkable (callable): Indica si una posición es transitable.
+
+        Returns:
+            list: Camino desde `start` hasta `goal`, ambos incluidos, o una lista vacía.
+        """
+        if start == goal:
+            yield start
+            return [start]
+
+        def passable(pos):
+            # La celda de Bomberman no es transitable para la búsqueda, pero la búsqueda hacia atrás debe llegar a ella
+            return pos == start or walkable(pos)
+
+        came_from = ({start: None}, {goal: None})  # Predecesor de cada nodo en cada dirección
+        distance = ({start: 0}, {goal: 0})  # Profundidad de cada nodo descubierto en cada dirección
+        layers = ([start], [goal])  # Nivel pendiente de expandir en cada dirección
+        best, meeting = None, None
+        while layers[0] and layers[1] and meeting is None:
+            side = 0 if len(layers[0]) <= len(layers[1]) else 1
+            other = 1 - side
+            next_layer = []
+            for current in layers[side]:
+                yield current
+                depth = distance[side][current] + 1
+                for dx, dy in self.DIRECTIONS:
+                    neighbor = (current[0] + dx, current[1] + dy)
+                    if neighbor in came_from[side] or not passable(neighbor):
+                        continue
+                    came_from[side][neighbor] = current
+                    distance[side][neighbor] = depth
+                    next_layer.append(neighbor)
+                    if neighbor in distance[other]:
+                        length = depth + distance[other][neighbor]
+                        if best is None or length < best:
+                            best, meeting = length, neighbor
+            layers = (next_layer, layers[1]) if side == 0 else (layers[0], next_layer)
+
+        if meeting is None:
+            return []
+        logger.debug("Búsquedas encontradas en %s, longitud %s", meeting, best)
+        forward = self.reconstruct_path(came_from[0], meeting)
+        backward = self.reconstruct_path(came_from[1], meeting)
+        return forward + backward[-2::-1]
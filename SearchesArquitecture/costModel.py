@@ -0,0 +1,117 @@
+from Utils.terrain import ROCK, GLOBE
+
+
+class UnitCost:
+    """
+    Modelo de costo por defecto de las búsquedas con costo (UCS y A*): entrar en cualquier celda
+    transitable cuesta 1, incluidas las rocas.
+    """
+    name = "unit"
+
+    def cost(self, grid, pos, power=1):
+        """
+        Devuelve el costo de entrar en una celda.
+
+        Args:
+            grid (TerrainGrid): Cuadrícula con el layer de ocupación.
+            pos (tuple): Celda de destino.
+            power (int): Poder de destrucción de Bomberman.
+
+        Returns:
+            int: Costo del movimiento.
+        """
+        return 1
+
+    def cost_function(self, grid, power=1):
+        """
+        Devuelve el costo de entrar en cada celda como una función de la posición, para `solve`.
+
+        Args:
+            grid (TerrainGrid): Cuadrícula con el layer de ocupación.
+            power (int): Poder de destrucción de Bomberman.
+
+        Returns:
+            callable: Función `pos -> costo`.
+        """
+        return lambda pos: self.cost(grid, pos, power)
+
+
+class TickCost(UnitCost):
+    """
+    Modelo de costo en pasos de simulación: aproxima cuántos pasos tarda Bomberman en atravesar
+    cada celda, de modo que la búsqueda minimiza el tiempo hasta la salida y no el número de celdas.
+
+    - Un camino cuesta `road` pasos.
+    - Una roca cuesta además la espera de la bomba: Bomberman la coloca, retrocede durante
+      `destruction_power + 2` pasos hasta que explota y vuelve desde el retroceso
+      (`destruction_power + 1` pasos).
+    - Una celda con un globo o junto a uno suma `globe_penalty`, por el riesgo de cruzarse con él.
+
+    Atributos:
+        road (int): Costo de un camino libre.
+        rock (int or None): Costo adicional fijo de una roca; None para calcularlo con el poder de destrucción.
+        globe_penalty (int): Costo adicional de una celda con un globo o adyacente a uno.
+    """
+    name = "ticks"
+
+    # Vecinos considerados para la penalización por globos
+    DIRECTIONS = ((-1, 0), (0, 1), (1, 0), (0, -1))
+
+    def __init__(self, road=1, rock=None, globe_penalty=2):
+        self.road = road
+        self.rock = rock
+        self.globe_penalty = globe_penalty
+
+    def rock_cost(self, power):
+        """Pasos adicionales para destruir una roca con una bomba del poder indicado."""
+        if self.rock is not None:
+            return self.rock
+        return (power + 2) + (power + 1)
+
+    def cost(self, grid, pos, power=1):
+        cost = self.road
+        if grid.has_kind(pos, ROCK):
+            cost += self.rock_cost(power)
+        if self.globe_penalty and self._near_globe(grid, pos):
+            cost += self.globe_penalty
+        return cost
+
+    def _near_globe(self, grid, pos):
+        """Indica si la celda contiene un globo o es adyacente a uno."""
+        if grid.has_kind(pos, GLOBE):
+            return True
+        x, y = pos
+        for dx, dy in self.DIRECTIONS:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < grid.width and 0 <= ny < grid.height and grid.has_kind((nx, ny), GLOBE):
+                return True
+        return False
+
+
+# Modelos de costo disponibles por nombre (`MazeModel(cost_model=...)`)
+COST_MODELS = {
+    UnitCost.name: UnitCost,
+    TickCost.name: TickCost,
+}
+
+
+def get_cost_model(cost_model):
+    """
+    Resuelve un modelo de costo a partir de su nombre o de una instancia.
+
+    Args:
+        cost_model (str, UnitCost or None): Nombre ("unit", "ticks"), instancia o None para el costo unitario.
+
+    Returns:
+        UnitCost: Instancia del modelo de costo.
+
+    Raises:
+        ValueError: Si el nombre no corresponde a ningún modelo.
+    """
+    if cost_model is None:
+        return UnitCost()
+    if isinstance(cost_model, str):
+        if cost_model not in COST_MODELS:
+            raise ValueError(f"Modelo de costo desconocido: {cost_model}")
+        return COST_MODELS[cost_model]()
+    return cost_model
@@ -0,0 +1,43 @@
+from array import array
+
+# Valores especiales del arreglo de predecesores
+UNSET = -1  # Celda aún no alcanzada
+ROOT = -2  # Nodo inicial de la búsqueda, sin predecesor
+
+
+class PredecessorMap:
+    """
+    Mapa de predecesores de una búsqueda sobre la cuadrícula, almacenado en un arreglo plano
+    `int32` indexado por celda (`x * height + y`, el mismo orden que el layer de `TerrainGrid`).
+
+    Ocupa 4 bytes por celda del mapa, en lugar de una entrada de diccionario con dos tuplas por
+    nodo alcanzado, y se usa como un diccionario `{posición: predecesor}`.
+
+    Atributos:
+        height (int): Alto de la cuadrícula, usado para calcular el índice de cada celda.
+        cells (array): Índice del predecesor de cada celda, `UNSET` o `ROOT`.
+    """
+    __slots__ = ("height", "cells")
+
+    def __init__(self, grid, start):
+        """
+        Args:
+            grid (TerrainGrid): Cuadrícula sobre la que se realiza la búsqueda.
+            start (tuple): Nodo inicial de la búsqueda.
+        """
+        self.height = grid.height
+        self.cells = array("i", [UNSET]) * (grid.width * grid.height)
+        self[start] = None
+
+    def __contains__(self, pos):
+        return self.cells[pos[0] * self.height + pos[1]] != UNSET
+
+    def __getitem__(self, pos):
+        """Devuelve el predecesor de `pos`, o None si es el nodo inicial."""
+        index = self.cells[pos[0] * self.height + pos[1]]
+        if index == UNSET:
+            raise KeyError(pos)
+        return None if index == ROOT else divmod(index, self.height)
+
+    def __setitem__(self, pos, parent):
+        self.cells[pos[0] * self.height + pos[1]] = ROOT if parent is None else parent[0] * self.height + parent[1]
@@ -0,0 +1,190 @@
+"""
+Registro de las estrategias de búsqueda de Bomberman.
+
+Cada estrategia se registra con su nombre (el que se elige en la interfaz y en el ejecutor por
+lotes), la clase que la implementa, los parámetros del modelo que acepta su constructor y si es
+adversaria. La clase se indica como una ruta `"módulo:Clase"` y solo se importa al crear la
+estrategia, de modo que listar las estrategias o ejecutar una de ellas no carga los módulos de
+las demás.
+
+Para añadir una estrategia basta con registrarla, por ejemplo desde su propio módulo:
+
+    register_strategy("Mi búsqueda", MiBusqueda, params={"heuristic": "heuristic"})
+
+o aquí mismo con su ruta, si debe aparecer en la interfaz sin importar su módulo de antemano.
+"""
+from importlib import import_module
+from typing import Any, Dict, List, NamedTuple, Tuple, Union
+
+from Utils.logger import get_logger
+
+logger = get_logger("search.registry")
+
+# Opciones del modelo que se pueden pasar a los constructores de las estrategias
+OPTIONS = ("heuristic", "beam_width", "cost_model", "time_budget_ms")
+
+# Heurísticas de distancia que entienden todas las estrategias informadas
+HEURISTICS = ("Manhattan", "Euclidean")
+
+
+class StrategySpec(NamedTuple):
+    """
+    Descripción de una estrategia registrada.
+
+    Atributos:
+        name (str): Nombre de la estrategia.
+        target (str or type): Ruta `"módulo:Clase"` de la implementación, o la clase misma.
+        params (dict): Opción del modelo (`OPTIONS`) -> nombre del parámetro del constructor que la recibe.
+        defaults (dict): Argumentos fijos del constructor.
+        adversarial (bool): Si la estrategia decide jugada a jugada contra los globos (Alpha-Beta)
+            en lugar de calcular un camino hasta la salida.
+        heuristics (tuple): Heurísticas admitidas, si la estrategia usa la métrica de distancia.
+    """
+    name: str
+    target: Union[str, type]
+    params: Dict[str, str]
+    defaults: Dict[str, Any]
+    adversarial: bool
+    heuristics: Tuple[str, ...]
+
+    @property
+    def supports_heuristic(self) -> bool:
+        """Indica si la estrategia usa la métrica de distancia."""
+        return "heuristic" in self.params
+
+    @property
+    def supports_beam_width(self) -> bool:
+        """Indica si la estrategia usa el ancho de haz."""
+        return "beam_width" in self.params
+
+    @property
+    def supports_cost_model(self) -> bool:
+        """Indica si la estrategia acepta un modelo de costo (`SearchesArquitecture.costModel`)."""
+        return "cost_model" in self.params
+
+    def load(self) -> type:
+        """Importa y devuelve la clase de la estrategia."""
+        if not isinstance(self.target, str):
+            return self.target
+        module, _, name = self.target.partition(":")
+        return getattr(import_module(module), name)
+
+    def create(self, **options):
+        """
+        Crea una instancia de la estrategia. Las opciones que la estrategia no admite y las que
+        valen None se ignoran, de modo que el constructor usa sus valores por defecto. Una
+        heurística que la estrategia no admite se sustituye por la primera que sí admite.
+
+        Args:
+            **options: Opciones del modelo (`OPTIONS`).
+
+        Returns:
+            SearchStrategy: Instancia de la estrategia.
+        """
+        kwargs = dict(self.defaults)
+        if self.supports_heuristic and options.get("heuristic") not in (None, *self.heuristics):
+            logger.warning("%s no admite la heurística %s; se usa %s", self.name, options["heuristic"], self.heuristics[0])
+            options["heuristic"] = self.heuristics[0]
+        for option, value in options.items():
+            if value is not None and option in self.params:
+                kwargs[self.params[option]] = value
+        return self.load()(**kwargs)
+
+
+_registry: Dict[str, StrategySpec] = {}
+
+
+def register_strategy(name, target, params=None, defaults=None, adversarial=False, heuristics=HEURISTICS) -> StrategySpec:
+    """
+    Registra una estrategia de búsqueda.
+
+    Args:
+        name (str): Nombre de la estrategia.
+        target (str or type): Ruta `"módulo:Clase"` de la implementación, o la clase misma.
+        params (dict, optional): Opción del modelo -> parámetro del constructor que la recibe.
+        defaults (dict, optional): Argumentos fijos del constructor.
+        adversarial (bool): Si la estrategia es adversaria (ver `StrategySpec`).
+        heuristics (tuple): Heurísticas admitidas por la estrategia, si usa la métrica de distancia.
+
+    Returns:
+        StrategySpec: Descripción registrada.
+
+    Raises:
+        ValueError: Si ya hay una estrategia con ese nombre o alguna opción no existe.
+    """
+    if name in _registry:
+        raise ValueError(f"La estrategia {name} ya está registrada")
+    params = dict(params or {})
+    unknown = set(params) - set(OPTIONS)
+    if unknown:
+        raise ValueError(f"Opciones desconocidas para {name}: {sorted(unknown)}")
+    spec = StrategySpec(name, target, params, dict(defaults or {}), adversarial, tuple(heuristics) if "heuristic" in params else ())
+    _registry[name] = spec
+    return spec
+
+
+def get_strategy(name) -> StrategySpec:
+    """
+    Devuelve la descripción de una estrategia registrada.
+
+    Raises:
+        ValueError: Si no hay ninguna estrategia con ese nombre.
+    """
+    try:
+        return _registry[name]
+    except KeyError:
+        raise ValueError(f"Estrategia de búsqueda desconocida: {name}") from None
+
+
+def heuristic_names() -> List[str]:
+    """Heurísticas admitidas por alguna estrategia registrada, en orden de aparición."""
+    names = []
+    for spec in _registry.values():
+        names += [name for name in spec.heuristics if name not in names]
+    return names
+
+
+def strategy_names(adversarial=None) -> List[str]:
+    """
+    Nombres de las estrategias registradas, en orden de registro.
+
+    Args:
+        adversarial (bool, optional): Si se indica, solo las estrategias adversarias (True) o las de camino (False).
+
+    Returns:
+        list of str: Nombres de las estrategias.
+    """
+    return [name for name, spec in _registry.items() if adversarial is None or spec.adversarial == adversarial]
+
+
+def create_strategy(name, **options):
+    """Crea una instancia de la estrategia `name` con las opciones del modelo (ver `StrategySpec.create`)."""
+    return get_strategy(name).create(**options)
+
+
+# Estrategias incluidas, en el orden en que aparecen en la interfaz
+register_strategy("BFS", "SearchesArquitecture.UninformedSearches.bfs:bfs")
+register_strategy("DFS", "SearchesArquitecture.UninformedSearches.dfs:dfs")
+register_strategy("UCS", "SearchesArquitecture.UninformedSearches.ucs:ucs", params={"cost_model": "cost_model"})
+register_strategy(
+    "A*", "SearchesArquitecture.InformedSearches.astar:AStarSearch",
+    params={"heuristic": "heuristic", "cost_model": "cost_model"}, heuristics=HEURISTICS + ("Landmark",),
+)
+register_strategy(
+    "Beam Search", "SearchesArquitecture.InformedSearches.beamsearch:BeamSearch",
+    params={"beam_width": "beam_width", "heuristic": "heuristic"},
+)
+register_strategy(
+    "Hill Climbing", "SearchesArquitecture.InformedSearches.hillclimbing:HillClimbing",
+    params={"heuristic": "heuristic"},
+)
+register_strategy(
+    "Alpha-Beta", "SearchesArquitecture.InformedSearches.alphabeta:AlphaBetaSearch",
+    params={"time_budget_ms": "time_budget_ms"}, defaults={"max_depth": 3}, adversarial=True,
+)
+register_strategy("Bidirectional BFS", "SearchesArquitecture.UninformedSearches.bidirectionalbfs:BidirectionalBFS")
+register_strategy(
+    "Bidirectional A*", "SearchesArquitecture.InformedSearches.bidirectionalastar:BidirectionalAStar",
+    params={"heuristic": "heuristic"},
+)
+register_strategy("JPS", "SearchesArquitecture.InformedSearches.jps:JumpPointSearch", params={"heuristic": "heuristic"})
@@ -1,6 +1,21 @@
 from abc import ABC, abstractmethod
-from typing import List, Tuple
+import math
+from typing import Callable, Generator, List, Mapping, NamedTuple, Optional, Tuple
 from mesa import Agent
+from SearchesArquitecture.predecessorMap import PredecessorMap
+
+
+class SearchResult(NamedTuple):
+    """
+    Resultado de `SearchStrategy.solve`.
+
+    Atributos:
+        path (list): Camino desde el nodo inicial hasta la meta, ambos incluidos; vacío si no se encontró.
+        expanded_nodes (int): Número de nodos expandidos, contando la meta si se alcanzó.
+    """
+    path: List[Tuple[int, int]]
+    expanded_nodes: int
+
 
 class SearchStrategy(ABC):
     """
@@ -12,8 +27,23 @@ class SearchStrategy(ABC):
     Métodos:
         start_search: Inicializa el proceso de búsqueda desde una posición dada.
         explore_step: Realiza un paso en la búsqueda, devolviendo la siguiente posición a explorar.
+        prepare: Precalcula datos que dependen solo del terreno estático del mapa.
+        distance_function: Devuelve la distancia entre dos posiciones de una heurística por su nombre.
+        expand: Generador que ejecuta la búsqueda completa y entrega cada nodo expandido.
+        solve: Ejecuta la búsqueda completa de una vez y devuelve el camino encontrado.
+        reconstruct_path: Reconstruye un camino a partir del mapa de predecesores de la búsqueda.
+
+    `explore_step` avanza la búsqueda un nodo por paso de la simulación, marcando el orden de visita
+    en la cuadrícula para la interfaz. `expand` y `solve` ejecutan el algoritmo sin depender de la
+    simulación: no usan agentes ni `visit_order` ni modifican el estado de la estrategia, y reciben
+    la transitabilidad como una función. Las estrategias de caminos derivan de `GeneratorSearch`,
+    cuyo `explore_step` avanza el propio generador de `expand`, de modo que la búsqueda paso a paso
+    y `solve` expanden los mismos nodos y devuelven el mismo camino.
     """
 
+    # Orden de expansión de los vecinos: izquierda, arriba, derecha, abajo
+    DIRECTIONS = ((-1, 0), (0, 1), (1, 0), (0, -1))
+
     @abstractmethod
     def start_search(self, start: Tuple[int, int]) -> None:
         """
@@ -43,3 +73,196 @@ class SearchStrategy(ABC):
             NotImplementedError: Si no es implementado en la subclase.
         """
         pass
+
+    @staticmethod
+    def manhattan_distance(pos1: Tuple[int, int], pos2: Tuple[int, int]) -> int:
+        """Calcula la distancia de Manhattan entre dos posiciones."""
+        return abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1])
+
+    @staticmethod
+    def euclidean_distance(pos1: Tuple[int, int], pos2: Tuple[int, int]) -> float:
+        """Calcula la distancia Euclidiana entre dos posiciones."""
+        return math.sqrt((pos1[0] - pos2[0]) ** 2 + (pos1[1] - pos2[1]) ** 2)
+
+    def distance_function(self, heuristic: Optional[str] = None) -> Callable[[Tuple[int, int], Tuple[int, int]], float]:
+        """
+        Devuelve la distancia entre dos posiciones de una heurística de distancia.
+
+        Args:
+            heuristic (str, optional): 'Manhattan' o 'Euclidean'; por defecto, `self.heuristic`.
+
+        Returns:
+            Callable: Función `(pos1, pos2) -> distancia`.
+
+        Raises:
+            ValueError: Si la heurística no es de distancia.
+        """
+        heuristic = heuristic or self.heuristic
+        if heuristic == 'Manhattan':
+            return self.manhattan_distance
+        if heuristic == 'Euclidean':
+            return self.euclidean_distance
+        raise ValueError(f"Heurística no válida: {heuristic}. Use 'Manhattan' o 'Euclidean'.")
+
+    def prepare(self, grid) -> None:
+        """
+        Precalcula los datos de la estrategia que dependen solo del terreno estático del mapa.
+        `MazeModel` la llama una vez, con el terreno ya colocado y antes de la primera búsqueda.
+        Por defecto no hace nada.
+
+        Args:
+            grid (TerrainGrid): Cuadrícula del modelo.
+        """
+
+    def expand(self, start: Tuple[int, int], goal: Tuple[int, int],
+               walkable: Callable[[Tuple[int, int]], bool]) -> Generator[Tuple[int, int], None, List[Tuple[int, int]]]:
+        """
+        Ejecuta la búsqueda completa como un generador que entrega cada nodo en el momento en que
+        se expande (la meta incluida), de modo que quien lo consume decide el ritmo, por ejemplo
+        para dibujar la exploración. Al terminar, el valor de retorno del generador es el camino.
+
+        Args:
+            start (Tuple[int, int]): Nodo inicial.
+            goal (Tuple[int, int]): Nodo objetivo.
+            walkable (Callable): Indica si una posición es transitable (por ejemplo, `TerrainGrid.is_walkable`).
+
+        Yields:
+            Tuple[int, int]: Cada nodo expandido, en orden.
+
+        Returns:
+            List[Tuple[int, int]]: Camino desde `start` hasta `goal`, o una lista vacía si no se encontró.
+        """
+        raise NotImplementedError(f"{type(self).__name__} no implementa la búsqueda completa")
+
+    def solve(self, start: Tuple[int, int], goal: Tuple[int, int],
+              walkable: Callable[[Tuple[int, int]], bool], **options) -> SearchResult:
+        """
+        Ejecuta la búsqueda completa en un único bucle, sin esperar a los pasos de la simulación.
+
+        Args:
+            start (Tuple[int, int]): Nodo inicial.
+            goal (Tuple[int, int]): Nodo objetivo.
+            walkable (Callable): Indica si una posición es transitable.
+            **options: Parámetros adicionales de `expand`, como el costo de las celdas (`cost`) en UCS y A*.
+
+        Returns:
+            SearchResult: Camino encontrado y número de nodos expandidos.
+        """
+        expansions = self.expand(start, goal, walkable, **options)
+        expanded_nodes = 0
+        while True:
+            try:
+                next(expansions)
+            except StopIteration as stop:
+                return SearchResult(stop.value or [], expanded_nodes)
+            expanded_nodes += 1
+
+    @staticmethod
+    def reconstruct_path(came_from: Mapping[Tuple[int, int], Optional[Tuple[int, int]]], node: Tuple[int, int],
+                         include_start: bool = True) -> List[Tuple[int, int]]:
+        """
+        Reconstruye el camino hasta `node` siguiendo los predecesores. Las búsquedas solo guardan
+        el predecesor de cada nodo en lugar de una copia del camino por cada entrada de la frontera,
+        y el camino completo se construye una única vez al llegar a la meta.
+
+        Args:
+            came_from (dict or PredecessorMap): Predecesor de cada nodo alcanzado; el nodo inicial tiene predecesor None.
+            node (Tuple[int, int]): Nodo final del camino.
+            include_start (bool): Si es False, el nodo inicial no se incluye en el camino.
+
+        Returns:
+            List[Tuple[int, int]]: Camino desde el nodo inicial hasta `node`.
+        """
+        path = []
+        while node is not None:
+            path.append(node)
+            node = came_from[node]
+        if not include_start:
+            path.pop()
+        path.reverse()
+        return path
+
+
+class GeneratorSearch(SearchStrategy):
+    """
+    Base de las estrategias que solo implementan `expand`: la búsqueda paso a paso de la simulación
+    avanza el generador de `expand` un nodo por llamada a `explore_step`, marca su orden de visita
+    en la cuadrícula y, cuando el generador termina, entrega el camino a Bomberman.
+
+    Atributos:
+        start (tuple): Nodo inicial de la búsqueda en curso.
+        goal (tuple): Meta de la búsqueda en curso.
+        expansions (generator): Generador de `expand`, creado en la primera expansión.
+        step_count (int): Nodos expandidos, usado para marcar el orden de visita.
+        uses_predecessor_map (bool): Si es True, `expand` acepta el mapa de predecesores (`came_from`)
+            y la búsqueda paso a paso le pasa un `PredecessorMap` del tamaño de la cuadrícula, que
+            ocupa menos que un diccionario cuando la búsqueda alcanza gran parte del mapa.
+    """
+
+    uses_predecessor_map = False
+
+    def __init__(self):
+        self.start = None  # Nodo inicial
+        self.goal = None  # Meta
+        self.expansions = None  # Generador de la búsqueda en curso
+        self.step_count = 0  # Contador de pasos de expansión
+
+    def start_search(self, start: Tuple[int, int], goal: Tuple[int, int] = None) -> None:
+        """
+        Prepara la búsqueda desde `start` hasta `goal`; el generador se crea en la primera expansión,
+        cuando `explore_step` dispone de la cuadrícula del agente.
+
+        Args:
+            start (Tuple[int, int]): Nodo inicial.
+            goal (Tuple[int, int]): Meta (obligatoria: las búsquedas hacia atrás parten de ella).
+        """
+        self.start = start
+        self.goal = goal
+        self.expansions = None
+        self.step_count = 0
+
+    def expand_options(self, agent: Agent) -> dict:
+        """
+        Parámetros adicionales de `expand` en la búsqueda paso a paso: el mapa de predecesores si
+        la estrategia lo admite (`uses_predecessor_map`) y, en las subclases, otros como el costo de
+        las celdas (`cost`) en UCS y A*.
+
+        Args:
+            agent (Agent): Agente que ejecuta la búsqueda.
+
+        Returns:
+            dict: Argumentos con nombre de `expand`.
+        """
+        if self.uses_predecessor_map:
+            return {"came_from": PredecessorMap(agent.model.grid, self.start)}
+        return {}
+
+    def explore_step(self, agent: Agent, diagonal: bool = False) -> Optional[Tuple[int, int]]:
+        """
+        Expande el siguiente nodo de la búsqueda.
+
+        Args:
+            agent (Agent): Agente que ejecuta la búsqueda en el entorno.
+            diagonal (bool): No utilizado; las búsquedas completas solo usan 4 direcciones.
+
+        Returns:
+            Tuple[int, int] or None: Nodo expandido, o None si la búsqueda terminó.
+        """
+        if self.start is None:
+            return None
+        grid = agent.model.grid
+        if self.expansions is None:
+            self.expansions = self.expand(self.start, self.goal, grid.is_walkable, **self.expand_options(agent))
+        try:
+            current = next(self.expansions)
+        except StopIteration as stop:
+            self.start = None  # La búsqueda terminó; las llamadas siguientes no hacen nada
+            if stop.value:
+                agent.path_to_exit = stop.value
+                agent.has_explored = True
+            return None
+
+        # Marca el nodo expandido para la visualización en la interfaz
+        grid[current[0]][current[1]][0].visit_order = self.step_count
+        self.step_count += 1
+        return current
@@ -15,6 +15,7 @@ from AgentArquitecture.powerup import PowerupAgent
 from AgentArquitecture.explosion import ExplosionAgent
 
 from ModelArquitecture.model import MazeModel
+from SearchesArquitecture.registry import heuristic_names, strategy_names
 
 def agent_portrayal(agent):
     
@@ -110,14 +111,16 @@ def create_server(map):
         "search_strategy": Choice(
             "Recorridos",
             value="Alpha-Beta",
-            choices=["BFS", "DFS", "UCS", "A*", "Beam Search", "Hill Climbing", "Alpha-Beta"],  # Agrega "Alpha-Beta"
+            choices=strategy_names(),  # Estrategias del registro (`SearchesArquitecture.registry`)
         ),
         "distance_metric": Choice(
             "Métrica de Distancia",
             value="Manhattan",
-            choices=["Manhattan", "Euclidean"],
+            choices=heuristic_names(),  # Incluye 'Landmark', que solo admite A*
         ),
         "beta": Slider("Beta", value=2, min_value=1, max_value=2),
+        # Tiempo máximo por decisión de Alpha-Beta; 0 busca siempre a profundidad completa
+        "time_budget_ms": Slider("Tiempo por decisión (ms)", value=0, min_value=0, max_value=2000, step=50),
     }
 
 
@@ -0,0 +1,113 @@
+from Utils.terrain import METAL, ROCK
+
+# Direcciones de propagación de una explosión (izquierda, derecha, abajo, arriba)
+BLAST_DIRECTIONS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+
+def blast_rays(grid, position, power, cleared_cells=frozenset()):
+    """
+    Calcula las celdas que alcanza la explosión de una bomba en cada dirección, con las reglas
+    del terreno que comparten `BombAgent.explode` y la simulación de `GameState`: la explosión
+    no sale de la grilla, se detiene antes de un metal y se detiene en la primera roca, que
+    queda incluida porque resulta destruida. La celda de la bomba no forma parte de la explosión.
+
+    Los agentes dinámicos (Bomberman y globos) también detienen cada rayo, pero su posición
+    cambia con el tiempo, por lo que se comprueban al detonar y no aquí.
+
+    Args:
+        grid (TerrainGrid): Cuadrícula con el layer de ocupación.
+        position (tuple): Posición de la bomba.
+        power (int): Poder de destrucción (alcance en cada dirección).
+        cleared_cells (frozenset): Rocas que deben tratarse como ya destruidas.
+
+    Returns:
+        tuple: Un rayo por dirección de `BLAST_DIRECTIONS`, cada uno con sus celdas en orden de propagación.
+    """
+    width, height = grid.width, grid.height
+    rays = []
+    for dx, dy in BLAST_DIRECTIONS:
+        ray = []
+        for step in range(1, power + 1):
+            x, y = position[0] + dx * step, position[1] + dy * step
+            if not (0 <= x < width and 0 <= y < height):
+                break
+            cell_kind = grid.cells[x * height + y]
+            if cell_kind & METAL:
+                break
+            ray.append((x, y))
+            if cell_kind & ROCK and (x, y) not in cleared_cells:
+                break
+        rays.append(tuple(ray))
+    return tuple(rays)
+
+
+class DangerMap:
+    """
+    Índice de peligro de explosión: para cada celda alcanzada por alguna bomba guarda el tick
+    más temprano en el que detonará una bomba que la alcanza. Se actualiza al colocar o detonar
+    una bomba, de modo que consultar el riesgo de una celda es una búsqueda O(1).
+
+    Es inmutable: `with_bomb` y `without_bomb` devuelven un mapa nuevo, por lo que los estados
+    de búsqueda pueden compartirlo sin copiarlo.
+
+    Atributos:
+        cells (dict): Tick de detonación más temprano de cada celda en peligro.
+    """
+    __slots__ = ("cells",)
+
+    def __init__(self, cells=None):
+        self.cells = cells if cells is not None else {}
+
+    def __contains__(self, pos):
+        return pos in self.cells
+
+    def __len__(self):
+        return len(self.cells)
+
+    def detonation_tick(self, pos):
+        """Devuelve el tick de la primera explosión que alcanza `pos`, o None si la celda es segura."""
+        return self.cells.get(pos)
+
+    def with_bomb(self, blast_cells, tick):
+        """
+        Devuelve un mapa que incluye una nueva bomba.
+
+        Args:
+            blast_cells (Iterable): Celdas alcanzadas por la bomba.
+            tick (int): Tick en el que detona.
+
+        Returns:
+            DangerMap: Mapa actualizado.
+        """
+        cells = dict(self.cells)
+        for pos in blast_cells:
+            current = cells.get(pos)
+            if current is None or tick < current:
+                cells[pos] = tick
+        return DangerMap(cells)
+
+    def without_bomb(self, blast_cells, remaining):
+        """
+        Devuelve un mapa sin una bomba que ya detonó. Solo se recalculan sus celdas, a partir de
+        las bombas restantes que también las alcanzan.
+
+        Args:
+            blast_cells (Iterable): Celdas que alcanzaba la bomba detonada.
+            remaining (Iterable): Pares (celdas alcanzadas, tick de detonación) de las bombas restantes.
+
+        Returns:
+            DangerMap: Mapa actualizado.
+        """
+        remaining = list(remaining)
+        cells = dict(self.cells)
+        for pos in blast_cells:
+            ticks = [tick for other_cells, tick in remaining if pos in other_cells]
+            if ticks:
+                cells[pos] = min(ticks)
+            else:
+                cells.pop(pos, None)
+        return DangerMap(cells)
+
+
+# Mapa sin bombas, compartido por los estados que no tienen ninguna
+EMPTY_DANGER_MAP = DangerMap()
@@ -0,0 +1,201 @@
+"""
+Formato binario compilado de los mapas de `Data/Maps`. Uso:
+
+    python -m Utils.compiledMap Data/Maps/mapa1.txt --output mapa1.bmap
+
+Un mapa compilado es una cabecera de 16 bytes (`MAGIC`, versión, reservado, ancho y alto como
+enteros little-endian) seguida de `alto * ancho` códigos `uint8`, una fila tras otra y en el mismo
+orden que devuelve `load_map` (la fila 0 es la inferior). Los códigos se leen con `np.memmap`
+sin copiar el archivo a memoria.
+"""
+import argparse
+import hashlib
+import os
+import struct
+
+import numpy as np
+
+from Utils.logger import get_logger
+
+logger = get_logger("maps.compiled")
+
+# Identificador y versión del formato
+MAGIC = b"BMAP"
+VERSION = 1
+HEADER = struct.Struct("<4sHHII")  # magic, versión, reservado, ancho, alto
+
+# Código de cada tipo de celda del formato de texto. El 0 corresponde a celdas desconocidas,
+# que `MazeModel` ignora igual que en el formato de texto.
+UNKNOWN = 0
+CELL_CODES = {"C": 1, "M": 2, "R": 3, "C_b": 4, "R_s": 5, "C_g": 6}
+CELL_TOKENS = {code: token for token, code in CELL_CODES.items()}
+
+# Directorio de la caché de mapas compilados; por defecto, `.cache` junto al mapa de texto
+CACHE_DIR_ENV = "BOMBERMAN_MAP_CACHE"
+
+
+def encode_map(map):
+    """
+    Convierte un mapa en el formato de `load_map` a un arreglo de códigos de celda.
+
+    Args:
+        map (list of list of str): Mapa como lista de filas de strings.
+
+    Returns:
+        np.ndarray: Arreglo `uint8` de forma (alto, ancho) con los códigos de `CELL_CODES`. Las
+        filas más cortas que la más larga se completan con celdas desconocidas.
+    """
+    width = max((len(row) for row in map), default=0)
+    cells = np.zeros((len(map), width), dtype=np.uint8)
+    for y, row in enumerate(map):
+        cells[y, :len(row)] = [CELL_CODES.get(cell, UNKNOWN) for cell in row]
+    return cells
+
+
+def decode_map(cells):
+    """
+    Convierte un arreglo de códigos de celda al formato de `load_map`.
+
+    Args:
+        cells (np.ndarray): Arreglo de forma (alto, ancho) con los códigos de `CELL_CODES`.
+
+    Returns:
+        list of list of str: Mapa como lista de filas de strings ("" en las celdas desconocidas).
+    """
+    return [[CELL_TOKENS.get(code, "") for code in row] for row in cells.tolist()]
+
+
+def write_compiled_map(cells, path):
+    """
+    Escribe un arreglo de códigos de celda en el formato compilado. El archivo se escribe con un
+    nombre temporal y se renombra al final, de modo que un lector concurrente nunca ve un mapa a medias.
+
+    Args:
+        cells (np.ndarray): Arreglo de forma (alto, ancho) con los códigos de `CELL_CODES`.
+        path (str): Ruta del archivo de salida.
+    """
+    height, width = cells.shape
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+    with open(temporary_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, 0, width, height))
+        f.write(np.ascontiguousarray(cells, dtype=np.uint8).tobytes())
+    os.replace(temporary_path, path)
+
+
+def load_compiled_map(path, mmap=True):
+    """
+    Carga un mapa compilado.
+
+    Args:
+        path (str): Ruta del archivo compilado.
+        mmap (bool): Si es True, el arreglo es una vista de solo lectura del archivo (`np.memmap`);
+            si es False, se lee a memoria.
+
+    Returns:
+        np.ndarray: Arreglo `uint8` de forma (alto, ancho) con los códigos de `CELL_CODES`.
+
+    Raises:
+        ValueError: Si el archivo no tiene el formato o la versión esperados.
+    """
+    with open(path, "rb") as f:
+        header = f.read(HEADER.size)
+    if len(header) < HEADER.size:
+        raise ValueError(f"Mapa compilado truncado: {path}")
+    magic, version, _, width, height = HEADER.unpack(header)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"Formato de mapa compilado no reconocido: {path}")
+    if os.path.getsize(path) != HEADER.size + width * height:
+        raise ValueError(f"Mapa compilado truncado: {path}")
+    if width * height == 0:
+        return np.zeros((height, width), dtype=np.uint8)
+    if mmap:
+        return np.memmap(path, dtype=np.uint8, mode="r", offset=HEADER.size, shape=(height, width))
+    return np.fromfile(path, dtype=np.uint8, offset=HEADER.size).reshape(height, width)
+
+
+def compile_map(text_path, output_path):
+    """
+    Convierte un mapa de texto al formato compilado.
+
+    Args:
+        text_path (str): Ruta del mapa de texto.
+        output_path (str): Ruta del archivo compilado.
+
+    Returns:
+        np.ndarray: Arreglo de códigos de celda escrito.
+    """
+    from Utils.dinamicTools import load_map
+
+    cells = encode_map(load_map(text_path))
+    write_compiled_map(cells, output_path)
+    return cells
+
+
+def cached_map_path(text_path, cache_dir=None):
+    """
+    Calcula la ruta del mapa compilado en la caché. La clave es un hash del contenido del mapa
+    de texto, por lo que editarlo invalida la entrada anterior sin comparar fechas.
+
+    Args:
+        text_path (str): Ruta del mapa de texto.
+        cache_dir (str, optional): Directorio de la caché; por defecto, `BOMBERMAN_MAP_CACHE`
+            o `.cache` junto al mapa.
+
+    Returns:
+        str: Ruta del archivo compilado en la caché.
+    """
+    with open(text_path, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()[:16]
+    cache_dir = cache_dir or os.environ.get(CACHE_DIR_ENV) or os.path.join(os.path.dirname(os.path.abspath(text_path)), ".cache")
+    name = os.path.splitext(os.path.basename(text_path))[0]
+    return os.path.join(cache_dir, f"{name}-{digest}.bmap")
+
+
+def load_map_cached(text_path, cache_dir=None):
+    """
+    Carga un mapa de texto a través de la caché de mapas compilados: si ya existe una versión
+    compilada del mismo contenido se lee sin analizar el texto; si no, se compila y se guarda.
+    Si la caché no se puede escribir (copia de solo lectura o instalación compartida), el mapa
+    se analiza desde el texto sin guardarlo.
+
+    Args:
+        text_path (str): Ruta del mapa de texto.
+        cache_dir (str, optional): Directorio de la caché (ver `cached_map_path`).
+
+    Returns:
+        np.ndarray: Arreglo de forma (alto, ancho) con los códigos de `CELL_CODES`.
+    """
+    from Utils.dinamicTools import load_map
+
+    path = cached_map_path(text_path, cache_dir)
+    if os.path.exists(path):
+        try:
+            return load_compiled_map(path)
+        except ValueError:
+            pass  # Entrada corrupta o de otra versión del formato: se vuelve a compilar
+    cells = encode_map(load_map(text_path))
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        write_compiled_map(cells, path)
+    except OSError as e:
+        # Sin caché en disco el mapa se vuelve a analizar en la siguiente carga
+        logger.warning("No se pudo guardar el mapa compilado %s: %s", path, e)
+    return cells
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compila mapas de texto al formato binario.")
+    parser.add_argument("maps", nargs="+", help="Mapas de texto a compilar")
+    parser.add_argument("--output", help="Archivo de salida (solo con un mapa); por defecto, el mapa con extensión .bmap")
+    args = parser.parse_args(argv)
+
+    if args.output and len(args.maps) > 1:
+        parser.error("--output solo admite un mapa")
+    for text_path in args.maps:
+        output_path = args.output or os.path.splitext(text_path)[0] + ".bmap"
+        cells = compile_map(text_path, output_path)
+        print(f"{text_path} -> {output_path} ({cells.shape[1]}x{cells.shape[0]})")
+
+
+if __name__ == "__main__":
+    main()
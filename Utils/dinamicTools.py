@@ -1,6 +1,3 @@
-import tkinter as tk
-from tkinter import filedialog
-
 def load_map(file_path):
     """
     Carga un mapa desde un archivo y lo convierte en una estructura de lista de listas.
@@ -27,6 +24,10 @@ def get_map_path():
     Returns:
         str: La ruta del archivo seleccionado por el usuario, o None si se cancela.
     """
+    # Importa `tkinter` solo aquí para que la carga de mapas funcione en entornos sin pantalla
+    import tkinter as tk
+    from tkinter import filedialog
+
     # Inicializa la ventana de `tkinter` en modo oculto.
     root = tk.Tk()
     root.withdraw()
@@ -0,0 +1,249 @@
+"""
+Campos de distancia sobre el terreno real, compartidos por la evaluación de `GameState`, el orden
+de las jugadas de Alpha-Beta y los globos.
+
+Un campo guarda, para una celda de origen, el costo de ir desde cada celda hasta ella rodeando el
+metal, en lugar de la distancia Manhattan, que ignora los muros. Hay dos perfiles de movimiento:
+
+    - "bomberman": el metal bloquea y una roca cuesta, además del paso, la espera para destruirla
+      con una bomba del poder de Bomberman (`TickCost.rock_cost` de `SearchesArquitecture.costModel`,
+      el mismo costo que usan UCS y A* con el modelo "ticks").
+    - "globe": el metal y las rocas bloquean, porque los globos no pueden destruirlas.
+
+Los campos se calculan bajo demanda (Dijkstra hacia atrás desde el origen, o la BFS por frente de
+onda de `Utils.floodFill` en los perfiles de costo unitario de los mapas grandes) y se guardan en
+una caché LRU. Cuando una roca desaparece de la cuadrícula los costos solo bajan, y los campos en
+caché se corrigen propagando la mejora desde esa celda en lugar de recalcularse; si una celda
+pasa a ser más cara, los campos se descartan y se recalculan al pedirlos de nuevo.
+"""
+from array import array
+from collections import OrderedDict
+import heapq
+
+import numpy as np
+
+from SearchesArquitecture.costModel import TickCost
+from Utils.floodFill import UNREACHED, flood_fill
+from Utils.terrain import METAL, ROCK
+
+# Modelo de costo del que se toma el costo adicional de atravesar una roca
+ROCK_COST_MODEL = TickCost()
+
+# Perfiles de movimiento: (máscara de celdas bloqueadas, máscara de celdas con penalización)
+PROFILES = {
+    "bomberman": (METAL, ROCK),
+    "globe": (METAL | ROCK, 0),
+}
+
+# Distancia de las celdas desde las que no se alcanza el origen
+UNREACHABLE = 2 ** 31 - 1
+
+# Número de campos guardados por defecto
+DEFAULT_CAPACITY = 64
+
+# Tamaño de cuadrícula a partir del cual los campos de costo unitario se calculan con la BFS por
+# frente de onda de NumPy; en mapas más pequeños el Dijkstra en Python es más rápido
+WAVEFRONT_MIN_CELLS = 400
+
+
+class DistanceFieldCache:
+    """
+    Caché LRU de campos de distancia de una cuadrícula, actualizada con los cambios del layer de
+    ocupación (`TerrainGrid.changes_since`).
+
+    Atributos:
+        grid (TerrainGrid): Cuadrícula del modelo.
+        capacity (int): Número máximo de campos guardados.
+        fields (OrderedDict): Campos por (perfil, poder, origen), del menos al más usado recientemente.
+        costs (dict): Costo de entrar en cada celda por (perfil, poder), con `UNREACHABLE` para las
+            bloqueadas. El poder de destrucción solo cambia el costo de las rocas, así que en los
+            perfiles sin penalización se usa siempre 1.
+        hits (int): Consultas resueltas con un campo guardado.
+        misses (int): Campos calculados desde cero.
+        updates (int): Celdas cuyo abaratamiento se propagó a los campos guardados.
+    """
+
+    def __init__(self, grid, capacity=DEFAULT_CAPACITY):
+        """
+        Args:
+            grid (TerrainGrid): Cuadrícula del modelo.
+            capacity (int): Número máximo de campos guardados.
+        """
+        self.grid = grid
+        self.width = grid.width
+        self.height = grid.height
+        self.capacity = capacity
+        self.fields = OrderedDict()
+        self.costs = {}
+        self.cursor = grid.register_reader(self)  # Cambios de la cuadrícula ya incorporados
+        self.hits = 0
+        self.misses = 0
+        self.updates = 0
+
+    def _cell_cost(self, kind, profile, power):
+        """Costo de entrar en una celda con el código `kind` según el perfil y el poder de destrucción."""
+        blocking, slow = PROFILES[profile]
+        if kind & blocking:
+            return UNREACHABLE
+        return 1 + ROCK_COST_MODEL.rock_cost(power) if kind & slow else 1
+
+    def _layer_key(self, profile, power):
+        """Clave de la capa de costos de un perfil: el poder solo importa si el perfil penaliza rocas."""
+        return (profile, power if PROFILES[profile][1] else 1)
+
+    def _cost_layer(self, key):
+        """Costo de entrar en cada celda de la cuadrícula según el perfil y el poder, calculado una vez."""
+        costs = self.costs.get(key)
+        if costs is None:
+            profile, power = key
+            costs = array("i", (self._cell_cost(kind, profile, power) for kind in self.grid.cells))
+            self.costs[key] = costs
+        return costs
+
+    def _neighbors(self, index):
+        """Índices de las celdas vecinas en 4 direcciones dentro de la cuadrícula."""
+        height = self.height
+        y = index % height
+        if index >= height:
+            yield index - height
+        if index < (self.width - 1) * height:
+            yield index + height
+        if y > 0:
+            yield index - 1
+        if y < height - 1:
+            yield index + 1
+
+    def _propagate(self, field, costs, queue):
+        """
+        Dijkstra hacia atrás: desde cada celda `u` extraída, un vecino `n` puede llegar al origen
+        entrando en `u`, con costo `field[u] + costs[u]`.
+        """
+        while queue:
+            distance, index = heapq.heappop(queue)
+            if distance > field[index]:
+                continue
+            step = costs[index]
+            if step == UNREACHABLE:
+                continue  # Nadie puede entrar en una celda bloqueada
+            for neighbor in self._neighbors(index):
+                candidate = distance + step
+                if candidate < field[neighbor] and costs[neighbor] != UNREACHABLE:
+                    field[neighbor] = candidate
+                    heapq.heappush(queue, (candidate, neighbor))
+
+    def _compute(self, source, key):
+        """Calcula desde cero el campo de un origen con la capa de costos `key` (perfil, poder)."""
+        profile = key[0]
+        costs = self._cost_layer(key)
+        if not PROFILES[profile][1] and self.width * self.height >= WAVEFRONT_MIN_CELLS:
+            return self._compute_wavefront(source, costs)
+        index = source[0] * self.height + source[1]
+        field = array("i", [UNREACHABLE]) * (self.width * self.height)
+        field[index] = 0
+        if costs[index] == UNREACHABLE:
+            # El origen puede estar bloqueado para el perfil (Bomberman sobre una roca despejada
+            # en la simulación): se entra en él con un paso, pero no se lo atraviesa
+            queue = []
+            for neighbor in self._neighbors(index):
+                if costs[neighbor] != UNREACHABLE:
+                    field[neighbor] = 1
+                    queue.append((1, neighbor))
+        else:
+            queue = [(0, index)]
+        self._propagate(field, costs, queue)
+        return field
+
+    def _compute_wavefront(self, source, costs):
+        """
+        Calcula el campo de un perfil de costo unitario con `Utils.floodFill.flood_fill`. Como en
+        `_compute`, se entra en el origen con un paso aunque esté bloqueado para el perfil.
+        """
+        walkable = np.frombuffer(costs, dtype=np.int32).reshape(self.width, self.height) != UNREACHABLE
+        distance = flood_fill(walkable, source).distance
+        field = array("i")
+        field.frombytes(np.where(distance == UNREACHED, UNREACHABLE, distance).astype(np.int32).tobytes())
+        return field
+
+    def sync(self):
+        """
+        Incorpora los cambios de terreno de la cuadrícula desde la última consulta. Solo importan
+        las celdas cuyo costo cambió en algún perfil (en la práctica, rocas destruidas).
+        """
+        if self.cursor == self.grid.change_cursor():
+            return
+        changed, self.cursor = self.grid.changes_since(self.cursor, self)
+        for pos in set(changed):
+            index = pos[0] * self.height + pos[1]
+            kind = self.grid.cells[index]
+            for layer, costs in self.costs.items():
+                cost = self._cell_cost(kind, *layer)
+                previous = costs[index]
+                if cost == previous:
+                    continue
+                costs[index] = cost
+                if cost > previous:
+                    # Un encarecimiento puede alargar cualquier camino: los campos se recalcularán
+                    for key in [key for key in self.fields if key[:2] == layer]:
+                        del self.fields[key]
+                    continue
+                self.updates += 1
+                for (profile, power, source), field in self.fields.items():
+                    if (profile, power) == layer:
+                        self._relax_cell(field, costs, index, source[0] * self.height + source[1])
+
+    def _relax_cell(self, field, costs, index, source):
+        """Propaga a un campo guardado el abaratamiento de una celda."""
+        best = field[index]
+        for neighbor in self._neighbors(index):
+            if neighbor == source:
+                best = min(best, 1 if costs[source] == UNREACHABLE else costs[source])
+            elif field[neighbor] != UNREACHABLE and costs[neighbor] != UNREACHABLE:
+                best = min(best, field[neighbor] + costs[neighbor])
+        field[index] = best
+        if best != UNREACHABLE:
+            self._propagate(field, costs, [(best, index)])
+
+    def field(self, source, profile="bomberman", power=1):
+        """
+        Devuelve el campo de distancias hacia `source`, desde la caché o calculándolo.
+
+        Args:
+            source (tuple): Celda de origen.
+            profile (str): Perfil de movimiento ("bomberman" o "globe").
+            power (int): Poder de destrucción de Bomberman, que fija el costo de las rocas.
+
+        Returns:
+            array: Costo de ir desde cada celda (índice `x * height + y`) hasta `source`, o `UNREACHABLE`.
+        """
+        self.sync()
+        layer = self._layer_key(profile, power)
+        key = layer + (source,)
+        field = self.fields.get(key)
+        if field is not None:
+            self.fields.move_to_end(key)
+            self.hits += 1
+            return field
+        self.misses += 1
+        field = self._compute(source, layer)
+        self.fields[key] = field
+        if len(self.fields) > self.capacity:
+            self.fields.popitem(last=False)  # Descarta el campo usado hace más tiempo
+        return field
+
+    def distance(self, pos, target, profile="bomberman", power=1):
+        """
+        Costo de ir desde `pos` hasta `target` rodeando el terreno que bloquea al perfil.
+
+        Args:
+            pos (tuple): Posición de partida.
+            target (tuple): Posición de destino (origen del campo).
+            profile (str): Perfil de movimiento ("bomberman" o "globe").
+            power (int): Poder de destrucción de Bomberman, que fija el costo de las rocas.
+
+        Returns:
+            float: Costo del camino, o infinito si falta alguna posición o no hay camino.
+        """
+        if pos is None or target is None:
+            return float('inf')
+        distance = self.field(target, profile, power)[pos[0] * self.height + pos[1]]
+        return float('inf') if distance == UNREACHABLE else distance
@@ -0,0 +1,160 @@
+"""
+BFS por frente de onda con NumPy.
+
+En lugar de sacar los nodos de una cola uno a uno, cada anillo de la BFS se calcula de una vez
+con operaciones sobre arreglos: el anillo siguiente son las celdas transitables, aún no
+alcanzadas, vecinas del anillo actual, y se obtiene desplazando los índices de todo el anillo en
+cada una de las cuatro direcciones y filtrándolos con la máscara de celdas libres. El bucle en
+Python solo da una vuelta por anillo, de modo que en mapas de miles de celdas es mucho más rápido
+que la cola de `bfs` (ver `BenchmarkArquitecture.wavefront`).
+
+El resultado es el campo de distancias completo y, por cada celda, la dirección por la que se
+llegó a ella desde su predecesor, con la que se reconstruye el camino hasta cualquier celda.
+"""
+from typing import List, NamedTuple, Tuple
+
+import numpy as np
+
+from Utils.terrain import SEARCH_BLOCKING
+
+# Direcciones de avance, en el orden de prioridad de `SearchStrategy.DIRECTIONS`: izquierda,
+# arriba, derecha, abajo. Si una celda es vecina de varias del anillo anterior, su predecesor es
+# el de la primera dirección.
+DIRECTIONS = ((-1, 0), (0, 1), (1, 0), (0, -1))
+
+# Distancia de las celdas no alcanzadas y dirección del origen y de las celdas no alcanzadas
+UNREACHED = -1
+NO_DIRECTION = -1
+
+
+def walkable_mask(grid, blocking=SEARCH_BLOCKING):
+    """
+    Devuelve las celdas transitables de una cuadrícula según su layer de ocupación.
+
+    Args:
+        grid (TerrainGrid): Cuadrícula con el layer de ocupación.
+        blocking (int): Máscara de los códigos de celda que bloquean el paso
+            (por defecto, los mismos que `TerrainGrid.is_walkable`).
+
+    Returns:
+        np.ndarray: Arreglo booleano de forma (width, height).
+    """
+    return (grid.layer & blocking) == 0
+
+
+class FloodField(NamedTuple):
+    """
+    Resultado de `flood_fill`.
+
+    Atributos:
+        source (tuple): Celda de origen.
+        distance (np.ndarray): Distancia `int32` de forma (width, height) desde el origen, o `UNREACHED`.
+        direction (np.ndarray): Índice `int8` en `DIRECTIONS` del paso que llega a cada celda desde su
+            predecesor, o `NO_DIRECTION` en el origen y en las celdas no alcanzadas.
+    """
+    source: Tuple[int, int]
+    distance: np.ndarray
+    direction: np.ndarray
+
+    def reached(self, pos) -> bool:
+        """Indica si el frente de onda alcanzó la posición."""
+        return self.distance[pos] != UNREACHED
+
+    def path_to(self, target) -> List[Tuple[int, int]]:
+        """
+        Reconstruye el camino más corto desde el origen hasta `target` siguiendo las direcciones.
+
+        Args:
+            target (tuple): Celda de destino.
+
+        Returns:
+            list: Camino desde el origen hasta `target`, ambos incluidos, o una lista vacía si no se alcanzó.
+        """
+        if self.distance[target] == UNREACHED:
+            return []
+        path = [target]
+        x, y = target
+        direction = self.direction
+        while (x, y) != self.source:
+            dx, dy = DIRECTIONS[direction[x, y]]
+            x, y = x - dx, y - dy
+            path.append((x, y))
+        path.reverse()
+        return path
+
+
+def flood_fill(walkable, source, target=None, max_distance=None) -> FloodField:
+    """
+    Ejecuta la BFS en 4 direcciones desde `source` por anillos completos.
+
+    La cuadrícula se rodea de un borde de celdas bloqueadas y se aplana, de modo que los vecinos
+    de todo el anillo se obtienen sumando a sus índices el desplazamiento de cada dirección, sin
+    comprobar los límites. Los candidatos se ordenan por dirección antes de eliminar repetidos,
+    así que cada celda nueva toma como predecesor el de la primera dirección que la alcanza.
+
+    El origen se considera alcanzado aunque no sea transitable (Bomberman ocupa su propia celda),
+    pero no se vuelve a entrar en él.
+
+    Args:
+        walkable (np.ndarray): Arreglo booleano de forma (width, height) con las celdas transitables.
+        source (tuple): Celda de origen.
+        target (tuple, optional): Si se indica, la búsqueda se detiene al completar el anillo que lo alcanza.
+        max_distance (int, optional): Si se indica, no se calculan anillos más allá de esa distancia.
+
+    Returns:
+        FloodField: Distancias y direcciones de llegada de las celdas alcanzadas.
+    """
+    width, height = walkable.shape
+    padded_height = height + 2
+    size = (width + 2) * padded_height
+
+    open_cells = np.zeros(size, dtype=bool)  # Celdas transitables aún no alcanzadas
+    open_cells.reshape(width + 2, padded_height)[1:-1, 1:-1] = walkable
+    distance = np.full(size, UNREACHED, dtype=np.int32)
+    direction = np.full(size, NO_DIRECTION, dtype=np.int8)
+
+    origin = (source[0] + 1) * padded_height + source[1] + 1
+    goal = None if target is None else (target[0] + 1) * padded_height + target[1] + 1
+    open_cells[origin] = False
+    distance[origin] = 0
+    offsets = np.array([dx * padded_height + dy for dx, dy in DIRECTIONS], dtype=np.intp)[:, None]
+    codes = np.arange(len(DIRECTIONS), dtype=np.int8)
+
+    frontier = np.array([origin], dtype=np.intp)
+    ring = 0
+    while frontier.size and (max_distance is None or ring < max_distance):
+        ring += 1
+        # Vecinos de todo el anillo, agrupados por dirección en el orden de `DIRECTIONS`
+        candidates = (offsets + frontier).ravel()
+        candidate_codes = np.repeat(codes, frontier.size)
+        is_open = open_cells[candidates]
+        candidates, candidate_codes = candidates[is_open], candidate_codes[is_open]
+        # `np.unique` devuelve la primera aparición de cada celda, la de la dirección prioritaria
+        frontier, first = np.unique(candidates, return_index=True)
+        open_cells[frontier] = False
+        distance[frontier] = ring
+        direction[frontier] = candidate_codes[first]
+        if goal is not None and distance[goal] != UNREACHED:
+            break
+
+    def unpad(layer):
+        return layer.reshape(width + 2, padded_height)[1:-1, 1:-1].copy()
+
+    return FloodField(source, unpad(distance), unpad(direction))
+
+
+def grid_flood_fill(grid, source, target=None, blocking=SEARCH_BLOCKING, max_distance=None) -> FloodField:
+    """
+    Atajo de `flood_fill` sobre las celdas transitables de una cuadrícula (ver `walkable_mask`).
+
+    Args:
+        grid (TerrainGrid): Cuadrícula con el layer de ocupación.
+        source (tuple): Celda de origen.
+        target (tuple, optional): Celda en la que detener la búsqueda.
+        blocking (int): Máscara de los códigos de celda que bloquean el paso.
+        max_distance (int, optional): Distancia máxima calculada.
+
+    Returns:
+        FloodField: Distancias y direcciones de llegada de las celdas alcanzadas.
+    """
+    return flood_fill(walkable_mask(grid, blocking), source, target, max_distance)
@@ -0,0 +1,83 @@
+import contextlib
+import json
+import logging
+import sys
+
+# Logger raíz del proyecto; cada módulo usa un hijo (`bomberman.agent.bomb`, `bomberman.search.astar`, ...)
+ROOT_LOGGER = "bomberman"
+
+# Nivel por encima de CRITICAL: con él `isEnabledFor` descarta todos los mensajes sin formatearlos
+SILENT = logging.CRITICAL + 1
+
+# Atributos estándar de un `LogRecord`; el resto son campos estructurados pasados con `extra`
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+
+def get_logger(name):
+    """
+    Devuelve el logger de un componente dentro de la jerarquía del proyecto.
+
+    Los mensajes se emiten con argumentos diferidos (`logger.debug("... %s", path)`), de modo que
+    si el nivel está desactivado no se formatean: el coste es una comparación de nivel.
+
+    Args:
+        name (str): Nombre del componente, por ejemplo "agent.bomberman" o "search.astar".
+
+    Returns:
+        logging.Logger: Logger `bomberman.<name>`.
+    """
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formatea cada evento como una línea JSON con el logger, el nivel, el mensaje y los campos
+    estructurados del evento (`extra={"event": "bomb_placed", ...}`).
+    """
+
+    def format(self, record):
+        entry = {
+            "time": round(record.created, 6),
+            "logger": record.name,
+            "level": record.levelname,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES:
+                entry[key] = value
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+def configure_logging(level="INFO", stream=None, structured=False):
+    """
+    Configura la salida de los eventos del proyecto. Reemplaza la configuración anterior, por lo
+    que puede llamarse varias veces.
+
+    Args:
+        level (str or int): Nivel mínimo ("DEBUG", "INFO", "WARNING", ...) o None para silenciar todo.
+        stream: Flujo de salida; por defecto, la salida estándar.
+        structured (bool): Si es True, emite cada evento como una línea JSON.
+    """
+    logger = logging.getLogger(ROOT_LOGGER)
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+
+    handler = logging.StreamHandler(stream or sys.stdout)
+    handler.setFormatter(JsonFormatter() if structured else logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    logger.propagate = False
+    logger.setLevel(SILENT if level is None else level)
+
+
+@contextlib.contextmanager
+def silenced():
+    """
+    Desactiva todos los eventos del proyecto dentro del bloque y restaura el nivel anterior al salir.
+    """
+    logger = logging.getLogger(ROOT_LOGGER)
+    previous = logger.level
+    logger.setLevel(SILENT)
+    try:
+        yield
+    finally:
+        logger.setLevel(previous)
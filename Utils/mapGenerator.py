@@ -0,0 +1,130 @@
+"""
+Generador de mapas grandes y reproducibles para medir el escalado de las búsquedas. Uso:
+
+    python -m Utils.mapGenerator --width 1000 --height 1000 --seed 7 --output Data/Maps/grande.bmap
+
+Los mapas usan el vocabulario del formato de texto (`C`, `M`, `R`, `C_b`, `C_g`, `R_s`) y se
+generan como arreglos de códigos de `Utils.compiledMap`, que `MazeModel` acepta directamente.
+Con la misma semilla y los mismos parámetros se obtiene siempre el mismo mapa.
+"""
+import argparse
+
+import numpy as np
+
+from Utils.compiledMap import CELL_CODES, decode_map, write_compiled_map
+
+LAYOUTS = ("pillars", "scatter")
+
+
+def generate_map(width, height, seed=0, rock_ratio=0.3, metal_ratio=0.15, globes=None, layout="pillars"):
+    """
+    Genera un mapa con Bomberman en la esquina (0, 0) y la meta, oculta bajo una roca, en la
+    esquina opuesta.
+
+    La meta siempre es alcanzable: antes de colocar el metal se traza un corredor monótono
+    aleatorio entre ambas esquinas que no contiene metal (las rocas se pueden destruir y las
+    búsquedas las atraviesan). Las celdas a distancia 2 o menos de Bomberman quedan libres para
+    que pueda alejarse de su primera bomba, y los globos no aparecen en esa zona.
+
+    Args:
+        width (int): Ancho del mapa.
+        height (int): Alto del mapa.
+        seed (int): Semilla del generador.
+        rock_ratio (float): Proporción de celdas sin metal ocupadas por rocas.
+        metal_ratio (float): Proporción de celdas con metal en la disposición "scatter".
+        globes (int, optional): Número de globos; por defecto, uno por cada 10 celdas del lado menor.
+        layout (str): "pillars" para pilares de metal en las celdas de coordenadas impares, como en
+            los mapas clásicos, o "scatter" para metal repartido al azar según `metal_ratio`.
+
+    Returns:
+        np.ndarray: Arreglo `uint8` de forma (alto, ancho) con los códigos de `CELL_CODES`.
+
+    Raises:
+        ValueError: Si el tamaño o la disposición no son válidos.
+    """
+    if width < 2 or height < 2:
+        raise ValueError("El mapa debe tener al menos 2 celdas de lado")
+    if layout not in LAYOUTS:
+        raise ValueError(f"Disposición desconocida: {layout}")
+
+    rng = np.random.default_rng(seed)
+    cells = np.full((height, width), CELL_CODES["C"], dtype=np.uint8)
+
+    # Metal
+    if layout == "pillars":
+        cells[1::2, 1::2] = CELL_CODES["M"]
+    else:
+        cells[rng.random((height, width)) < metal_ratio] = CELL_CODES["M"]
+
+    # Corredor garantizado: una secuencia barajada de pasos a la derecha y hacia arriba
+    steps = np.zeros(width + height - 2, dtype=bool)
+    steps[width - 1:] = True  # True: paso hacia arriba
+    rng.shuffle(steps)
+    xs = np.concatenate(([0], np.cumsum(~steps)))
+    ys = np.concatenate(([0], np.cumsum(steps)))
+    corridor = cells[ys, xs]
+    corridor[corridor == CELL_CODES["M"]] = CELL_CODES["C"]
+    cells[ys, xs] = corridor
+
+    # Rocas sobre las celdas sin metal
+    rocks = (rng.random((height, width)) < rock_ratio) & (cells != CELL_CODES["M"])
+    cells[rocks] = CELL_CODES["R"]
+
+    # Zona libre alrededor de Bomberman
+    y_index, x_index = np.indices((height, width), sparse=True)
+    start_area = x_index + y_index <= 2
+    cells[start_area] = CELL_CODES["C"]
+
+    # Globos en caminos fuera de la zona inicial
+    if globes is None:
+        globes = max(1, min(width, height) // 10)
+    candidates = np.flatnonzero((cells == CELL_CODES["C"]) & (x_index + y_index > 4))
+    if len(candidates):
+        chosen = rng.choice(candidates, size=min(globes, len(candidates)), replace=False)
+        cells.flat[chosen] = CELL_CODES["C_g"]
+
+    cells[0, 0] = CELL_CODES["C_b"]
+    cells[height - 1, width - 1] = CELL_CODES["R_s"]
+    return cells
+
+
+def save_map(cells, path):
+    """
+    Guarda un mapa generado: en formato compilado si la ruta termina en `.bmap` y en el formato
+    de texto de `Data/Maps` en otro caso.
+
+    Args:
+        cells (np.ndarray): Arreglo de códigos de celda.
+        path (str): Ruta del archivo de salida.
+    """
+    if path.endswith(".bmap"):
+        write_compiled_map(cells, path)
+        return
+    # `load_map` invierte las filas al leer, por lo que se escriben de arriba abajo
+    with open(path, "w") as f:
+        f.write("\n".join(",".join(row) for row in reversed(decode_map(cells))))
+        f.write("\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Genera un mapa reproducible para benchmarks.")
+    parser.add_argument("--width", type=int, required=True, help="Ancho del mapa.")
+    parser.add_argument("--height", type=int, help="Alto del mapa; por defecto, igual al ancho.")
+    parser.add_argument("--seed", type=int, default=0, help="Semilla del generador.")
+    parser.add_argument("--rock-ratio", type=float, default=0.3, help="Proporción de rocas.")
+    parser.add_argument("--metal-ratio", type=float, default=0.15, help="Proporción de metal (disposición scatter).")
+    parser.add_argument("--globes", type=int, help="Número de globos.")
+    parser.add_argument("--layout", choices=LAYOUTS, default="pillars", help="Disposición del metal.")
+    parser.add_argument("--output", required=True, help="Archivo de salida (.txt o .bmap).")
+    args = parser.parse_args(argv)
+
+    cells = generate_map(
+        args.width, args.height or args.width, seed=args.seed, rock_ratio=args.rock_ratio,
+        metal_ratio=args.metal_ratio, globes=args.globes, layout=args.layout,
+    )
+    save_map(cells, args.output)
+    print(f"{args.output}: {cells.shape[1]}x{cells.shape[0]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+from mesa.time import RandomActivation
+
+
+class TypedActivation(RandomActivation):
+    """
+    Activación aleatoria que además mantiene un registro de los agentes del scheduler por tipo,
+    actualizado en cada `add` y `remove`. Permite obtener los globos, bombas, explosiones o
+    comodines sin recorrer todos los agentes con `isinstance`.
+
+    Atributos:
+        agents_by_type (dict): Agentes de cada clase, en orden de inserción (`{clase: {agente: None}}`).
+    """
+
+    def __init__(self, model, agents=None):
+        super().__init__(model, agents)
+        self.agents_by_type = {}
+        for agent in self._agents:
+            self._register(agent)
+
+    def _register(self, agent):
+        self.agents_by_type.setdefault(type(agent), {})[agent] = None
+
+    def add(self, agent):
+        super().add(agent)
+        self._register(agent)
+
+    def remove(self, agent):
+        super().remove(agent)
+        self.agents_by_type.get(type(agent), {}).pop(agent, None)
+
+    def of_type(self, agent_class):
+        """
+        Devuelve los agentes de una clase en orden de inserción.
+
+        Args:
+            agent_class (type): Clase exacta de los agentes.
+
+        Returns:
+            list: Copia de la lista de agentes, que puede recorrerse aunque se agreguen o eliminen agentes.
+        """
+        return list(self.agents_by_type.get(agent_class, ()))
+
+    def count(self, agent_class):
+        """Devuelve el número de agentes de una clase en el scheduler."""
+        return len(self.agents_by_type.get(agent_class, ()))
@@ -1,17 +1,61 @@
 from AgentArquitecture.globe import GlobeAgent
 from AgentArquitecture.bomb import BombAgent
-from AgentArquitecture.road import RoadAgent
-from AgentArquitecture.metal import MetalAgent
-from AgentArquitecture.rock import RockAgent
-from mesa.space import MultiGrid
+from Utils.terrain import BOMB, BOMBERMAN, GLOBE, METAL, ROCK
+from Utils.blast import blast_rays, EMPTY_DANGER_MAP
+from Utils.zobrist import zobrist_keys, BOMBERMAN_PIECE, GLOBE_PIECE, BOMB_PIECE, CLEARED_PIECE, GLOBE_CURSOR_PIECE
+from typing import NamedTuple, Tuple
+import numpy as np
+
+
+class SimulatedBomb(NamedTuple):
+    """
+    Bomba hipotética dentro del árbol de búsqueda. No crea agentes ni modifica el modelo:
+    replica el temporizador de `BombAgent` y las celdas que alcanzaría su explosión.
+
+    Atributos:
+        position (tuple): Posición de la bomba.
+        power (int): Poder de destrucción (alcance en cada dirección).
+        timer (int): Temporizador con la misma semántica que `BombAgent.timer`.
+        rays (tuple): Celdas alcanzadas en cada dirección, en orden de propagación.
+        blast_cells (frozenset): Unión de todas las celdas alcanzadas por la explosión.
+        detonation_tick (int): Valor de `GameState.clock` en el que la bomba detona.
+    """
+    position: Tuple[int, int]
+    power: int
+    timer: int
+    rays: Tuple[Tuple[Tuple[int, int], ...], ...]
+    blast_cells: frozenset
+    detonation_tick: int
 
 
 class GameState:
     """
     Clase que encapsula el estado del juego y proporciona métodos para evaluar
     posiciones, calcular riesgos y generar acciones para los agentes.
+
+    El estado se construye una sola vez a partir del `MazeModel` y guarda únicamente
+    tuplas de posiciones de las entidades dinámicas (Bomberman, globos y bombas), de modo
+    que `clone` copia referencias en O(número de entidades dinámicas) sin volver a recorrer la grilla.
+
+    El turno de los globos es una única jugada del jugador minimizador en la que los globos se
+    mueven uno tras otro: `globe_cursor` indica qué globo mueve a continuación, y el turno pasa a
+    Bomberman cuando se ha movido el último.
+
+    Las celdas en peligro se mantienen en un `DangerMap` (celda -> tick de la primera detonación
+    que la alcanza) que se actualiza al colocar o detonar una bomba, de modo que `bomb_risk` es O(1).
+
+    Las distancias de la evaluación y del orden de las jugadas se consultan en los campos de
+    distancia del modelo (`Utils.distanceField`), que rodean el metal y las rocas del terreno real;
+    sin ellos se usa la distancia Manhattan.
     """
 
+    __slots__ = (
+        "model", "grid", "width", "height", "goal_position", "is_bomberman_turn",
+        "bomberman_position", "bomberman_power", "globe_ids", "globe_positions", "bombs",
+        "cleared_cells", "visited_positions", "last_action", "globe_cursor", "zobrist",
+        "clock", "danger", "distances",
+    )
+
     def __init__(self, model, is_bomberman_turn=True):
         """
         Inicializa el estado del juego con información sobre la grilla y los agentes.
@@ -24,38 +68,82 @@ class GameState:
         self.grid = model.grid
         self.width = model.grid.width
         self.height = model.grid.height
-        self.bomberman_position = self._find_bomberman()
-        self.globes = self._find_globes()
-        self.bombs = self._find_bombs()
         self.goal_position = model.goal_position
         self.is_bomberman_turn = is_bomberman_turn
-        self.visited_positions = []  # Historial de posiciones recientes para evitar bucles
-
-    def _find_bomberman(self):
-        """Encuentra la posición de Bomberman en la grilla."""
+        self.visited_positions = ()  # Historial de posiciones recientes para evitar bucles
+        self.last_action = None
+        self.cleared_cells = frozenset()  # Rocas destruidas por bombas simuladas
+        self.globe_cursor = 0  # Índice del próximo globo que mueve dentro del turno de los globos
+        self.clock = 0  # Número de veces que han avanzado las bombas desde el estado raíz
+        self.danger = EMPTY_DANGER_MAP  # Celdas en peligro y tick de su primera detonación
+        self.distances = getattr(model, "distances", None)  # Campos de distancia compartidos del modelo
+        self._scan_dynamic_agents()
+        self.zobrist = self._compute_zobrist()
+
+    def _scan_dynamic_agents(self):
+        """
+        Localiza a Bomberman, los globos y las bombas consultando el layer de ocupación,
+        de modo que solo se visitan las celdas que contienen entidades dinámicas.
+        """
         from AgentArquitecture.bomberman import BombermanAgent
-        for content, pos in self.grid.coord_iter():
-            if any(isinstance(agent, BombermanAgent) for agent in content):
-                return pos
-        return None
-
-    def _find_globes(self):
-        """Encuentra las posiciones de todos los globos en la grilla."""
-        globes = []
-        for content, pos in self.grid.coord_iter():
-            for agent in content:
-                if isinstance(agent, GlobeAgent):
-                    globes.append({"agent": agent, "position": pos})
-        return globes
-
-    def _find_bombs(self):
-        """Encuentra las posiciones de todas las bombas activas en la grilla."""
-        bombs = []
-        for content, pos in self.grid.coord_iter():
-            for agent in content:
-                if isinstance(agent, BombAgent):
-                    bombs.append({"agent": agent, "position": pos})
-        return bombs
+        bomberman_position = None
+        bomberman_power = 1
+        globe_ids, globe_positions, bombs = [], [], []
+
+        for index in np.flatnonzero(self.grid.layer & (BOMBERMAN | GLOBE | BOMB)):
+            pos = divmod(int(index), self.height)
+            for agent in self.grid.get_cell_list_contents([pos]):
+                if isinstance(agent, BombermanAgent):
+                    bomberman_position = pos
+                    bomberman_power = agent.destruction_power
+                elif isinstance(agent, GlobeAgent):
+                    globe_ids.append(agent.unique_id)
+                    globe_positions.append(pos)
+                elif isinstance(agent, BombAgent):
+                    bomb = self._simulate_bomb(pos, agent.destruction_power, agent.timer)
+                    bombs.append(bomb)
+                    self.danger = self.danger.with_bomb(bomb.blast_cells, bomb.detonation_tick)
+
+        self.bomberman_position = bomberman_position
+        self.bomberman_power = bomberman_power
+        self.globe_ids = tuple(globe_ids)
+        self.globe_positions = tuple(globe_positions)
+        self.bombs = tuple(bombs)
+
+    def _compute_zobrist(self):
+        """
+        Calcula desde cero el hash de Zobrist de las entidades dinámicas del estado.
+        Los estados hijos lo actualizan incrementalmente en lugar de recalcularlo.
+        """
+        key = zobrist_keys.key(BOMBERMAN_PIECE, self.bomberman_position)
+        for globe_position in self.globe_positions:
+            key ^= zobrist_keys.key(GLOBE_PIECE, globe_position)
+        for bomb in self.bombs:
+            key ^= zobrist_keys.key(BOMB_PIECE, bomb.position, bomb.timer)
+        for pos in self.cleared_cells:
+            key ^= zobrist_keys.key(CLEARED_PIECE, pos)
+        if self.is_bomberman_turn:
+            key ^= zobrist_keys.side_to_move
+        return key ^ zobrist_keys.key(GLOBE_CURSOR_PIECE, (self.globe_cursor, 0))
+
+    def _simulate_bomb(self, position, power, timer):
+        """
+        Construye una bomba simulada calculando las celdas que alcanzaría su explosión con
+        `blast_rays`, el mismo cálculo que usa `BombAgent.explode`. Las rocas ya destruidas en
+        la simulación no detienen la explosión.
+
+        Args:
+            position (tuple): Posición de la bomba.
+            power (int): Poder de destrucción de la bomba.
+            timer (int): Temporizador inicial de la bomba.
+
+        Returns:
+            SimulatedBomb: Bomba simulada con sus rayos de explosión precalculados.
+        """
+        rays = blast_rays(self.grid, position, power, self.cleared_cells)
+        blast_cells = frozenset(pos for ray in rays for pos in ray)
+        # La bomba detona en el avance número `timer + 1` a partir de ahora
+        return SimulatedBomb(position, power, timer, rays, blast_cells, self.clock + timer + 1)
 
     def bomb_risk(self, pos):
         """
@@ -67,26 +155,33 @@ class GameState:
         Returns:
             bool: True si la posición está en peligro, False en caso contrario.
         """
-        for bomb in self.bombs:
-            bomb_pos = bomb["position"]
-            power = bomb["agent"].destruction_power
-            for direction in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                for step in range(1, power + 1):
-                    risk_pos = (bomb_pos[0] + direction[0] * step, bomb_pos[1] + direction[1] * step)
-                    if pos == risk_pos:
-                        return True
-        return False
+        return pos in self.danger
+
+    def ticks_to_blast(self, pos):
+        """
+        Devuelve cuántos avances de las bombas faltan para que una explosión alcance una posición.
+
+        Args:
+            pos (tuple): Coordenadas de la posición a evaluar.
+
+        Returns:
+            int or None: Avances restantes (1 si la detonación ocurre en el próximo avance), o None
+            si ninguna bomba alcanza la posición.
+        """
+        tick = self.danger.detonation_tick(pos)
+        return None if tick is None else tick - self.clock
 
     def is_valid_move(self, pos):
         """
         Verifica si una posición es válida para moverse (no contiene obstáculos).
+        Los metales y rocas se consultan en el layer de ocupación; las bombas y los globos
+        se toman del propio estado, de modo que reflejan los movimientos simulados.
         """
-        
-        if not (0 <= pos[0] < self.width and 0 <= pos[1] < self.height):
+        if not self.grid.is_free(pos, METAL | ROCK) and pos not in self.cleared_cells:
             return False
-        cell_contents = self.grid.get_cell_list_contents([pos])
-        return all(not isinstance(agent, (BombAgent, GlobeAgent, MetalAgent, RockAgent)) for agent in cell_contents)
-
+        if pos in self.globe_positions:
+            return False
+        return all(bomb.position != pos for bomb in self.bombs)
 
     def evaluate_position(self, pos, agent_type):
         """
@@ -100,11 +195,11 @@ class GameState:
             float: Puntuación de la posición.
         """
         if agent_type == "Bomberman":
-            distance_to_goal = self.manhattan_distance(pos, self.goal_position)
+            distance_to_goal = self.goal_distance(pos)
             risk = self.bomb_risk(pos)
             return -distance_to_goal - (100 if risk else 0)
         elif agent_type == "Globe":
-            distance_to_bomberman = self.manhattan_distance(pos, self.bomberman_position)
+            distance_to_bomberman = self.bomberman_distance(pos)
             risk = self.bomb_risk(pos)
             return distance_to_bomberman - (100 if risk else 0)
 
@@ -114,56 +209,150 @@ class GameState:
             return float('inf')  # Penalización alta si falta una posición
         return abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1])
 
+    def path_distance(self, pos, target, profile, power=1):
+        """
+        Distancia por el terreno real entre dos posiciones según un perfil de `Utils.distanceField`.
+        Si el modelo no tiene campos de distancia o el terreno separa ambas posiciones, se usa la
+        distancia Manhattan, de modo que la evaluación nunca recibe un valor infinito por el terreno.
+        """
+        if self.distances is None or pos is None or target is None:
+            return self.manhattan_distance(pos, target)
+        distance = self.distances.distance(pos, target, profile, power)
+        return self.manhattan_distance(pos, target) if distance == float('inf') else distance
+
+    def goal_distance(self, pos):
+        """Distancia de Bomberman hasta la salida: rodea el metal y cuenta la espera de sus bombas en las rocas."""
+        return self.path_distance(pos, self.goal_position, "bomberman", self.bomberman_power)
+
+    def bomberman_distance(self, pos):
+        """Distancia de un globo hasta Bomberman: rodea el metal y las rocas."""
+        return self.path_distance(pos, self.bomberman_position, "globe")
+
     def generate_moves(self, pos):
         """Genera las posiciones válidas desde una posición dada."""
         directions = [(-1, 0), (0, 1), (1, 0), (0, -1)]
         return [new_pos for dx, dy in directions if self.is_valid_move((new_pos := (pos[0] + dx, pos[1] + dy)))]
 
     def clone(self):
-        """Crea una copia del estado actual."""
-        clone_state = GameState(self.model, is_bomberman_turn=self.is_bomberman_turn)
+        """
+        Crea una copia del estado actual sin volver a recorrer la grilla. Las colecciones
+        son tuplas inmutables, por lo que la copia comparte referencias con el estado original.
+        """
+        clone_state = GameState.__new__(GameState)
+        clone_state.model = self.model
+        clone_state.grid = self.grid
+        clone_state.width = self.width
+        clone_state.height = self.height
+        clone_state.goal_position = self.goal_position
+        clone_state.is_bomberman_turn = self.is_bomberman_turn
         clone_state.bomberman_position = self.bomberman_position
-        clone_state.globes = [{"agent": globe["agent"], "position": globe["position"]} for globe in self.globes]
-        clone_state.bombs = [{"agent": bomb["agent"], "position": bomb["position"]} for bomb in self.bombs]
+        clone_state.bomberman_power = self.bomberman_power
+        clone_state.globe_ids = self.globe_ids
+        clone_state.globe_positions = self.globe_positions
+        clone_state.bombs = self.bombs
+        clone_state.cleared_cells = self.cleared_cells
+        clone_state.visited_positions = self.visited_positions
+        clone_state.last_action = self.last_action
+        clone_state.globe_cursor = self.globe_cursor
+        clone_state.zobrist = self.zobrist
+        clone_state.clock = self.clock
+        clone_state.danger = self.danger
+        clone_state.distances = self.distances
         return clone_state
 
+    def pass_turn(self):
+        """
+        Cede el turno: de Bomberman al primer globo, o de un globo al siguiente. Tras el último
+        globo el turno vuelve a Bomberman. El hash de Zobrist refleja el jugador y el globo que mueven.
+        """
+        self.zobrist ^= zobrist_keys.key(GLOBE_CURSOR_PIECE, (self.globe_cursor, 0))
+        if self.is_bomberman_turn:
+            self.is_bomberman_turn = False
+            self.globe_cursor = 0
+            self.zobrist ^= zobrist_keys.side_to_move
+        else:
+            self.globe_cursor += 1
+            if self.globe_cursor >= len(self.globe_positions):
+                self.globe_cursor = 0
+                self.is_bomberman_turn = True
+                self.zobrist ^= zobrist_keys.side_to_move
+        self.zobrist ^= zobrist_keys.key(GLOBE_CURSOR_PIECE, (self.globe_cursor, 0))
+
+    def move_bomberman(self, position):
+        """Mueve a Bomberman dentro del estado actualizando el hash de Zobrist."""
+        self.zobrist ^= zobrist_keys.key(BOMBERMAN_PIECE, self.bomberman_position) ^ zobrist_keys.key(BOMBERMAN_PIECE, position)
+        self.bomberman_position = position
+
+    def move_globe(self, index, position):
+        """Mueve el globo en el índice dado dentro del estado actualizando el hash de Zobrist."""
+        old_position = self.globe_positions[index]
+        self.zobrist ^= zobrist_keys.key(GLOBE_PIECE, old_position) ^ zobrist_keys.key(GLOBE_PIECE, position)
+        self.globe_positions = self.globe_positions[:index] + (position,) + self.globe_positions[index + 1:]
+
+    def remove_globe(self, index):
+        """Elimina el globo en el índice dado del estado actualizando el hash de Zobrist."""
+        self.zobrist ^= zobrist_keys.key(GLOBE_PIECE, self.globe_positions[index])
+        self.globe_positions = self.globe_positions[:index] + self.globe_positions[index + 1:]
+        self.globe_ids = self.globe_ids[:index] + self.globe_ids[index + 1:]
+
     def get_children(self):
+        """
+        Genera los estados sucesores del jugador al que le toca mover.
+
+        En el turno de Bomberman se generan sus movimientos y, si es útil, la colocación de una bomba;
+        después avanzan las bombas y el turno pasa a los globos. En el turno de los globos solo mueve
+        el globo indicado por `globe_cursor` (o se queda quieto si no tiene movimientos), de modo que
+        el árbol recorre los movimientos conjuntos de todos los globos globo a globo.
+
+        Returns:
+            list: Estados hijos con `last_action` indicando la acción que los produjo.
+        """
         children = []
         if self.is_bomberman_turn:
             # Generar movimientos válidos
             moves = self.generate_moves(self.bomberman_position)
             # Ordenar movimientos en función de su distancia a la salida
-            moves = sorted(moves, key=lambda pos: self.manhattan_distance(pos, self.goal_position))
+            moves = sorted(moves, key=self.goal_distance)
 
             for move in moves:
                 child_state = self.clone()
-                child_state.bomberman_position = move
+                child_state.move_bomberman(move)
                 child_state.last_action = move
-                child_state.visited_positions = self.visited_positions[-5:] + [move]
+                child_state.visited_positions = self.visited_positions[-5:] + (move,)
+                child_state.advance_bombs()
+                child_state.pass_turn()
                 children.append(child_state)
 
             # Solo permitir colocar bombas si es útil
             if self.can_place_bomb() and self.is_bomb_useful():
                 bomb_state = self.clone()
+                bomb_state.advance_bombs()
                 bomb_state.add_bomb(self.bomberman_position)
                 bomb_state.last_action = "place_bomb"
-                bomb_state.visited_positions = self.visited_positions[-5:] + [self.bomberman_position]
+                bomb_state.visited_positions = self.visited_positions[-5:] + (self.bomberman_position,)
+                bomb_state.pass_turn()
                 children.append(bomb_state)
+        elif self.globe_cursor < len(self.globe_positions):
+            index = self.globe_cursor
+            globe_position = self.globe_positions[index]
+            moves = self.generate_moves(globe_position)
+            # Ordenar movimientos en función de la distancia a Bomberman
+            moves = sorted(moves, key=self.bomberman_distance)
+
+            for move in moves or [globe_position]:
+                child_state = self.clone()
+                if move != globe_position:
+                    child_state.move_globe(index, move)
+                child_state.last_action = move
+                child_state.visited_positions = self.visited_positions[-5:] + (move,)
+                child_state.pass_turn()
+                children.append(child_state)
         else:
-            for globe in self.globes:
-                moves = self.generate_moves(globe["position"])
-                # Ordenar movimientos en función de la distancia a Bomberman
-                moves = sorted(moves, key=lambda pos: self.manhattan_distance(pos, self.bomberman_position))
-
-                for move in moves:
-                    child_state = self.clone()
-                    for child_globe in child_state.globes:
-                        if child_globe["agent"].unique_id == globe["agent"].unique_id:
-                            child_globe["position"] = move
-                            break
-                    child_state.last_action = move
-                    child_state.visited_positions = self.visited_positions[-5:] + [move]
-                    children.append(child_state)
+            # Sin globos que mover, el turno vuelve directamente a Bomberman
+            child_state = self.clone()
+            child_state.last_action = None
+            child_state.pass_turn()
+            children.append(child_state)
         return children
 
 
@@ -172,8 +361,8 @@ class GameState:
         Determina si colocar una bomba es útil para Bomberman.
         Retorna True si hay globos o obstáculos estratégicos cerca.
         """
-        for globe in self.globes:
-            distance = self.manhattan_distance(self.bomberman_position, globe["position"])
+        for globe_position in self.globe_positions:
+            distance = self.bomberman_distance(globe_position)
             if distance <= 2:  # Rango de destrucción de la bomba
                 return True
         return False
@@ -185,16 +374,66 @@ class GameState:
         Returns:
             bool: True si puede colocar una bomba, False en caso contrario.
         """
-        if self.bomberman_position in [bomb["position"] for bomb in self.bombs]:
-            return False
-        return True
+        # Bomberman solo puede tener una bomba activa, igual que en `BombermanAgent.place_bomb`
+        return not self.bombs
 
     def add_bomb(self, position):
-        """Agrega una bomba al estado actual y la registra correctamente en el modelo."""
-        bomb = BombAgent(self.model.next_id(), self.model, position, destruction_power=2)
-        self.model.grid.place_agent(bomb, position)
-        self.model.schedule.add(bomb)
-        self.bombs.append({"agent": bomb, "position": position})
+        """
+        Agrega una bomba simulada al estado actual. No crea ningún `BombAgent`: la bomba real
+        solo se coloca cuando la acción elegida se ejecuta en `BombermanAgent.place_bomb`.
+        """
+        bomb = self._simulate_bomb(position, self.bomberman_power, self.bomberman_power + 1)
+        self.bombs = self.bombs + (bomb,)
+        self.danger = self.danger.with_bomb(bomb.blast_cells, bomb.detonation_tick)
+        self.zobrist ^= zobrist_keys.key(BOMB_PIECE, bomb.position, bomb.timer)
+
+    def advance_bombs(self):
+        """
+        Avanza un paso el temporizador de las bombas simuladas, igual que `BombAgent.step`,
+        y detona las que ya llegaron a cero.
+        """
+        self.clock += 1
+        if not self.bombs:
+            return
+        remaining, detonated = [], []
+        for bomb in self.bombs:
+            self.zobrist ^= zobrist_keys.key(BOMB_PIECE, bomb.position, bomb.timer)
+            if bomb.timer > 0:
+                bomb = bomb._replace(timer=bomb.timer - 1)
+                self.zobrist ^= zobrist_keys.key(BOMB_PIECE, bomb.position, bomb.timer)
+                remaining.append(bomb)
+            else:
+                self._detonate(bomb)
+                detonated.append(bomb)
+        self.bombs = tuple(remaining)
+
+        # Solo las celdas de las bombas detonadas cambian en el mapa de peligro
+        for bomb in detonated:
+            self.danger = self.danger.without_bomb(
+                bomb.blast_cells, ((other.blast_cells, other.detonation_tick) for other in remaining)
+            )
+
+    def _detonate(self, bomb):
+        """
+        Aplica sobre el estado el efecto de una bomba simulada: cada rayo se detiene en el primer
+        globo o en Bomberman alcanzado, que quedan eliminados, y las rocas alcanzadas se despejan.
+        """
+        cleared = []
+        for ray in bomb.rays:
+            for pos in ray:
+                if pos == self.bomberman_position:
+                    self.move_bomberman(None)  # Bomberman muere en la explosión
+                    break
+                if pos in self.globe_positions:
+                    self.remove_globe(self.globe_positions.index(pos))
+                    break
+                if self.grid.has_kind(pos, ROCK):
+                    cleared.append(pos)
+        for pos in cleared:
+            if pos not in self.cleared_cells:
+                self.zobrist ^= zobrist_keys.key(CLEARED_PIECE, pos)
+        if cleared:
+            self.cleared_cells = self.cleared_cells.union(cleared)
 
     def is_terminal(self):
         """
@@ -203,21 +442,25 @@ class GameState:
         Returns:
             bool: True si el juego ha terminado, False en caso contrario.
         """
+        if self.bomberman_position is None:
+            return True
         if self.bomberman_position == self.goal_position:
             return True
-        if not self.generate_moves(self.bomberman_position) and not self.can_place_bomb():
+        if not self.can_place_bomb() and not self.generate_moves(self.bomberman_position):
             return True
-        if not self.globes:
+        if not self.globe_positions:
             return True
-        if any(globe["position"] == self.bomberman_position for globe in self.globes):
+        if self.bomberman_position in self.globe_positions:
             return True
         return False
 
     def evaluate(self, is_bomberman_turn):
+        if self.bomberman_position is None:
+            return -1000  # Bomberman murió por una explosión simulada
         if is_bomberman_turn:
-            distance_to_goal = self.manhattan_distance(self.bomberman_position, self.goal_position)
+            distance_to_goal = self.goal_distance(self.bomberman_position)
             distance_to_globes = min(
-                [self.manhattan_distance(self.bomberman_position, globe["position"]) for globe in self.globes],
+                [self.bomberman_distance(globe_position) for globe_position in self.globe_positions],
                 default=float('inf')
             )
             bomb_risk = self.bomb_risk(self.bomberman_position)
@@ -231,13 +474,13 @@ class GameState:
             return goal_proximity_reward + (10 / (distance_to_globes + 1)) - (100 if bomb_risk else 0) + repetition_penalty
         else:
             distance_to_bomberman = min(
-                [self.manhattan_distance(globe["position"], self.bomberman_position) for globe in self.globes],
+                [self.bomberman_distance(globe_position) for globe_position in self.globe_positions],
                 default=float('inf')
             )
             bomberman_risk = self.bomb_risk(self.bomberman_position)
 
             # Penalización por movimientos repetitivos
-            repetition_penalty = -20 if any(globe["position"] in self.visited_positions[-3:] for globe in self.globes) else 0
+            repetition_penalty = -20 if any(globe_position in self.visited_positions[-3:] for globe_position in self.globe_positions) else 0
 
             # Recompensa por cercar a Bomberman
             encirclement_reward = -distance_to_bomberman * 5
@@ -0,0 +1,187 @@
+import weakref
+
+import numpy as np
+from mesa.space import MultiGrid
+
+# Códigos de tipo de celda del layer de ocupación. Cada tipo de agente ocupa un bit,
+# de modo que una celda con varios agentes se representa con la unión (OR) de sus códigos.
+# Un camino (RoadAgent) sin nada encima se representa con 0.
+ROAD = 0
+GOAL = 1 << 0
+ROCK = 1 << 1
+METAL = 1 << 2
+GLOBE = 1 << 3
+BOMB = 1 << 4
+EXPLOSION = 1 << 5
+POWERUP = 1 << 6
+BOMBERMAN = 1 << 7
+
+# Celdas que las estrategias de búsqueda no expanden: solo se admiten caminos, meta, rocas y globos
+SEARCH_BLOCKING = METAL | BOMB | EXPLOSION | POWERUP | BOMBERMAN
+
+
+class TerrainGrid(MultiGrid):
+    """
+    Cuadrícula `MultiGrid` que mantiene, sincronizado con `place_agent`, `remove_agent`
+    y `move_agent`, un layer plano de un byte por celda con el tipo de los agentes que contiene.
+
+    Las consultas de transitabilidad se resuelven con un único acceso indexado al layer,
+    en lugar de recorrer los agentes de la celda con `isinstance`.
+
+    Cada cambio del código de una celda se anota en `changes`, de modo que los consumidores
+    incrementales (`DStarLite`, `DistanceFieldCache`) actualizan solo las celdas modificadas desde
+    su última consulta. Los consumidores se registran con `register_reader` y los cambios que ya
+    leyeron todos ellos se descartan. Los cursores son posiciones absolutas en la secuencia de
+    cambios (`change_cursor`), que siguen siendo válidas aunque se descarte el principio del registro.
+
+    Un consumidor que deja de consultar no retiene el registro indefinidamente: cuando los cambios
+    pendientes superan el número de celdas se descartan todos, y en su próxima consulta el
+    consumidor atrasado recibe todas las celdas, que no cuesta más que leer el registro completo.
+
+    Atributos:
+        cells (bytearray): Layer plano de códigos de celda, indexado por `x * height + y`.
+        layer (numpy.ndarray): Vista `uint8` de forma (width, height) que comparte memoria con `cells`.
+        changes (list): Índices planos de las celdas cuyo código cambió, en orden, desde `change_offset`.
+        change_offset (int): Posición absoluta del primer cambio de `changes`.
+        readers (WeakKeyDictionary): Cursor de cada consumidor registrado; un consumidor que deja de
+            usarse sale del registro al liberarse.
+    """
+
+    def __init__(self, width, height, torus):
+        super().__init__(width, height, torus)
+        self.cells = bytearray(width * height)
+        self.layer = np.frombuffer(self.cells, dtype=np.uint8).reshape(width, height)
+        self.changes = []
+        self.change_offset = 0
+        self.readers = weakref.WeakKeyDictionary()
+
+    def place_agent(self, agent, pos):
+        """Coloca el agente en la celda y actualiza su código en el layer."""
+        super().place_agent(agent, pos)
+        self._refresh_cell(pos)
+
+    def remove_agent(self, agent):
+        """Retira el agente de su celda y actualiza su código en el layer."""
+        pos = agent.pos
+        super().remove_agent(agent)
+        self._refresh_cell(pos)
+
+    def _refresh_cell(self, pos):
+        """Recalcula el código de una celda a partir de los agentes que contiene."""
+        x, y = pos
+        kind = 0
+        for agent in self._grid[x][y]:
+            kind |= getattr(agent, "cell_kind", ROAD)
+        index = x * self.height + y
+        if self.cells[index] != kind:
+            self.cells[index] = kind
+            if self.readers:  # Sin consumidores no hay nadie que vaya a leer el cambio
+                self.changes.append(index)
+                if len(self.changes) > len(self.cells):
+                    self.change_offset += len(self.changes)
+                    self.changes.clear()
+
+    def change_cursor(self):
+        """int: Cursor que apunta justo después del último cambio registrado."""
+        return self.change_offset + len(self.changes)
+
+    def register_reader(self, reader):
+        """
+        Registra un consumidor de cambios a partir del momento actual.
+
+        Args:
+            reader (object): Consumidor; se guarda una referencia débil.
+
+        Returns:
+            int: Cursor inicial del consumidor.
+        """
+        cursor = self.change_cursor()
+        self.readers[reader] = cursor
+        return cursor
+
+    def changes_since(self, cursor, reader=None):
+        """
+        Devuelve las celdas que cambiaron desde una consulta anterior, o todas las celdas si esos
+        cambios ya se descartaron. Si se indica el consumidor, se anota hasta dónde leyó y se
+        descartan los cambios que ya leyeron todos los consumidores.
+
+        Args:
+            cursor (int): Valor devuelto por la consulta anterior o por `register_reader`.
+            reader (object, optional): Consumidor registrado que hace la consulta.
+
+        Returns:
+            tuple: Lista de posiciones (x, y) modificadas, con repeticiones, y el cursor para la siguiente consulta.
+        """
+        if cursor < self.change_offset:
+            changed = [divmod(index, self.height) for index in range(len(self.cells))]
+        else:
+            changed = [divmod(index, self.height) for index in self.changes[cursor - self.change_offset:]]
+        cursor = self.change_cursor()
+        if reader is not None:
+            self.readers[reader] = cursor
+            self._discard_read_changes()
+        return changed, cursor
+
+    def _discard_read_changes(self):
+        """Descarta el principio del registro de cambios que ya leyeron todos los consumidores."""
+        oldest = min(self.readers.values(), default=self.change_cursor())
+        if oldest > self.change_offset:
+            del self.changes[:oldest - self.change_offset]
+            self.change_offset = oldest
+
+    def cell_kind(self, pos):
+        """
+        Devuelve el código de la celda en `pos`.
+
+        Args:
+            pos (tuple): Coordenadas (x, y) dentro de la cuadrícula.
+
+        Returns:
+            int: Unión de los códigos de los agentes presentes en la celda.
+        """
+        return self.cells[pos[0] * self.height + pos[1]]
+
+    def has_kind(self, pos, kinds):
+        """
+        Indica si la celda contiene algún agente de los tipos indicados.
+
+        Args:
+            pos (tuple): Coordenadas (x, y) dentro de la cuadrícula.
+            kinds (int): Máscara de códigos de celda a comprobar.
+
+        Returns:
+            bool: `True` si la celda contiene al menos uno de los tipos.
+        """
+        return bool(self.cells[pos[0] * self.height + pos[1]] & kinds)
+
+    def is_free(self, pos, blocking):
+        """
+        Indica si una posición está dentro de los límites y no contiene ninguno de los tipos bloqueantes.
+
+        Args:
+            pos (tuple): Coordenadas (x, y) a verificar.
+            blocking (int): Máscara de códigos de celda que impiden el paso.
+
+        Returns:
+            bool: `True` si la posición es válida y está libre de los tipos bloqueantes.
+        """
+        x, y = pos
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return False
+        return not self.cells[x * self.height + y] & blocking
+
+    def is_walkable(self, pos):
+        """
+        Indica si las estrategias de búsqueda pueden expandir la posición: dentro de los límites
+        y con únicamente caminos, meta, rocas o globos.
+
+        Args:
+            pos (tuple): Coordenadas (x, y) a verificar.
+
+        Returns:
+            bool: `True` si la celda es transitable para la búsqueda.
+        """
+        x, y = pos
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return False
+        return not self.cells[x * self.height + y] & SEARCH_BLOCKING
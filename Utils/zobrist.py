@@ -0,0 +1,55 @@
+import random
+
+# Tipos de pieza que participan en el hash de un estado de juego
+BOMBERMAN_PIECE = 0
+GLOBE_PIECE = 1
+BOMB_PIECE = 2
+CLEARED_PIECE = 3
+GLOBE_CURSOR_PIECE = 4
+
+
+class ZobristKeys:
+    """
+    Tabla de claves aleatorias de 64 bits para el hashing de Zobrist de un `GameState`.
+
+    Cada combinación (pieza, posición, dato extra) recibe una clave fija que se genera
+    bajo demanda, de modo que la tabla sirve para mapas de cualquier tamaño. El hash de un
+    estado es el XOR de las claves de sus piezas y se actualiza incrementalmente al mover,
+    agregar o eliminar una pieza.
+
+    Atributos:
+        side_to_move (int): Clave que se combina cuando le toca mover a Bomberman (jugador maximizador).
+    """
+
+    def __init__(self, seed=0):
+        """
+        Args:
+            seed (int): Semilla del generador, para obtener hashes reproducibles.
+        """
+        self._random = random.Random(seed)
+        self._keys = {}
+        self.side_to_move = self._random.getrandbits(64)
+
+    def key(self, piece, pos, extra=0):
+        """
+        Devuelve la clave de una pieza en una posición.
+
+        Args:
+            piece (int): Tipo de pieza (`BOMBERMAN_PIECE`, `GLOBE_PIECE`, ...).
+            pos (tuple): Posición (x, y) de la pieza. Si es None la pieza no aporta al hash.
+            extra (int): Dato adicional de la pieza, como el temporizador de una bomba.
+
+        Returns:
+            int: Clave de 64 bits.
+        """
+        if pos is None:
+            return 0
+        entry = (piece, pos[0], pos[1], extra)
+        value = self._keys.get(entry)
+        if value is None:
+            value = self._keys[entry] = self._random.getrandbits(64)
+        return value
+
+
+# Tabla compartida por todos los estados, para que los hashes sean comparables entre búsquedas
+zobrist_keys = ZobristKeys()
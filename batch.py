@@ -0,0 +1,6 @@
+from BatchArquitecture.runner import main
+
+if __name__ == "__main__":
+    # Ejecuta las simulaciones por lotes sin interfaz gráfica, por ejemplo:
+    # python batch.py --maps mapa1 mapa2 --strategies BFS "A*" --seeds 0 1 --output results.csv
+    main()
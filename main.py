@@ -1,8 +1,13 @@
+import os
 import sys
 from Utils.dinamicTools import load_map, get_map_path
 from ServerArquitecture.server import create_server
+from Utils.logger import configure_logging
 
 if __name__ == "__main__":
+    # Muestra los eventos de la simulación por consola; BOMBERMAN_LOG_LEVEL=DEBUG incluye la traza de las búsquedas
+    configure_logging(os.environ.get("BOMBERMAN_LOG_LEVEL", "INFO"))
+
     # Obtiene la ruta del archivo de mapa seleccionada por el usuario
     map_path = get_map_path()
     